@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+# 🧿 benchmarks/bench_assignment.py
+# Assignment time versus participant count for calmoji.assignment.
+#
+#   python benchmarks/bench_assignment.py [--sizes 100 1000 10000]
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calmoji.assignment import Participant, assign_participants, meeting_slot_options
+
+
+def make_participants(count: int, faces: list[int], seed: int = 48) -> list[Participant]:
+    rng = random.Random(seed)
+    return [
+        Participant(id=f"p{i:05d}", available_slots=frozenset(rng.sample(faces, rng.randint(1, 4))))
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark participant → slot assignment")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000, 10000])
+    parser.add_argument("--headroom", type=float, default=1.1, help="Total capacity / participants")
+    args = parser.parse_args()
+
+    slots = meeting_slot_options(include_oceania=True)
+    faces = sorted({slot.ebi48_slot for slot in slots})
+
+    print(f"{'participants':>12}  {'seconds':>8}  {'assigned':>8}  {'unassigned':>10}  {'max fill':>8}")
+    for size in args.sizes:
+        participants = make_participants(size, faces)
+        capacity = max(1, int(size * args.headroom / len(slots)) + 1)
+
+        started = time.perf_counter()
+        result = assign_participants(participants, capacity, slots=slots)
+        elapsed = time.perf_counter() - started
+
+        print(
+            f"{size:>12}  {elapsed:>8.3f}  {len(result.slot_of):>8}  "
+            f"{len(result.unassigned):>10}  {max(result.fill_ratios().values()):>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
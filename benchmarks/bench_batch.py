@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+# 🧿 benchmarks/bench_batch.py
+# 300 tenant calendars from a handful of distinct schedules through calmoji.batch.
+#
+#   python benchmarks/bench_batch.py [--tenants 300] [--variants 12] [--workers N]
+
+import argparse
+import json
+import random
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calmoji.batch import run_batch
+from calmoji.meeting_slots import MEETING_SLOTS
+from calmoji.spec import builtin_config
+
+START_DATES = ["09-01", "09-15", "10-01", "08-20"]
+
+
+def tenant_configs(count: int, variants: int, seed: int = 48) -> list[dict]:
+    """`count` tenant configs drawn from `variants` distinct (start date, city set) schedules."""
+    rng = random.Random(seed)
+    cities = sorted({slot[0] for slot in MEETING_SLOTS})
+    schedules = [
+        {**builtin_config(), "year_start": START_DATES[i % len(START_DATES)],
+         "disabled_cities": rng.sample(cities, rng.randint(1, 3))}
+        for i in range(variants)
+    ]
+    return [rng.choice(schedules) for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark multi-tenant batch generation")
+    parser.add_argument("--year", type=int, default=2025)
+    parser.add_argument("--tenants", type=int, default=300)
+    parser.add_argument("--variants", type=int, default=12)
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="calmoji_batch_"))
+    try:
+        config_dir = root / "tenants"
+        config_dir.mkdir()
+        for i, config in enumerate(tenant_configs(args.tenants, args.variants)):
+            (config_dir / f"tenant-{i:04d}.json").write_text(json.dumps(config), encoding="utf-8")
+        print(run_batch(config_dir, args.year, output_dir=root / "out", workers=args.workers, cache_dir=root / "cache"))
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+# 🧿 benchmarks/bench_ebi48_layer.py
+# Expanded EBI48 layer over N years from pre-encoded slot templates vs Event objects and to_ics.
+#
+#   python benchmarks/bench_ebi48_layer.py [--years 10] [--repeat 20]
+
+import argparse
+import datetime
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calmoji.ebi48_layer import iter_layer_bytes, iter_layer_events, layer_weeks
+from calmoji.exclusions import Exclusions, IntervalIndex, date_intervals
+
+
+def rate(label: str, instances: int, nbytes: int, elapsed: float) -> None:
+    print(f"{label:28s} {instances:,} instances in {elapsed:.3f} s → {instances / elapsed:,.0f}/s "
+          f"({nbytes / elapsed / 1e6:,.0f} MB/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the EBI48 layer engine")
+    parser.add_argument("--year", type=int, default=2025)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20, help="Passes over the range for the template engine")
+    args = parser.parse_args()
+
+    first, weeks = layer_weeks(datetime.date(args.year, 1, 1), datetime.date(args.year + args.years - 1, 12, 31))
+    holidays = [f"{args.year + y}-12-{d}" for y in range(args.years) for d in range(24, 32)]
+    exclusions = Exclusions(everywhere=IntervalIndex.from_intervals(date_intervals(holidays)))
+
+    for label, excl in (("templates", None), ("templates + holidays", exclusions)):
+        started = time.perf_counter()
+        instances = nbytes = 0
+        for _ in range(args.repeat):
+            for chunk, count in iter_layer_bytes(first, weeks, recurring=False, exclusions=excl):
+                instances += count
+                nbytes += len(chunk)
+        rate(label, instances, nbytes, time.perf_counter() - started)
+
+    # Baseline: the same range through Event objects and to_ics
+    started = time.perf_counter()
+    instances = nbytes = 0
+    for event in iter_layer_events(first, weeks, recurring=False):
+        nbytes += len(event.to_ics().encode("utf-8"))
+        instances += 1
+    rate("Event.to_ics", instances, nbytes, time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+# 🧿 benchmarks/bench_event_store.py
+# Write N academic years of events to a .calstore, then time open + date-range lookups.
+#
+#   python benchmarks/bench_event_store.py [--years 100] [--path /tmp/calmoji_100y.calstore]
+
+import argparse
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calmoji.calendar_phases import get_phases_for_years
+from calmoji.combined import iter_combined
+from calmoji.event_store import EventStore, write_event_store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the memory-mapped event store")
+    parser.add_argument("--year", type=int, default=2000)
+    parser.add_argument("--years", type=int, default=100)
+    parser.add_argument("--lookups", type=int, default=10_000)
+    parser.add_argument("--path", help="Store file (default: a temporary file, removed afterwards)")
+    args = parser.parse_args()
+
+    path = args.path or os.path.join(tempfile.mkdtemp(prefix="calmoji_store_"), "events.calstore")
+    if not os.path.exists(path):
+        started = time.perf_counter()
+        count = write_event_store(path, iter_combined(get_phases_for_years(args.year, args.years)))
+        print(f"wrote {count:,} records ({os.path.getsize(path) / 1e6:.1f} MB) in {time.perf_counter() - started:.1f} s")
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    store = EventStore(path)
+    opened = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"opened {len(store):,} records over {store.num_days:,} days in {opened * 1000:.2f} ms "
+          f"(peak Python allocation {peak / 1024:.1f} KiB)")
+
+    rng = random.Random(48)
+    first = datetime.date(1970, 1, 1) + datetime.timedelta(days=store.first_day)
+    found = 0
+    started = time.perf_counter()
+    for _ in range(args.lookups):
+        day = first + datetime.timedelta(days=rng.randrange(store.num_days))
+        found += sum(1 for _ in store.between(day, day + datetime.timedelta(days=6)))
+    elapsed = time.perf_counter() - started
+    print(f"{args.lookups:,} one-week lookups ({found:,} records decoded) in {elapsed * 1000:.1f} ms "
+          f"({elapsed / args.lookups * 1e6:.1f} µs each)")
+
+    store.close()
+    if not args.path:
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+# 🧿 benchmarks/bench_exclusions.py
+# 10k exclusions × multi-year meeting/focus generation through calmoji.exclusions.
+#
+#   python benchmarks/bench_exclusions.py [--years 3] [--exclusions 10000]
+
+import argparse
+import datetime
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calmoji.calendar_phases import get_semester_phases
+from calmoji.exclusions import Exclusions, IntervalIndex, city_holiday_intervals
+from calmoji.focus_blocks_writer import generate_focus_block_events
+from calmoji.slot_generator import generate_meeting_slots
+from calmoji.timezones import CITY_TIMEZONES, utc_timestamp
+from calmoji.utils import get_start_date_from_year
+
+
+def random_dates(rng: random.Random, first: datetime.date, span_days: int, count: int) -> list[str]:
+    return [(first + datetime.timedelta(days=rng.randrange(span_days))).isoformat() for _ in range(count)]
+
+
+def random_closures(rng: random.Random, first: datetime.date, span_days: int, count: int) -> list[tuple[int, int]]:
+    """Hour-long closures at random 5-minute boundaries."""
+    base = utc_timestamp(first)
+    closures = []
+    for _ in range(count):
+        start = base + rng.randrange(span_days * 288) * 300
+        closures.append((start, start + 3600))
+    return closures
+
+
+def generate(phases, exclusions):
+    meetings = sum(len(generate_meeting_slots(phase, exclusions=exclusions)) for phase in phases)
+    focus = len(generate_focus_block_events(phases, exclusions=exclusions))
+    return meetings, focus
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark exclusion-aware slot generation")
+    parser.add_argument("--year", type=int, default=2025)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--exclusions", type=int, default=10_000)
+    args = parser.parse_args()
+
+    phases = [
+        phase
+        for year in range(args.year, args.year + args.years)
+        for phase in get_semester_phases(get_start_date_from_year(year))
+    ]
+    first = phases[0].start.date()
+    span_days = (phases[-1].end.date() - first).days + 1
+
+    # 🚧 Mostly short closures, plus a dozen local holidays per city per year
+    rng = random.Random(48)
+    holidays_per_city = 12 * args.years
+    closures = args.exclusions - holidays_per_city * len(CITY_TIMEZONES)
+    started = time.perf_counter()
+    exclusions = Exclusions(
+        IntervalIndex.from_intervals(random_closures(rng, first, span_days, closures)),
+        {
+            city: IntervalIndex.from_intervals(
+                city_holiday_intervals(city, random_dates(rng, first, span_days, holidays_per_city))
+            )
+            for city in CITY_TIMEZONES
+        },
+    )
+    load = time.perf_counter() - started
+
+    started = time.perf_counter()
+    baseline = generate(phases, None)
+    plain = time.perf_counter() - started
+
+    started = time.perf_counter()
+    filtered = generate(phases, exclusions)
+    excluded = time.perf_counter() - started
+
+    print(f"{args.exclusions} exclusions → {len(exclusions)} merged intervals, indexed in {load * 1000:.1f} ms")
+    print(f"{args.years} years, {span_days} days: {baseline[0]} meetings + {baseline[1]} focus blocks")
+    print(f"  without exclusions: {plain * 1000:.1f} ms")
+    print(f"  with exclusions:    {excluded * 1000:.1f} ms → {filtered[0]} meetings + {filtered[1]} focus blocks kept")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+# 🧿 benchmarks/bench_exporters.py
+# Streaming NDJSON/CSV/jCal export of N academic years vs rendering the same events with Event.to_ics.
+#
+#   python benchmarks/bench_exporters.py [--years 10] [--formats ndjson csv jcal]
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calmoji.calendar_phases import get_phases_for_years
+from calmoji.combined import iter_combined
+from calmoji.exporters import EXPORT_FORMATS, EXTENSIONS, WRITERS, iter_records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the streaming record exporters")
+    parser.add_argument("--year", type=int, default=2000)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--formats", nargs="+", choices=EXPORT_FORMATS, default=list(EXPORT_FORMATS))
+    args = parser.parse_args()
+
+    phases = get_phases_for_years(args.year, args.years)
+
+    started = time.perf_counter()
+    records = sum(1 for _ in iter_records(phases))
+    generate = time.perf_counter() - started
+    print(f"records: {records:,} ({args.years} years) generated in {generate:.2f} s → {records / generate:,.0f}/s")
+
+    workdir = tempfile.mkdtemp(prefix="calmoji_export_")
+    try:
+        for fmt in args.formats:
+            path = os.path.join(workdir, f"calmoji.{EXTENSIONS[fmt]}")
+            started = time.perf_counter()
+            count = WRITERS[fmt](iter_records(phases), path)
+            elapsed = time.perf_counter() - started
+            print(f"{fmt:7s} {count:,} records in {elapsed:.2f} s → {count / elapsed:,.0f} records/s "
+                  f"({os.path.getsize(path) / 1e6:.1f} MB)")
+    finally:
+        for name in os.listdir(workdir):
+            os.remove(os.path.join(workdir, name))
+        os.rmdir(workdir)
+
+    # Baseline: one year of the same events through Event objects and to_ics
+    one_year = get_phases_for_years(args.year)
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        events = sum(len(event.to_ics()) > 0 for event in iter_combined(one_year, ebi48_years=()))
+    elapsed = time.perf_counter() - started
+    print(f"to_ics  {events:,} events (1 year) in {elapsed:.2f} s → {events / elapsed:,.0f} events/s")
+
+
+if __name__ == "__main__":
+    main()
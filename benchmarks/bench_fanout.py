@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+# 🧿 benchmarks/bench_fanout.py
+# 10k personalized subscriber calendars through calmoji.fanout.
+#
+#   python benchmarks/bench_fanout.py [--subscribers 10000] [--output /tmp/calmoji_fanout]
+
+import argparse
+import random
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calmoji.calendar_phases import get_phases_for_years
+from calmoji.fanout import KNOWN_CITIES, Subscriber, render_fanout
+
+ZONES = [None, None, None, "Europe/Brussels", "Asia/Tokyo", "America/Los_Angeles"]
+
+
+def random_subscribers(count: int, seed: int = 48) -> list[Subscriber]:
+    rng = random.Random(seed)
+    cities = sorted(KNOWN_CITIES)
+    return [
+        Subscriber(
+            id=f"subscriber-{i:06d}",
+            cities=frozenset(rng.sample(cities, rng.randint(1, 3))),
+            focus_blocks=rng.random() < 0.3,
+            ebi48=rng.random() < 0.2,
+            tzid=rng.choice(ZONES),
+        )
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark personalized calendar fan-out")
+    parser.add_argument("--year", type=int, default=2025)
+    parser.add_argument("--subscribers", type=int, default=10_000)
+    parser.add_argument("--output", help="Output root (default: a temporary directory, removed afterwards)")
+    args = parser.parse_args()
+
+    phases = get_phases_for_years(args.year)
+    subscribers = random_subscribers(args.subscribers)
+    output = Path(args.output) if args.output else Path(tempfile.mkdtemp(prefix="calmoji_fanout_"))
+
+    try:
+        print(render_fanout(subscribers, phases, output))
+    finally:
+        if not args.output:
+            shutil.rmtree(output, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+# 🧿 benchmarks/bench_recommender.py
+# Full academic year × 20 cities through calmoji.recommender.
+#
+#   python benchmarks/bench_recommender.py [--year 2025]
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calmoji.calendar_phases import get_semester_phases
+from calmoji.recommender import describe_slot, recommend_phase_slots
+from calmoji.utils import get_start_date_from_year
+
+ZONES = [
+    "Pacific/Auckland", "Asia/Tokyo", "Asia/Kolkata", "Asia/Riyadh", "Europe/Brussels",
+    "America/Havana", "America/Los_Angeles", "Europe/London", "America/New_York", "America/Sao_Paulo",
+    "Africa/Lagos", "Africa/Nairobi", "Asia/Shanghai", "Asia/Singapore", "Australia/Sydney",
+    "America/Mexico_City", "Europe/Moscow", "Asia/Dubai", "America/Chicago", "Asia/Jakarta",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the fair-time slot recommender")
+    parser.add_argument("--year", type=int, default=2025)
+    args = parser.parse_args()
+
+    phases = get_semester_phases(get_start_date_from_year(args.year))
+
+    started = time.perf_counter()
+    recommend_phase_slots(phases, ZONES)
+    cold = time.perf_counter() - started
+
+    started = time.perf_counter()
+    recs = recommend_phase_slots(phases, ZONES)
+    warm = time.perf_counter() - started
+
+    print(f"{len(ZONES)} zones × {len(phases)} phases: cold {cold * 1000:.1f} ms, warm {warm * 1000:.1f} ms")
+    for rec in recs:
+        print(f"  {rec.phase:<22} fairest shared: {', '.join(describe_slot(s) for s in rec.shared)}")
+
+
+if __name__ == "__main__":
+    main()
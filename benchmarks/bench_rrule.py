@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+# 🧿 benchmarks/bench_rrule.py
+# Windowed expansion of a 50-year weekly RRULE: lazy, vectorized, and stepping from DTSTART.
+#
+#   python benchmarks/bench_rrule.py [--years 50] [--window-days 31] [--repeat 10000]
+
+import argparse
+import datetime
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calmoji.rrule import Recurrence, RecurrenceRule
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RRULE expansion")
+    parser.add_argument("--years", type=int, default=50)
+    parser.add_argument("--window-days", type=int, default=31)
+    parser.add_argument("--repeat", type=int, default=10_000, help="Windows expanded per mode")
+    args = parser.parse_args()
+
+    dtstart = datetime.datetime(2000, 1, 3, 9, 5)
+    until = dtstart.replace(year=dtstart.year + args.years)
+    recurrence = Recurrence(dtstart, RecurrenceRule.parse(f"FREQ=WEEKLY;BYDAY=MO,WE,FR;UNTIL={until:%Y%m%dT%H%M%S}"))
+    window_start = until - datetime.timedelta(days=args.window_days + 30)  # Near the end: worst case for stepping
+    window_end = window_start + datetime.timedelta(days=args.window_days)
+
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        found = sum(1 for _ in recurrence.between(window_start, window_end))
+    elapsed = time.perf_counter() - started
+    print(f"between     {found} occurrences per window: {elapsed / args.repeat * 1e6:,.1f} µs/window")
+
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        found = len(recurrence.timestamps(window_start, window_end))
+    elapsed = time.perf_counter() - started
+    print(f"timestamps  {found} occurrences per window: {elapsed / args.repeat * 1e6:,.1f} µs/window")
+
+    started = time.perf_counter()
+    total = len(recurrence.timestamps())
+    elapsed = time.perf_counter() - started
+    print(f"timestamps  whole rule: {total:,} occurrences in {elapsed * 1e3:.2f} ms → {total / elapsed:,.0f}/s")
+
+    # Baseline: step every occurrence from DTSTART until the window ends
+    repeat = max(1, args.repeat // 100)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        found = sum(1 for day in recurrence.between() if window_start <= day < window_end)
+    elapsed = time.perf_counter() - started
+    print(f"stepping    {found} occurrences per window: {elapsed / repeat * 1e6:,.1f} µs/window")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+# 🧿 benchmarks/bench_sqlite_export.py
+# Bulk SQLite export of N academic years vs naive per-row autocommit inserts.
+#
+#   python benchmarks/bench_sqlite_export.py [--years 100] [--naive-rows 20000]
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from itertools import islice
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calmoji.calendar_phases import get_phases_for_years
+from calmoji.sqlite_export import SCHEMA, export_sqlite, iter_meeting_rows
+
+
+def naive_insert(path: str, rows) -> int:
+    """One INSERT and one commit per row, default pragmas: how it usually starts."""
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    count = 0
+    for row in rows:
+        conn.execute(
+            "INSERT INTO events (kind, start, end, city, phase, slot, glyph, face) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            row,
+        )
+        conn.commit()
+        count += 1
+    conn.close()
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the SQLite export")
+    parser.add_argument("--year", type=int, default=2000)
+    parser.add_argument("--years", type=int, default=100)
+    parser.add_argument("--naive-rows", type=int, default=20_000, help="Rows for the per-row baseline")
+    args = parser.parse_args()
+
+    phases = get_phases_for_years(args.year, args.years)
+    workdir = tempfile.mkdtemp(prefix="calmoji_sqlite_")
+    try:
+        bulk_path = os.path.join(workdir, "bulk.sqlite")
+        started = time.perf_counter()
+        counts = export_sqlite(bulk_path, phases)
+        bulk = time.perf_counter() - started
+        rows = sum(counts.values())
+        print(f"bulk:  {rows:,} rows ({args.years} years) in {bulk:.2f} s → {rows / bulk:,.0f} rows/s "
+              f"({os.path.getsize(bulk_path) / 1e6:.1f} MB)")
+
+        naive_path = os.path.join(workdir, "naive.sqlite")
+        started = time.perf_counter()
+        naive_rows = naive_insert(naive_path, islice(iter_meeting_rows(phases), args.naive_rows))
+        naive = time.perf_counter() - started
+        print(f"naive: {naive_rows:,} rows in {naive:.2f} s → {naive_rows / naive:,.0f} rows/s "
+              f"({(rows / bulk) / (naive_rows / naive):,.0f}× slower)")
+    finally:
+        for name in os.listdir(workdir):
+            os.remove(os.path.join(workdir, name))
+        os.rmdir(workdir)
+
+
+if __name__ == "__main__":
+    main()
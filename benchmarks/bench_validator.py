@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+# 🧿 benchmarks/bench_validator.py
+# Validate a multi-year output tree: combined calendars, per-phase meetings and an expanded EBI48 layer.
+#
+#   python benchmarks/bench_validator.py [--years 10] [--workers N]
+
+import argparse
+import datetime
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from calmoji.calendar_phases import get_phases_for_years
+from calmoji.combined import write_combined_ics
+from calmoji.ics_writer import write_ebi48_range, write_events_to_ics
+from calmoji.slot_generator import generate_meeting_slots
+from calmoji.utils import slugify
+from calmoji.validator import validate_paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the streaming .ics validator")
+    parser.add_argument("--year", type=int, default=2025)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="calmoji_validate_"))
+    try:
+        phases = get_phases_for_years(args.year, args.years)
+        write_combined_ics(str(root / "combined.ics"), phases)
+        for i, phase in enumerate(phases):
+            write_events_to_ics(generate_meeting_slots(phase), str(root / f"meeting_{i:02d}_{slugify(phase.name)}.ics"))
+        first = datetime.date(args.year, 1, 1)
+        write_ebi48_range(str(root / "ebi48.ics"), first, first.replace(year=args.year + args.years), recurring=False)
+        nbytes = sum(p.stat().st_size for p in root.iterdir())
+
+        started = time.perf_counter()
+        reports = validate_paths([root], workers=args.workers)
+        elapsed = time.perf_counter() - started
+        lines = sum(r.lines for r in reports)
+        issues = sum(sum(r.counts.values()) for r in reports)
+        print(f"{len(reports)} files, {nbytes / 1e6:.1f} MB, {lines:,} lines, {issues} issues in {elapsed:.2f} s "
+              f"→ {lines / elapsed:,.0f} lines/s ({nbytes / elapsed / 1e6:.1f} MB/s)")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+# 🧿 benchmarks/loadtest_server.py
+# Keep-alive load test for `calmoji.py serve`; reports throughput and p50/p99 latency.
+#
+#   python benchmarks/loadtest_server.py --spawn                 # start a server on a free port
+#   python benchmarks/loadtest_server.py --port 8048 -c 32 -n 200
+
+import argparse
+import asyncio
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PATHS = [
+    "/meetings?city=Tokyo&from=2025-01-06&to=2025-02-02",
+    "/meetings?city=Brussels,Delhi&from=2025-03-01&to=2025-03-31&tzid=Europe/Brussels",
+    "/meetings?from=2025-09-01&to=2025-09-30",
+    "/focus/2025-W03",
+    "/focus/2025-W40",
+    "/ebi48/2025",
+    "/ebi48/2026",
+]
+
+
+async def client(host: str, port: int, requests: int, gzip: bool, latencies: list[float], rng: random.Random):
+    reader, writer = await asyncio.open_connection(host, port)
+    accept = "Accept-Encoding: gzip\r\n" if gzip else ""
+    try:
+        for _ in range(requests):
+            path = rng.choice(PATHS)
+            started = time.perf_counter()
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n{accept}\r\n".encode())
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - started)
+    finally:
+        writer.close()
+
+
+async def run(host: str, port: int, concurrency: int, requests: int, gzip: bool) -> tuple[list[float], float]:
+    latencies: list[float] = []
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        client(host, port, requests, gzip, latencies, random.Random(i)) for i in range(concurrency)
+    ))
+    return latencies, time.perf_counter() - started
+
+
+def wait_for_port(host: str, port: int, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.2):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"Server did not come up on {host}:{port}")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the calmoji calendar server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8048)
+    parser.add_argument("--spawn", action="store_true", help="Start `calmoji.py serve` on a free port for the run")
+    parser.add_argument("-c", "--concurrency", type=int, default=16)
+    parser.add_argument("-n", "--requests", type=int, default=200, help="Requests per connection")
+    parser.add_argument("--gzip", action="store_true", help="Send Accept-Encoding: gzip")
+    args = parser.parse_args()
+
+    process = None
+    if args.spawn:
+        args.port = free_port()
+        process = subprocess.Popen(
+            [sys.executable, str(ROOT / "calmoji.py"), "serve", "--host", args.host, "--port", str(args.port)],
+            stdout=subprocess.DEVNULL,
+        )
+        wait_for_port(args.host, args.port)
+
+    try:
+        latencies, elapsed = asyncio.run(run(args.host, args.port, args.concurrency, args.requests, args.gzip))
+    finally:
+        if process:
+            process.terminate()
+            process.wait()
+
+    latencies.sort()
+    p50 = statistics.median(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{len(latencies)} requests over {args.concurrency} connections in {elapsed:.2f} s "
+          f"({len(latencies) / elapsed:,.0f} req/s)")
+    print(f"  p50 {p50 * 1000:.2f} ms   p99 {p99 * 1000:.2f} ms   max {latencies[-1] * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+# calmoji/__main__.py
+
+"""`python -m calmoji …` runs the command line (see calmoji.cli)."""
+
+import sys
+
+from calmoji.cli import main
+
+sys.exit(main())
@@ -0,0 +1,241 @@
+# calmoji/assignment.py
+
+"""
+Bulk participant → meeting slot assignment.
+
+Each entry in `MEETING_SLOTS` is a recurring city slot anchored to one EBI48
+face. Participants declare which EBI48 slots they can attend; every slot has a
+capacity. `assign_participants` produces a balanced assignment in two passes:
+
+  1. Greedy — most-constrained participants first, each into the feasible slot
+     with the lowest fill ratio that still has room.
+  2. Local search — place leftover participants by bumping a member of a full
+     slot into another slot they can attend, then move members out of the
+     fullest slots while that lowers the fill spread.
+
+`write_participant_calendars` turns the result into one .ics per participant,
+rendering each slot's events once and sharing them between its members.
+"""
+
+import datetime
+import os
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Sequence, Union
+
+from calmoji.config import OCEANIA_SLOTS_ENABLED
+from calmoji.ebi48 import get_emoji_for_time, get_slot_index_for_emoji
+from calmoji.ics_writer import create_ics_footer, create_ics_header
+from calmoji.meeting_slots import MEETING_SLOTS
+from calmoji.slot_generator import generate_meeting_slots
+from calmoji.types import Phase
+from calmoji.utils import slugify
+
+SlotKey = tuple[str, int]  # (city, EBI48 slot index)
+
+
+@dataclass(frozen=True)
+class SlotOption:
+    """One recurring city meeting slot from `MEETING_SLOTS`."""
+    city: str
+    ebi48_slot: int
+    start_hour: int
+    start_minute: int
+    local_label: str
+
+    @property
+    def key(self) -> SlotKey:
+        return (self.city, self.ebi48_slot)
+
+
+@dataclass
+class Participant:
+    """A collaborator and the EBI48 slot indices (0–47) they can attend."""
+    id: str
+    available_slots: frozenset[int]
+
+
+@dataclass
+class Assignment:
+    """Result of `assign_participants`."""
+    slots: list[SlotOption]
+    capacities: dict[SlotKey, int]
+    slot_of: dict[str, SlotKey] = field(default_factory=dict)
+    unassigned: list[str] = field(default_factory=list)
+
+    def members(self) -> dict[SlotKey, list[str]]:
+        """Map each slot key to the participant ids assigned to it."""
+        groups: dict[SlotKey, list[str]] = {slot.key: [] for slot in self.slots}
+        for pid, key in self.slot_of.items():
+            groups[key].append(pid)
+        return groups
+
+    def loads(self) -> dict[SlotKey, int]:
+        return {key: len(pids) for key, pids in self.members().items()}
+
+    def fill_ratios(self) -> dict[SlotKey, float]:
+        return {
+            key: load / self.capacities[key] if self.capacities[key] else 0.0
+            for key, load in self.loads().items()
+        }
+
+
+def meeting_slot_options(
+    slots: Sequence[tuple] = MEETING_SLOTS, include_oceania: bool = OCEANIA_SLOTS_ENABLED
+) -> list[SlotOption]:
+    """Build SlotOptions from `MEETING_SLOTS`, honouring the Oceania toggle like the slot generator."""
+    options = []
+    for city, sh, sm, _, _, local_label in slots:
+        if city == "Auckland" and not include_oceania:
+            continue
+        emoji, _ = get_emoji_for_time(datetime.datetime(2000, 1, 1, sh, sm))
+        options.append(SlotOption(city, get_slot_index_for_emoji(emoji), sh, sm, local_label))
+    return options
+
+
+def assign_participants(
+    participants: Iterable[Participant],
+    capacities: Union[int, dict[SlotKey, int]],
+    slots: Optional[list[SlotOption]] = None,
+    max_rounds: int = 20,
+) -> Assignment:
+    """
+    Assign participants to meeting slots subject to availability and capacity.
+
+    Args:
+        participants (Iterable[Participant]): Who to place.
+        capacities (int | dict): One capacity for every slot, or per slot key.
+        slots (list[SlotOption]): Candidate slots (default: `meeting_slot_options()`).
+        max_rounds (int): Upper bound on local-search passes.
+
+    Returns:
+        Assignment: participant → slot mapping plus anyone who could not be placed.
+    """
+    slots = slots if slots is not None else meeting_slot_options()
+    if isinstance(capacities, int):
+        caps = {slot.key: capacities for slot in slots}
+    else:
+        caps = {slot.key: capacities.get(slot.key, 0) for slot in slots}
+
+    # Index slots by EBI48 face so feasibility is a lookup per available slot
+    by_face: dict[int, list[SlotKey]] = {}
+    for slot in slots:
+        if caps[slot.key] <= 0:
+            continue
+        by_face.setdefault(slot.ebi48_slot, []).append(slot.key)
+
+    feasible: dict[str, list[SlotKey]] = {}
+    for p in participants:
+        feasible[p.id] = [key for face in sorted(p.available_slots) for key in by_face.get(face, ())]
+
+    load = {key: 0 for key in caps}
+    members: dict[SlotKey, set[str]] = {key: set() for key in caps}
+    slot_of: dict[str, SlotKey] = {}
+    unassigned: list[str] = []
+
+    def ratio(key: SlotKey, extra: int = 0) -> float:
+        return (load[key] + extra) / caps[key] if caps[key] else float("inf")
+
+    def place(pid: str, key: SlotKey) -> None:
+        slot_of[pid] = key
+        load[key] += 1
+        members[key].add(pid)
+
+    def remove(pid: str) -> SlotKey:
+        key = slot_of.pop(pid)
+        load[key] -= 1
+        members[key].discard(pid)
+        return key
+
+    # 🧮 1. Greedy: most constrained first, into the emptiest feasible slot
+    for pid in sorted(feasible, key=lambda pid: (len(feasible[pid]), pid)):
+        open_slots = [key for key in feasible[pid] if load[key] < caps[key]]
+        if open_slots:
+            place(pid, min(open_slots, key=ratio))
+        else:
+            unassigned.append(pid)
+
+    # 🔁 2. Local search
+    for _ in range(max_rounds):
+        improved = False
+
+        # Place leftovers by bumping a member of a full slot into a slot with room.
+        # Placements only ever fill slots, so a slot nobody could leave stays stuck this round.
+        still_unassigned = []
+        stuck: set[SlotKey] = set()
+        for pid in unassigned:
+            placed = False
+            if all(load[k] >= caps[k] for k in caps):
+                still_unassigned.append(pid)
+                continue
+            for key in feasible[pid]:
+                if key in stuck:
+                    continue
+                for other in sorted(members[key]):
+                    target = next(
+                        (k for k in feasible[other] if k != key and load[k] < caps[k]), None
+                    )
+                    if target is not None:
+                        remove(other)
+                        place(other, target)
+                        place(pid, key)
+                        placed = True
+                        break
+                if placed:
+                    break
+                stuck.add(key)
+            if placed:
+                improved = True
+            else:
+                still_unassigned.append(pid)
+        unassigned = still_unassigned
+
+        # Move members from the fullest slots to emptier feasible ones
+        for key in sorted(caps, key=ratio, reverse=True):
+            for pid in sorted(members[key]):
+                best = min(feasible[pid], key=lambda k: ratio(k, 0 if k == key else 1))
+                if best != key and ratio(best, 1) < ratio(key) and load[best] < caps[best]:
+                    remove(pid)
+                    place(pid, best)
+                    improved = True
+
+        if not improved:
+            break
+
+    return Assignment(slots=slots, capacities=caps, slot_of=slot_of, unassigned=sorted(unassigned))
+
+
+def write_participant_calendars(
+    assignment: Assignment, phases: list[Phase], output_dir: str = "output/participants"
+) -> list[str]:
+    """
+    Write one .ics per assigned participant containing their slot's meetings for every phase.
+
+    Each slot's VEVENT text is rendered once and reused for all of its members.
+
+    Returns:
+        list[str]: Paths written, one per assigned participant.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    wanted = set(assignment.slot_of.values())
+
+    rendered: dict[SlotKey, str] = {key: "" for key in wanted}
+    by_start = {(s.city, s.start_hour, s.start_minute): s.key for s in assignment.slots if s.key in wanted}
+    for phase in phases:
+        chunks: dict[SlotKey, list[str]] = {key: [] for key in wanted}
+        for event in generate_meeting_slots(phase):
+            key = by_start.get((event.city, event.start.hour, event.start.minute))
+            if key is not None:
+                chunks[key].append(event.to_ics())
+        for key, parts in chunks.items():
+            rendered[key] += "".join(parts)
+
+    written = []
+    for pid, key in sorted(assignment.slot_of.items()):
+        city, face = key
+        path = os.path.join(output_dir, f"participant_{slugify(pid)}.ics")
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(create_ics_header(calname=f"🧿 calmoji — {pid} ({city}, slot {face})"))
+            f.write(rendered[key])
+            f.write(create_ics_footer())
+        written.append(path)
+    return written
@@ -0,0 +1,239 @@
+# calmoji/availability.py
+
+"""
+EBI48 availability masks — one bit per EBI48 slot.
+
+A person's or room's day is a 48-bit integer: bit N is set when EBI48 slot N
+(see `EBI48_CLOCK`) is free. A longer span is an `AvailabilityCalendar`, which
+stores one mask per day in an `array('Q')`.
+
+Bulk algebra across many participants packs each calendar into a single
+Python int (64 bits per day), so intersecting thousands of calendars is one
+C-level `&` per participant instead of one per participant per day.
+"""
+
+import datetime
+import sys
+from array import array
+from functools import reduce
+from operator import and_, or_
+from typing import Iterable, Optional, Sequence, Union
+
+from calmoji.ebi48 import get_emoji_for_slot
+from calmoji.focus_blocks_config import FOCUS_BLOCKS
+from calmoji.meeting_slots import MEETING_SLOTS
+
+SLOTS_PER_DAY = 48
+FULL_DAY_MASK = (1 << SLOTS_PER_DAY) - 1
+EMPTY_MASK = 0
+
+# Slot N covers [N*30 + 5, N*30 + 30) minutes after 00:00 UTC
+SLOT_OFFSET_MINUTES = 5
+SLOT_LENGTH_MINUTES = 25
+
+DateLike = Union[datetime.date, datetime.datetime]
+
+
+# 🧮 Single-day masks
+
+def slot_mask(slots: Iterable[int]) -> int:
+    """Build a mask with the given EBI48 slot indices set."""
+    mask = 0
+    for slot in slots:
+        if not 0 <= slot < SLOTS_PER_DAY:
+            raise ValueError(f"EBI48 slot out of range: {slot}")
+        mask |= 1 << slot
+    return mask
+
+
+def mask_slots(mask: int) -> list[int]:
+    """Return the slot indices set in a mask, in ascending order."""
+    return [slot for slot in range(SLOTS_PER_DAY) if mask >> slot & 1]
+
+
+def mask_labels(mask: int) -> list[str]:
+    """Return glyph labels (e.g. '🦊 Fox Face') for every slot set in a mask."""
+    return [" ".join(get_emoji_for_slot(slot)) for slot in mask_slots(mask)]
+
+
+def popcount(mask: int) -> int:
+    """Return the number of slots set in a mask."""
+    return mask.bit_count()
+
+
+def slot_start_minute(slot: int) -> int:
+    """Minutes after 00:00 UTC at which an EBI48 slot starts."""
+    return slot * 30 + SLOT_OFFSET_MINUTES
+
+
+def interval_mask(start_minute: int, end_minute: int) -> int:
+    """
+    Return the mask of every EBI48 slot that overlaps [start_minute, end_minute).
+
+    Minutes are counted from 00:00 UTC; an interval that ends at or before a
+    slot starts, or starts at or after it ends, does not touch that slot.
+    """
+    mask = 0
+    for slot in range(SLOTS_PER_DAY):
+        slot_start = slot_start_minute(slot)
+        if slot_start < end_minute and start_minute < slot_start + SLOT_LENGTH_MINUTES:
+            mask |= 1 << slot
+    return mask
+
+
+def city_meeting_masks(slots: Sequence[tuple] = MEETING_SLOTS) -> dict[str, int]:
+    """Map each city in `MEETING_SLOTS` to the mask of EBI48 slots its meetings occupy."""
+    masks: dict[str, int] = {}
+    for city, sh, sm, eh, em, _ in slots:
+        masks[city] = masks.get(city, 0) | interval_mask(sh * 60 + sm, eh * 60 + em)
+    return masks
+
+
+def meeting_slots_mask(cities: Optional[Iterable[str]] = None) -> int:
+    """Return the union mask of meeting slots, optionally restricted to some cities."""
+    masks = city_meeting_masks()
+    wanted = masks.keys() if cities is None else cities
+    return reduce(or_, (masks[city] for city in wanted), 0)
+
+
+def focus_block_masks(blocks: Sequence[tuple] = FOCUS_BLOCKS) -> dict[int, int]:
+    """Map each focus block number to the mask of EBI48 slots it overlaps."""
+    return {
+        number: interval_mask(sh * 60 + sm, eh * 60 + em)
+        for number, sh, sm, eh, em, _ in blocks
+    }
+
+
+def focus_blocks_mask(numbers: Optional[Iterable[int]] = None) -> int:
+    """Return the union mask of focus blocks, optionally restricted to some block numbers."""
+    masks = focus_block_masks()
+    wanted = masks.keys() if numbers is None else numbers
+    return reduce(or_, (masks[number] for number in wanted), 0)
+
+
+# 📅 Multi-day calendars
+
+def _as_date(d: DateLike) -> datetime.date:
+    return d.date() if isinstance(d, datetime.datetime) else d
+
+
+class AvailabilityCalendar:
+    """
+    A run of consecutive days, one 48-bit availability mask per day.
+
+    Args:
+        start (date): First day covered.
+        days (array | Iterable[int]): One mask per day.
+    """
+
+    __slots__ = ("start", "days")
+
+    def __init__(self, start: DateLike, days: Union[array, Iterable[int]]) -> None:
+        self.start = _as_date(start)
+        self.days = days if isinstance(days, array) and days.typecode == "Q" else array("Q", days)
+
+    @classmethod
+    def empty(cls, start: DateLike, num_days: int) -> "AvailabilityCalendar":
+        return cls(start, array("Q", bytes(8 * num_days)))
+
+    @classmethod
+    def from_weekly(
+        cls, start: DateLike, num_days: int, weekday_masks: dict[int, int]
+    ) -> "AvailabilityCalendar":
+        """Repeat a weekday → mask pattern (0 = Monday) over `num_days` days."""
+        start = _as_date(start)
+        first = start.weekday()
+        week = [weekday_masks.get((first + i) % 7, 0) for i in range(7)]
+        full_weeks, rest = divmod(num_days, 7)
+        return cls(start, array("Q", week * full_weeks + week[:rest]))
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AvailabilityCalendar):
+            return NotImplemented
+        return self.start == other.start and self.days == other.days
+
+    def __repr__(self) -> str:
+        return f"AvailabilityCalendar(start={self.start}, days={len(self.days)})"
+
+    @property
+    def end(self) -> datetime.date:
+        """Last day covered (inclusive)."""
+        return self.start + datetime.timedelta(days=len(self.days) - 1)
+
+    def day_index(self, day: DateLike) -> int:
+        index = (_as_date(day) - self.start).days
+        if not 0 <= index < len(self.days):
+            raise IndexError(f"{day} is outside {self.start} → {self.end}")
+        return index
+
+    def mask_on(self, day: DateLike) -> int:
+        return self.days[self.day_index(day)]
+
+    def set_mask(self, day: DateLike, mask: int) -> None:
+        self.days[self.day_index(day)] = mask & FULL_DAY_MASK
+
+    def free_slots(self, day: DateLike) -> list[int]:
+        return mask_slots(self.mask_on(day))
+
+    def labels(self, day: DateLike) -> list[str]:
+        return mask_labels(self.mask_on(day))
+
+    def popcount(self) -> int:
+        """Total number of free slots across the whole calendar."""
+        return self.to_int().bit_count()
+
+    def to_int(self) -> int:
+        """Pack all days into one int, 64 bits per day, for bulk bit algebra."""
+        return int.from_bytes(self.days.tobytes(), sys.byteorder)
+
+    @classmethod
+    def from_int(cls, start: DateLike, num_days: int, packed: int) -> "AvailabilityCalendar":
+        days = array("Q")
+        days.frombytes(packed.to_bytes(8 * num_days, sys.byteorder))
+        return cls(start, days)
+
+    def _check_aligned(self, other: "AvailabilityCalendar") -> None:
+        if self.start != other.start or len(self.days) != len(other.days):
+            raise ValueError("Availability calendars must cover the same days")
+
+    def __and__(self, other: "AvailabilityCalendar") -> "AvailabilityCalendar":
+        return intersect_all([self, other])
+
+    def __or__(self, other: "AvailabilityCalendar") -> "AvailabilityCalendar":
+        return union_all([self, other])
+
+    def __invert__(self) -> "AvailabilityCalendar":
+        return AvailabilityCalendar(self.start, array("Q", (FULL_DAY_MASK & ~m for m in self.days)))
+
+
+def _combine(calendars: Sequence[AvailabilityCalendar], op) -> AvailabilityCalendar:
+    if not calendars:
+        raise ValueError("At least one availability calendar is required")
+    first = calendars[0]
+    for cal in calendars[1:]:
+        first._check_aligned(cal)
+    packed = reduce(op, (cal.to_int() for cal in calendars))
+    return AvailabilityCalendar.from_int(first.start, len(first), packed)
+
+
+def intersect_all(calendars: Sequence[AvailabilityCalendar]) -> AvailabilityCalendar:
+    """Return the slots free in every calendar."""
+    return _combine(calendars, and_)
+
+
+def union_all(calendars: Sequence[AvailabilityCalendar]) -> AvailabilityCalendar:
+    """Return the slots free in at least one calendar."""
+    return _combine(calendars, or_)
+
+
+def common_free_slots(calendars: Sequence[AvailabilityCalendar]) -> dict[datetime.date, list[int]]:
+    """Map each day with at least one shared free slot to the list of those slots."""
+    common = intersect_all(calendars)
+    return {
+        common.start + datetime.timedelta(days=i): mask_slots(mask)
+        for i, mask in enumerate(common.days)
+        if mask
+    }
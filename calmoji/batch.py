@@ -0,0 +1,254 @@
+# calmoji/batch.py
+
+"""
+Multi-tenant batch generation: one calendar per institution, in one process.
+
+Each tenant is a schedule config (see docs/schedule.example.toml) in a
+directory; its file stem is the tenant id:
+
+    report = run_batch("tenants/", first_year=2025, output_dir="output/tenants")
+
+Work is shared at every level where tenants agree:
+
+* Configs are compiled through `load_spec`, so identical files compile once
+  (and not at all on later runs), and equal specs are interned to one object.
+* A tenant's calendar is assembled from byte fragments: phase markers per
+  phase calendar, meeting slots per (phase, city plan), focus blocks per
+  (phase dates, focus plan), and the EBI48 layer per year. Each fragment is
+  rendered once per worker and reused by every tenant with the same
+  sub-config, so writing a tenant is mostly a `writelines` of cached bytes.
+* Tenants are grouped by academic calendar before being spread over the
+  worker pool, so tenants that can share fragments land in the same worker.
+
+Total time therefore grows with the number of distinct sub-configs, not
+with the number of tenants.
+"""
+
+import dataclasses
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from calmoji.calendar_phases import get_phases_for_years
+from calmoji.combined import calendar_years
+from calmoji.focus_blocks_writer import iter_focus_block_events
+from calmoji.ics_writer import create_ics_footer, create_ics_header, iter_ebi48_events, iter_semester_block_events
+from calmoji.slot_generator import iter_meeting_slots
+from calmoji.spec import DEFAULT_SPEC_CACHE, ScheduleSpec, load_spec
+from calmoji.types import Phase
+from calmoji.utils import slugify
+
+PathLike = Union[str, os.PathLike]
+
+CONFIG_SUFFIXES = (".toml", ".json")
+
+
+def _phase_key(phase: Phase) -> tuple:
+    return (phase.name, phase.emoji, phase.start, phase.end)
+
+
+class SharedFragments:
+    """Serialized event bytes, rendered once per distinct sub-config and shared across tenants."""
+
+    def __init__(self):
+        self._fragments: dict[tuple, bytes] = {}
+        self.rendered = 0
+        self.reused = 0
+
+    def _get(self, key: tuple, render) -> bytes:
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            fragment = self._fragments[key] = "".join(event.to_ics() for event in render()).encode("utf-8")
+            self.rendered += 1
+        else:
+            self.reused += 1
+        return fragment
+
+    def phase_markers(self, phases: list[Phase]) -> bytes:
+        return self._get(("phases", tuple(map(_phase_key, phases))), lambda: iter_semester_block_events(phases))
+
+    def meetings(self, phase: Phase, spec: ScheduleSpec, city: str) -> bytes:
+        # The city's own series plan is the sub-config: tenants sharing a city's slots and cadence share its fragment
+        plan = tuple(
+            tuple(tuple(tuple(t for t in day if t.city == city) for day in week) for week in active)
+            for active in spec.series_meetings
+        )
+        city_spec = dataclasses.replace(spec, series_meetings=plan)
+        key = ("meetings", _phase_key(phase), phase.start_offset, phase.allow_meetings, phase.meeting_density,
+               spec.series_interval_weeks, spec.series_count, plan)
+        return self._get(key, lambda: iter_meeting_slots(phase, spec=city_spec))
+
+    def focus_blocks(self, phase: Phase, spec: ScheduleSpec) -> bytes:
+        # Focus events do not carry the phase name, only its dates
+        key = ("focus", phase.start, phase.end, spec.focus_blocks, spec.focus_weekdays)
+        return self._get(key, lambda: iter_focus_block_events([phase], spec=spec))
+
+    def ebi48(self, year: int) -> bytes:
+        return self._get(("ebi48", year), lambda: iter_ebi48_events(year))
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+
+@dataclass
+class BatchReport:
+    """What a batch run produced."""
+    tenants: int = 0
+    distinct_specs: int = 0
+    fragments_rendered: int = 0
+    fragments_reused: int = 0
+    bytes_written: int = 0
+    workers: int = 1
+    seconds: float = 0.0
+    paths: list[Path] = field(default_factory=list)
+
+    def merge(self, other: "BatchReport") -> None:
+        self.tenants += other.tenants
+        self.fragments_rendered += other.fragments_rendered
+        self.fragments_reused += other.fragments_reused
+        self.bytes_written += other.bytes_written
+        self.paths.extend(other.paths)
+
+    def __str__(self) -> str:
+        return (
+            f"🏛️ {self.tenants} tenants ({self.distinct_specs} distinct schedules) on {self.workers} worker(s): "
+            f"{self.fragments_rendered} fragments rendered, {self.fragments_reused} reused, "
+            f"{self.bytes_written / 1e6:.1f} MB in {self.seconds:.2f} s"
+        )
+
+
+def find_tenant_configs(config_dir: PathLike) -> list[Path]:
+    """Tenant configs (.toml/.json) in a directory, sorted by name."""
+    paths = sorted(p for p in Path(config_dir).iterdir() if p.suffix.lower() in CONFIG_SUFFIXES and p.is_file())
+    if not paths:
+        raise ValueError(f"{config_dir}: no tenant configs ({', '.join(CONFIG_SUFFIXES)})")
+    return paths
+
+
+def tenant_path(output_dir: PathLike, tenant_id: str, first_year: int, years: int) -> Path:
+    """Return output_dir/<tenant>/calmoji_<first>[_<last>].ics."""
+    last_year = first_year + years - 1
+    span = f"{first_year}" if last_year == first_year else f"{first_year}_{last_year}"
+    return Path(output_dir, slugify(tenant_id) or "tenant", f"calmoji_{span}.ics")
+
+
+def render_tenants(
+    tenants: Iterable[tuple[str, ScheduleSpec]],
+    first_year: int,
+    years: int = 1,
+    output_dir: PathLike = "output/tenants",
+    ebi48: bool = True,
+) -> BatchReport:
+    """
+    Write each tenant's calendar from one shared fragment cache (what each worker runs).
+
+    Args:
+        tenants: (tenant id, compiled spec) pairs.
+        first_year: Start year of the first academic year.
+        years: Number of academic years per calendar.
+        output_dir: Root directory; each tenant gets its own subdirectory.
+        ebi48: Include the (recurring) EBI48 layer.
+
+    Returns:
+        BatchReport: Counts for this group of tenants.
+    """
+    fragments = SharedFragments()
+    phases_by_spec: dict[ScheduleSpec, list[Phase]] = {}
+    footer = create_ics_footer().encode("utf-8")
+    report = BatchReport()
+
+    for tenant_id, spec in tenants:
+        phases = phases_by_spec.get(spec)
+        if phases is None:
+            phases = phases_by_spec[spec] = get_phases_for_years(first_year, years, spec=spec)
+        cities = sorted({t.city for t in spec.meeting_slots})
+
+        parts = [create_ics_header(calname=f"🧿 calmoji for {tenant_id}").encode("utf-8")]
+        parts.append(fragments.phase_markers(phases))
+        for phase in phases:
+            parts.extend(fragments.meetings(phase, spec, city) for city in cities)
+            parts.append(fragments.focus_blocks(phase, spec))
+        if ebi48:
+            parts.extend(fragments.ebi48(year) for year in calendar_years(phases))
+        parts.append(footer)
+
+        path = tenant_path(output_dir, tenant_id, first_year, years)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            f.writelines(parts)
+
+        report.tenants += 1
+        report.bytes_written += sum(len(part) for part in parts)
+        report.paths.append(path)
+
+    report.fragments_rendered = fragments.rendered
+    report.fragments_reused = fragments.reused
+    return report
+
+
+def plan_workers(tenants: list[tuple[str, ScheduleSpec]], workers: int) -> list[list[tuple[str, ScheduleSpec]]]:
+    """
+    Split tenants into at most `workers` groups, keeping tenants with the same
+    academic calendar (start date and phase table) together so they share fragments.
+    """
+    by_calendar: dict[tuple, list[tuple[str, ScheduleSpec]]] = defaultdict(list)
+    for tenant in tenants:
+        spec = tenant[1]
+        by_calendar[(spec.start_month, spec.start_day, spec.phases)].append(tenant)
+
+    # Largest calendar groups first, each onto the least loaded worker
+    groups: list[list[tuple[str, ScheduleSpec]]] = [[] for _ in range(max(1, min(workers, len(by_calendar))))]
+    for members in sorted(by_calendar.values(), key=len, reverse=True):
+        min(groups, key=len).extend(members)
+    return groups
+
+
+def run_batch(
+    config_dir: PathLike,
+    first_year: int,
+    years: int = 1,
+    output_dir: PathLike = "output/tenants",
+    workers: Optional[int] = None,
+    ebi48: bool = True,
+    cache_dir: Optional[PathLike] = DEFAULT_SPEC_CACHE,
+) -> BatchReport:
+    """
+    Generate every tenant's calendar from a directory of schedule configs.
+
+    Args:
+        config_dir: Directory of tenant configs; the file stem is the tenant id.
+        first_year: Start year of the first academic year.
+        years: Number of academic years per calendar.
+        output_dir: Root directory for the tenants' calendars.
+        workers: Worker processes (default: CPU count); 1 renders in-process.
+        ebi48: Include the EBI48 layer in every calendar.
+        cache_dir: Where compiled specs are cached, or None to keep them in memory only.
+
+    Returns:
+        BatchReport: Totals across all workers.
+    """
+    started = time.perf_counter()
+    interned: dict[ScheduleSpec, ScheduleSpec] = {}
+    tenants = []
+    for path in find_tenant_configs(config_dir):
+        spec = load_spec(path, cache_dir)
+        # Specs that compile equal from different bytes share one object (and so one phase list per worker)
+        spec = interned.setdefault(dataclasses.replace(spec, digest=""), spec)
+        tenants.append((path.stem, spec))
+
+    groups = plan_workers(tenants, workers or os.cpu_count() or 1)
+    report = BatchReport(distinct_specs=len(interned), workers=len(groups))
+    if len(groups) == 1:
+        report.merge(render_tenants(groups[0], first_year, years, output_dir, ebi48))
+    else:
+        with ProcessPoolExecutor(max_workers=len(groups)) as pool:
+            futures = [pool.submit(render_tenants, group, first_year, years, output_dir, ebi48) for group in groups]
+            for future in futures:
+                report.merge(future.result())
+
+    report.seconds = time.perf_counter() - started
+    return report
@@ -1,49 +1,42 @@
 # calmoji/calendar_phases.py
 
 import datetime
-from typing import List, Tuple
-from calmoji.config import SEMESTER_PHASES
+from typing import Optional
+from calmoji.phase_catalog import copy_phases
+from calmoji.spec import ScheduleSpec, default_spec
 from calmoji.types import Phase
-from calmoji.types import Phase
-from calmoji.config import SEMESTER_PHASES
+from calmoji.utils import get_start_date_from_year
 
-def get_semester_phases(start_date: datetime.datetime) -> list[Phase]:
+def get_semester_phases(start_date: datetime.datetime, spec: Optional[ScheduleSpec] = None) -> list[Phase]:
     """
     Returns a list of enriched Phase objects starting from the provided academic year start date.
     Each phase includes concrete start/end datetimes and symbolic meeting density metadata.
+
+    The phase table comes from `spec` (default: config.SEMESTER_PHASES); densities
+    not set explicitly are auto-tagged by `spec.classify_phase`. Phases are built
+    once per (start date, phase table) by the phase catalog; the caller gets copies.
     """
-    enriched = []
+    return copy_phases(start_date, spec or default_spec())
 
-    for phase in SEMESTER_PHASES:
-        start = start_date + datetime.timedelta(days=phase.start_offset)
-        end = start_date + datetime.timedelta(days=phase.end_offset)
 
-        # Apply heuristic enrichment rules
-        if any(kw in phase.name for kw in ["Break", "Rest", "Drift"]):
-            allow = False
-            density = "none"
-        elif any(kw in phase.name for kw in ["Downtime", "Prep"]):
-            allow = True
-            density = "low"
-        elif "Deep Work" in phase.name:
-            allow = True
-            density = "high"
-        else:
-            allow = True
-            density = "normal"
+def get_phases_for_years(first_year: int, years: int = 1, spec: Optional[ScheduleSpec] = None) -> list[Phase]:
+    """
+    Return the phases of `years` consecutive academic years, in order.
 
-        enriched.append(
-            Phase(
-                name=phase.name,
-                start_offset=phase.start_offset,
-                end_offset=phase.end_offset,
-                emoji=phase.emoji,
-                start=start,
-                end=end,
-                allow_meetings=allow,
-                meeting_density=density,
-                note=f"Auto-tagged density: {density}",
-            )
-        )
+    Each year's closing phase ends on the day the next year starts, so it is
+    trimmed by a day to keep the phases disjoint.
 
-    return enriched
+    Args:
+        first_year (int): Start year of the first academic year (e.g. 2024 for 2024–25).
+        years (int): Number of academic years.
+        spec (ScheduleSpec): Schedule to follow (defaults to the built-in one).
+    """
+    spec = spec or default_spec()
+    phases: list[Phase] = []
+    for year in range(first_year, first_year + years):
+        start_date = get_start_date_from_year(year, spec.start_month, spec.start_day)
+        year_phases = get_semester_phases(start_date, spec=spec)
+        if phases and phases[-1].end >= year_phases[0].start:
+            phases[-1].end = year_phases[0].start - datetime.timedelta(days=1)
+        phases.extend(year_phases)
+    return phases
@@ -0,0 +1,507 @@
+# calmoji/cli.py
+
+"""
+The `calmoji` command line.
+
+    python -m calmoji generate --year 2025      # write the year's calendars (the default command)
+    python -m calmoji dry-run --format json     # preview without writing
+    python -m calmoji next --city Delhi         # upcoming meeting slots
+    python -m calmoji ebi48 now                 # current EBI48 face
+    python -m calmoji layer --years 10 --expand # ten years of EBI48 instances, no RRULEs
+    python -m calmoji status                    # current phase, face, focus block and next slot
+    python -m calmoji diff OLD NEW              # delta calendar between two runs
+    python -m calmoji validate output/          # RFC 5545 checks before clients see the files
+    python -m calmoji batch tenants/            # one calendar per tenant config
+    python -m calmoji serve --port 8048         # on-demand calendar server
+
+Only argparse is imported up front. Each command registers its options and
+imports its modules when it is the one being run, so quick queries such as
+`ebi48 now` never load the generators, time zones or hashing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Callable
+
+VERSION = "EBI48 Generator v2025.1"
+DEFAULT_COMMAND = "generate"
+
+
+class Command:
+    """A subcommand: help text, an option registrar and a runner (plain class: typing is not imported)."""
+    __slots__ = ("help", "add_options", "run")
+
+    def __init__(
+        self,
+        help: str,
+        add_options: Callable[[argparse.ArgumentParser], None],
+        run: Callable[[argparse.Namespace], int | None],
+    ):
+        self.help = help
+        self.add_options = add_options
+        self.run = run
+
+
+def level_parser() -> argparse.ArgumentParser:
+    """-q/--quiet and -v/--verbose, shared as a parent parser by every subcommand (and `serve`)."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("-q", "--quiet", action="store_true", help="Only report errors")
+    parser.add_argument("-v", "--verbose", action="count", default=0, help="More detail (-v per phase/week, -vv per event)")
+    return parser
+
+
+# 🧱 generate / dry-run
+
+def _generate_options(parser: argparse.ArgumentParser) -> None:
+    from calmoji.dry_run import DEFAULT_PAGE_SIZE, DRY_RUN_FORMATS
+    from calmoji.exporters import EXPORT_FORMATS
+    from calmoji.freebusy import FREEBUSY_MODES
+
+    parser.add_argument("--year", type=int, help="Start year (e.g., 2024)", default=2024)
+    parser.add_argument("--config", metavar="FILE",
+                        help="Schedule config (.toml or .json, see docs/schedule.example.toml)")
+    parser.add_argument("--dry-run", action="store_true", help="Only show output, don't write ICS files")
+    parser.add_argument("--format", choices=DRY_RUN_FORMATS, default="text", help="Dry-run report format")
+    parser.add_argument("--page", type=int, metavar="N", help="Dry run: also list page N of individual events")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE, help="Dry run: events per page")
+    parser.add_argument("--tzid", help="Write meetings and focus blocks in this IANA time zone, "
+                                       "or a meeting city's zone (default: UTC)")
+    parser.add_argument("--exclude-ics", action="append", default=[], metavar="ICS",
+                        help="Holiday/closure calendar whose events block slots (repeatable)")
+    parser.add_argument("--exclude-dates", action="append", default=[], metavar="FILE",
+                        help="File of YYYY-MM-DD days or A..B ranges to skip (repeatable)")
+    parser.add_argument("--city-holidays", metavar="JSON", help="JSON object of city → local holiday dates")
+    parser.add_argument("--freebusy", choices=FREEBUSY_MODES,
+                        help="Also write coalesced VFREEBUSY availability, one component per week or phase")
+    parser.add_argument("--combined", type=int, nargs="?", const=1, metavar="YEARS",
+                        help="Also write one merged calendar of every source, spanning YEARS academic years (default 1)")
+    parser.add_argument("--store", action="store_true",
+                        help="Also save generated events to a memory-mappable .calstore file")
+    parser.add_argument("--sqlite", action="store_true", help="Also export the schedule to a SQLite database")
+    parser.add_argument("--export", nargs="+", choices=EXPORT_FORMATS, default=[], metavar="FORMAT",
+                        help=f"Also stream every slot, focus block and phase as records ({', '.join(EXPORT_FORMATS)})")
+    parser.add_argument("--fanout", metavar="SUBSCRIBERS_JSON",
+                        help="Also render one personalized calendar per subscriber")
+    parser.add_argument("--fanout-dir", default="output/subscribers", help="Root directory for --fanout calendars")
+    parser.add_argument("--diff", nargs=2, metavar=("OLD", "NEW"),
+                        help="Compare two outputs (files or directories) and write a delta calendar")
+    parser.add_argument("--delta-out", default="delta.ics", help="Where --diff writes the delta .ics")
+
+
+def _dry_run_options(parser: argparse.ArgumentParser) -> None:
+    _generate_options(parser)
+    parser.set_defaults(dry_run=True)
+
+
+def _run_generate(args: argparse.Namespace) -> None:
+    import datetime
+    from pathlib import Path
+    from calmoji.calendar_phases import get_semester_phases, get_phases_for_years
+    from calmoji.combined import iter_combined, write_combined_ics
+    from calmoji.dry_run import dry_run
+    from calmoji.event_store import write_event_store
+    from calmoji.exclusions import build_exclusions
+    from calmoji.exporters import EXTENSIONS, export_records
+    from calmoji.fanout import load_subscribers, render_fanout
+    from calmoji.focus_blocks_writer import write_focus_blocks_weekly, generate_focus_block_events
+    from calmoji.freebusy import write_freebusy
+    from calmoji.ics_writer import write_semester_blocks, write_events_to_ics, write_ebi48_layer
+    from calmoji.reporter import configure, get_reporter, level_from_flags
+    from calmoji.slot_generator import generate_meeting_slots
+    from calmoji.spec import default_spec, load_spec
+    from calmoji.sqlite_export import export_sqlite
+    from calmoji.timezones import check_tz_name
+    from calmoji.utils import get_start_date_from_year, slugify, format_range_slug
+
+    reporter = get_reporter()
+
+    # 🔀 Diff mode: publish only what changed between two runs
+    if args.diff:
+        _write_delta(args.diff[0], args.diff[1], args.delta_out)
+        return
+
+    dry_mode = args.dry_run
+    year = args.year
+    # Check every input before the first file is written
+    try:
+        spec = load_spec(args.config) if args.config else default_spec()
+        if args.tzid:
+            args.tzid = check_tz_name(args.tzid)
+        subscribers = load_subscribers(args.fanout) if args.fanout else None
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"calmoji: {e}") from None
+
+    if dry_mode and args.format == "json":
+        reporter = configure(level_from_flags(quiet=True))  # Keep stdout a single JSON document
+
+    if dry_mode:
+        reporter.info("\n🔍 DRY RUN ENABLED — No files will be written.\n")
+
+    reporter.info("🦊 calmoji — Initiating Ritual Sequence")
+    reporter.info("=" * 50)
+
+    # 🌅 Step 1: Derive academic year start date and phase structure
+    start_date = get_start_date_from_year(year, spec.start_month, spec.start_day)
+    phases = get_semester_phases(start_date, spec=spec)
+
+    # 🚧 Load holidays and closures once
+    exclusions = None
+    if args.exclude_ics or args.exclude_dates or args.city_holidays:
+        exclusions = build_exclusions(
+            ics=args.exclude_ics,
+            date_lists=args.exclude_dates,
+            city_holidays=args.city_holidays,
+            window=(phases[0].start, phases[-1].end + datetime.timedelta(days=1)),
+        )
+        reporter.info(f"🚧 Loaded {len(exclusions)} exclusion intervals")
+
+    # 🔍 Dry run: one lazy pass over meetings, focus blocks and the expanded EBI48 layer
+    if dry_mode:
+        reporter.flush()
+        dry_run(
+            iter_combined(
+                phases, exclusions=exclusions, ebi48_years=[start_date.year], ebi48_expanded=True, spec=spec
+            ),
+            label=f"Dry run {year}–{year + 1}",
+            page=args.page,
+            page_size=args.page_size,
+            fmt=args.format,
+        )
+        reporter.close()
+        return
+
+    # 📂 Step 2: Create output directory if needed
+    Path("output").mkdir(parents=True, exist_ok=True)
+
+    # 🗓️ Step 3: Write semester phase blocks (all-day markers)
+    write_semester_blocks(phases, filename=f"output/semester_phases_{year}.ics")
+
+    # 🧱 Step 4: Generate meeting slots per phase
+    all_events = []
+
+    for phase in phases:
+        reporter.verbose(f"\n📅 Phase: {phase.name} ({phase.start.date()} → {phase.end.date()}) {phase.emoji}")
+        events = generate_meeting_slots(phase, exclusions=exclusions, spec=spec)
+        all_events.extend(events)
+
+        target_path = f"output/meeting_{slugify(phase.name)}_{format_range_slug(phase.start, phase.end)}.ics"
+
+        write_events_to_ics(events, target_path, tzid=args.tzid)
+        reporter.wrote(target_path, f"{len(events)} events")
+
+    # 🗃️ Step 5: Write consolidated meeting calendar
+    consolidated_path = f"output/meeting_all_{start_date.year}.ics"
+    write_events_to_ics(all_events, consolidated_path, tzid=args.tzid)
+    reporter.wrote(consolidated_path, f"{len(all_events)} events")
+
+    # 🧘 Step 6: Write weekly focus blocks (12x per day, Sunday–Friday)
+    focus_paths = write_focus_blocks_weekly(phases, tzid=args.tzid, exclusions=exclusions, spec=spec)
+    reporter.wrote("output/focus_blocks_*.ics", f"{len(focus_paths)} weekly files")
+
+    # 🕳️ Optional: merged busy ranges for availability publishing
+    if args.freebusy:
+        freebusy_path = f"output/freebusy_{args.freebusy}_{start_date.year}.ics"
+        busy_events = all_events + generate_focus_block_events(phases, exclusions=exclusions, spec=spec)
+        periods = write_freebusy(busy_events, phases, freebusy_path, mode=args.freebusy)
+        reporter.wrote(freebusy_path, f"{len(busy_events)} events → {periods} busy periods")
+
+    # 🧵 Optional: every source k-way merged into one calendar
+    if args.combined:
+        last_year = year + args.combined - 1
+        combined_path = f"output/combined_{year}.ics" if last_year == year else f"output/combined_{year}_{last_year}.ics"
+        count = write_combined_ics(
+            combined_path, get_phases_for_years(year, args.combined, spec=spec),
+            tzid=args.tzid, exclusions=exclusions, spec=spec,
+        )
+        reporter.wrote(combined_path, f"{count} events")
+
+    # 🗄️ Optional: binary event store for fast lookups without regenerating
+    if args.store:
+        store_path = f"output/events_{start_date.year}.calstore"
+        count = write_event_store(store_path, iter_combined(phases, exclusions=exclusions, spec=spec))
+        reporter.wrote(store_path, f"{count} records")
+
+    # 🧮 Optional: SQLite database for SQL analysis
+    if args.sqlite:
+        sqlite_path = f"output/calmoji_{start_date.year}.sqlite"
+        counts = export_sqlite(sqlite_path, phases, exclusions=exclusions, spec=spec)
+        reporter.wrote(sqlite_path, ", ".join(f"{n} {table}" for table, n in counts.items()))
+
+    # 📤 Optional: NDJSON / CSV / jCal record exports
+    for fmt in args.export:
+        export_path = f"output/calmoji_{start_date.year}.{EXTENSIONS[fmt]}"
+        count = export_records(fmt, phases, export_path, exclusions=exclusions, spec=spec)
+        reporter.wrote(export_path, f"{count} records")
+
+    # 📬 Optional: personalized calendars for every subscriber
+    if subscribers is not None:
+        report = render_fanout(subscribers, phases, args.fanout_dir, exclusions=exclusions, spec=spec)
+        reporter.info(str(report))
+
+    # 🧠 Step 7: Emit canonical emoji time overlay (EBI48)
+    ebi48_path = f"output/ebi48_layer_{start_date.year}.ics"
+    write_ebi48_layer(ebi48_path, start_date.year, exclusions=exclusions)
+    reporter.wrote(ebi48_path)
+
+    reporter.info("\n🎉 Ritual complete. Time is now encoded.\n")
+    reporter.close()
+
+
+# 🔀 diff
+
+def _diff_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("old", help="Previous output (.ics file or directory)")
+    parser.add_argument("new", help="New output (.ics file or directory)")
+    parser.add_argument("--out", default="delta.ics", help="Where to write the delta .ics")
+
+
+def _write_delta(old_source: str, new_source: str, target: str) -> None:
+    from pathlib import Path
+    from calmoji.delta import write_delta
+    from calmoji.reporter import get_reporter
+
+    reporter = get_reporter()
+    Path(target).parent.mkdir(parents=True, exist_ok=True)
+    summary = write_delta(old_source, new_source, target)
+    reporter.info(f"🔀 Delta {old_source} → {new_source}: {summary}")
+    reporter.wrote(target)
+    reporter.close()
+
+
+def _run_diff(args: argparse.Namespace) -> None:
+    _write_delta(args.old, args.new, args.out)
+
+
+# ⏭️ next
+
+def _next_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--city", action="append", default=[], help="Only slots for this city (repeatable)")
+    parser.add_argument("--count", type=int, default=3, help="How many upcoming events to list")
+    parser.add_argument("--focus", action="store_true", help="Include focus blocks")
+    parser.add_argument("--at", metavar="ISO", type=_parse_utc, default="now",
+                        help="Look ahead from this UTC time instead of now")
+    parser.add_argument("--config", metavar="FILE", help="Schedule config (.toml or .json)")
+
+
+def _run_next(args: argparse.Namespace) -> None:
+    from itertools import islice
+    from calmoji.calendar_phases import get_phases_for_years
+    from calmoji.combined import iter_combined
+    from calmoji.spec import load_spec
+
+    at = args.at
+    spec = load_spec(args.config) if args.config else None
+    phases = [p for p in get_phases_for_years(at.year - 1, 2, spec=spec) if p.end.date() >= at.date()]
+    cities = set(args.city)
+    upcoming = (
+        event for event in iter_combined(phases, phase_markers=False, focus_blocks=args.focus, spec=spec)
+        if event.start >= at and (not cities or event.kind != "meeting" or event.city in cities)
+    )
+    for event in islice(upcoming, args.count):
+        minutes = int((event.start - at).total_seconds() // 60)
+        days, hours = divmod(minutes // 60, 24)
+        wait = (f"{days}d " if days else "") + f"{hours}h {minutes % 60:02d}m"
+        print(f"{event.start:%a %Y-%m-%d %H:%M} UTC  {event.summary}  (in {wait})")
+
+
+# 🕒 ebi48
+
+def _ebi48_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("when", nargs="?", type=_parse_utc, default="now",
+                        help="'now', HH:MM, or an ISO date-time (UTC)")
+
+
+def _parse_utc(value: str):
+    """
+    'now', HH:MM (today) or an ISO date-time as naive UTC.
+
+    Used as an argparse `type`, so a malformed value is a usage error.
+    """
+    import datetime
+
+    if value == "now":
+        return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    try:
+        if len(value) <= 5 and ":" in value:
+            hour, minute = value.split(":")
+            return datetime.datetime.combine(datetime.date.today(), datetime.time(int(hour), int(minute)))
+        parsed = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not 'now', HH:MM or an ISO date-time: {value!r}") from None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _run_ebi48(args: argparse.Namespace) -> None:
+    from calmoji.ebi48 import get_emoji_for_slot, get_slot_for_time, slot_time_range
+
+    slot = get_slot_for_time(args.when)
+    glyph, face = get_emoji_for_slot(slot)
+    start, end = slot_time_range(slot)
+    print(f"{glyph} {face} — slot {slot} ({start}–{end} UTC)")
+
+
+# 🧠 layer
+
+def _layer_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--from", dest="first", metavar="YYYY-MM-DD", help="First day (default: today)")
+    parser.add_argument("--to", dest="last", metavar="YYYY-MM-DD", help="Last day (default: --years after --from)")
+    parser.add_argument("--years", type=int, default=1, help="Length of the range when --to is not given")
+    parser.add_argument("--expand", action="store_true", help="Write every instance instead of weekly RRULEs")
+    parser.add_argument("--exclude-ics", action="append", default=[], metavar="ICS",
+                        help="Holiday/closure calendar whose events block slots (repeatable)")
+    parser.add_argument("--exclude-dates", action="append", default=[], metavar="FILE",
+                        help="File of YYYY-MM-DD days or A..B ranges to skip (repeatable)")
+    parser.add_argument("--out", help="Target .ics (default: output/ebi48_layer_<first>_<last>.ics)")
+
+
+def _run_layer(args: argparse.Namespace) -> None:
+    import datetime
+    from pathlib import Path
+    from calmoji.exclusions import build_exclusions
+    from calmoji.ics_writer import write_ebi48_range
+    from calmoji.reporter import get_reporter
+
+    try:
+        first = datetime.date.fromisoformat(args.first) if args.first else datetime.date.today()
+        if args.last:
+            last = datetime.date.fromisoformat(args.last)
+        elif first.month == 2 and first.day == 29:
+            last = datetime.date(first.year + args.years, 2, 28)
+        else:
+            last = first.replace(year=first.year + args.years) - datetime.timedelta(days=1)
+        exclusions = None
+        if args.exclude_ics or args.exclude_dates:
+            window = (
+                datetime.datetime.combine(first, datetime.time()),
+                datetime.datetime.combine(last + datetime.timedelta(days=1), datetime.time()),
+            )
+            exclusions = build_exclusions(ics=args.exclude_ics, date_lists=args.exclude_dates, window=window)
+        target = args.out or f"output/ebi48_layer_{first:%Y%m%d}_{last:%Y%m%d}.ics"
+        Path(target).parent.mkdir(parents=True, exist_ok=True)
+        count = write_ebi48_range(target, first, last, recurring=not args.expand, exclusions=exclusions)
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"calmoji: {e}") from None
+    reporter = get_reporter()
+    reporter.wrote(target, f"{count} events")
+    reporter.close()
+
+
+# ✅ validate
+
+def _validate_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("paths", nargs="*", default=["output"], help=".ics files or directories (default: output)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+
+
+def _run_validate(args: argparse.Namespace) -> int:
+    from calmoji.reporter import get_reporter
+    from calmoji.validator import validate_paths
+
+    reporter = get_reporter()
+    try:
+        reports = validate_paths(args.paths, workers=args.workers)
+    except OSError as e:
+        raise SystemExit(f"calmoji: {e}") from None
+    failed = [report for report in reports if not report.ok]
+    for report in failed:
+        for issue in report.issues:
+            print(issue)
+        hidden = sum(report.counts.values()) - len(report.issues)
+        if hidden:
+            print(f"{report.path}: … and {hidden} more ({', '.join(f'{n} {code}' for code, n in report.counts.items())})")
+    lines, events = sum(r.lines for r in reports), sum(r.events for r in reports)
+    reporter.info(f"{'❌' if failed else '✅'} {len(reports)} files, {events} events, {lines} lines: "
+                  f"{len(failed)} with issues")
+    reporter.close()
+    return 1 if failed else 0
+
+
+# 🏛️ batch
+
+def _batch_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("config_dir", help="Directory of tenant schedule configs (.toml/.json)")
+    parser.add_argument("--year", type=int, default=2024, help="Start year (e.g., 2024)")
+    parser.add_argument("--years", type=int, default=1, help="Academic years per calendar")
+    parser.add_argument("--out", default="output/tenants", help="Output root (one subdirectory per tenant)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--no-ebi48", action="store_true", help="Leave out the EBI48 layer")
+
+
+def _run_batch(args: argparse.Namespace) -> None:
+    from calmoji.batch import run_batch
+    from calmoji.reporter import get_reporter
+
+    try:
+        report = run_batch(
+            args.config_dir, args.year, args.years, args.out, workers=args.workers, ebi48=not args.no_ebi48
+        )
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"calmoji: {e}") from None
+    get_reporter().info(str(report))
+
+
+# 📍 status
+
+def _status_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--at", metavar="ISO", type=_parse_utc, help="Describe this UTC time instead of now")
+    parser.add_argument("--config", metavar="FILE", help="Schedule config (.toml or .json)")
+
+
+def _run_status(args: argparse.Namespace) -> None:
+    from calmoji.phase_catalog import format_status, status
+    from calmoji.spec import load_spec
+
+    spec = load_spec(args.config) if args.config else None
+    print(format_status(status(args.at, spec)))
+
+
+# 🛰️ serve
+
+def _serve_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("serve_args", nargs=argparse.REMAINDER, help="Options for the server (see `serve --help`)")
+
+
+def _run_serve(args: argparse.Namespace) -> None:
+    from calmoji.server import main as serve_main
+    serve_main(args.serve_args)
+
+
+COMMANDS: dict[str, Command] = {
+    "generate": Command("Write the academic year's calendars (default)", _generate_options, _run_generate),
+    "dry-run": Command("Preview a run without writing anything", _dry_run_options, _run_generate),
+    "next": Command("List the next meeting slots (and focus blocks)", _next_options, _run_next),
+    "ebi48": Command("Show the EBI48 face for now or a given UTC time", _ebi48_options, _run_ebi48),
+    "layer": Command("Write the EBI48 layer for any date range, recurring or expanded", _layer_options, _run_layer),
+    "status": Command("Show the current phase, EBI48 face, focus block and next slot", _status_options, _run_status),
+    "diff": Command("Write a delta calendar between two outputs", _diff_options, _run_diff),
+    "validate": Command("Check .ics files against RFC 5545", _validate_options, _run_validate),
+    "batch": Command("Write calendars for a directory of tenant configs", _batch_options, _run_batch),
+    "serve": Command("Serve calendars over HTTP", _serve_options, _run_serve),
+}
+
+
+def main(argv: list[str] | None = None) -> int | None:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv[:1] == ["serve"]:
+        return _run_serve(argparse.Namespace(serve_args=argv[1:]))  # Server flags are parsed by the server
+    if not argv or (argv[0] not in COMMANDS and argv[0] not in ("-h", "--help", "--version")):
+        argv.insert(0, DEFAULT_COMMAND)  # `calmoji.py --year 2025` keeps meaning `generate --year 2025`
+
+    parser = argparse.ArgumentParser(prog="calmoji", description="🧿 calmoji — Ritual Calendar Crafter")
+    parser.add_argument("--version", action="version", version=VERSION)
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    levels = level_parser()
+    for name, command in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=command.help, description=command.help, parents=[levels])
+        if name == argv[0]:
+            command.add_options(subparser)  # Only the chosen command pays for its options' imports
+
+    args = parser.parse_args(argv)
+    if args.quiet or args.verbose:
+        from calmoji.reporter import configure, level_from_flags
+        configure(level_from_flags(args.quiet, args.verbose))
+    return COMMANDS[args.command].run(args)
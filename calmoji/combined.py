@@ -0,0 +1,120 @@
+# calmoji/combined.py
+
+"""
+One combined calendar from every calmoji source, via a streaming k-way merge.
+
+Phase markers, per-phase meeting slots, focus blocks and the EBI48 layer are
+each generated lazily in start-time order, so `heapq.merge` can interleave
+them into a single sorted stream while holding only one pending event per
+source. Nothing is materialized or re-sorted, which keeps memory flat for
+multi-year ranges:
+
+    phases = get_phases_for_years(2024, years=5)
+    write_combined_ics("output/combined_2024_2028.ics", phases)
+"""
+
+import datetime
+import heapq
+import os
+from typing import Iterable, Iterator, Optional
+
+from calmoji.exclusions import Exclusions
+from calmoji.focus_blocks_writer import iter_focus_block_events
+from calmoji.ics_writer import create_ics_footer, create_ics_header, iter_ebi48_events, iter_semester_block_events
+from calmoji.reporter import get_reporter
+from calmoji.slot_generator import iter_meeting_slots
+from calmoji.spec import ScheduleSpec
+from calmoji.timezones import vtimezone_block
+from calmoji.types import Event, Phase
+
+PROGRESS_EVERY = 4096  # Events between progress updates while streaming
+
+
+def start_key(event: Event) -> datetime.datetime:
+    """Sort key that puts all-day (date) events at midnight UTC of their day."""
+    start = event.start
+    if isinstance(start, datetime.datetime):
+        return start
+    return datetime.datetime(start.year, start.month, start.day)
+
+
+def calendar_years(phases: list[Phase]) -> range:
+    """Calendar years touched by a run of phases."""
+    return range(phases[0].start.year, phases[-1].end.year + 1)
+
+
+def combined_sources(
+    phases: list[Phase],
+    exclusions: Optional[Exclusions] = None,
+    phase_markers: bool = True,
+    meetings: bool = True,
+    focus_blocks: bool = True,
+    ebi48_years: Iterable[int] = (),
+    ebi48_expanded: bool = False,
+    spec: Optional[ScheduleSpec] = None,
+) -> list[Iterator[Event]]:
+    """Return one start-sorted lazy iterator per source (EBI48 as weekly RRULEs unless `ebi48_expanded`)."""
+    sources: list[Iterator[Event]] = []
+    if phase_markers:
+        sources.append(iter_semester_block_events(phases))
+    if meetings:
+        # One stream per phase: phases of consecutive years may share a boundary day
+        sources.extend(iter_meeting_slots(phase, exclusions=exclusions, spec=spec) for phase in phases)
+    if focus_blocks:
+        sources.extend(iter_focus_block_events([phase], exclusions=exclusions, spec=spec) for phase in phases)
+    sources.extend(
+        iter_ebi48_events(year, recurring=not ebi48_expanded, expanded=ebi48_expanded, exclusions=exclusions)
+        for year in ebi48_years
+    )
+    return sources
+
+
+def iter_combined(phases: list[Phase], **options) -> Iterator[Event]:
+    """
+    Lazily yield every event from every source, merged by start time.
+
+    Keyword options are those of `combined_sources`. Events with equal start
+    times keep source order (phase marker, meetings, focus blocks, EBI48).
+    """
+    return heapq.merge(*combined_sources(phases, **options), key=start_key)
+
+
+def write_combined_ics(
+    filename: str,
+    phases: list[Phase],
+    tzid: Optional[str] = None,
+    ebi48: bool = True,
+    **options,
+) -> int:
+    """
+    Stream the merged calendar straight to an .ics file.
+
+    Args:
+        filename: Target .ics path.
+        phases: Phases to cover, in order (see `get_phases_for_years`).
+        tzid: Write timed events as local time in this IANA zone.
+        ebi48: Include the EBI48 layer for every calendar year the phases touch.
+        **options: Passed to `combined_sources` (exclusions, phase_markers, meetings, focus_blocks, spec).
+
+    Returns:
+        int: Number of events written.
+    """
+    years = calendar_years(phases)
+    reporter = get_reporter()
+    written = 0
+
+    with open(filename, "w", encoding="utf-8", newline="") as f:
+        f.write(create_ics_header(
+            calname=f"🧿 calmoji combined {years[0]}–{years[-1]}",
+            timezone=tzid or "UTC",
+        ))
+        if tzid:
+            f.write(vtimezone_block(tzid, years))
+        for event in iter_combined(phases, ebi48_years=years if ebi48 else (), **options):
+            f.write(event.to_ics(tzid=tzid))
+            written += 1
+            if written % PROGRESS_EVERY == 0:
+                reporter.count(events=PROGRESS_EVERY)
+        f.write(create_ics_footer())
+    reporter.count(events=written % PROGRESS_EVERY, nbytes=os.path.getsize(filename))
+    return written
@@ -5,11 +5,13 @@ from calmoji.types import Phase
 
 # 🧿 Academic Year Start
 YEAR_START_DATE_STR: str = "2024-09-15"
-YEAR_START_DATE: datetime = datetime.strptime(YEAR_START_DATE_STR, "%Y-%m-%d")
+YEAR_START_DATE: datetime = datetime.fromisoformat(YEAR_START_DATE_STR)  # Not strptime: keeps _strptime out of import
 
 # 🔁 Slot Generation Settings
 SERIES_INTERVAL_WEEKS: int = 3
 NUM_SERIES: int = 3
+# How many of the series meet in a phase of each density (each series meets once every SERIES_INTERVAL_WEEKS)
+DENSITY_SERIES: dict[str, int] = {"none": 0, "low": 1, "normal": 2, "high": 3}
 NUM_SLOTS_PER_DAY: int = 8
 DAYS_PER_WEEK: int = 5
 
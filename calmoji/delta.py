@@ -0,0 +1,187 @@
+# calmoji/delta.py
+
+"""
+UID-indexed delta calendars between two calmoji runs.
+
+Event UIDs are deterministic (`calmoji.uid.generate_uid`), so the same slot
+keeps its UID across runs. Diffing two outputs is therefore two hash indexes
+of UID → content digest: events only in the new index were added, events
+whose digest changed were modified, and events only in the old index were
+removed. The delta .ics carries the added and changed VEVENTs verbatim plus
+a STATUS:CANCELLED copy of every removed one, so subscribers and sync jobs
+only have to process what actually changed. Copied events may carry TZID
+parameters (outputs written with --tzid), so the delta also carries a
+VTIMEZONE for every zone they use.
+"""
+
+import os
+import re
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from calmoji.ics_reader import iter_raw_vevents, unfold
+from calmoji.ics_writer import create_ics_footer, create_ics_header
+from calmoji.timezones import vtimezone_block
+
+PathLike = Union[str, os.PathLike]
+
+# Properties that legitimately change on every export and must not count as edits
+VOLATILE_PROPERTIES = (b"DTSTAMP", b"LAST-MODIFIED", b"CREATED", b"SEQUENCE")
+
+# A property line with a TZID parameter: captures the zone and the value's year
+_TZID_LINE = re.compile(rb'^[A-Za-z-]+;(?:[^:\n]*;)?TZID="?([^";:\n]+)"?[^:\n]*:(\d{4})', re.MULTILINE)
+BODY_SPOOL_BYTES = 8 * 1024 * 1024  # Delta bodies larger than this are staged on disk
+
+
+def iter_ics_files(source: PathLike, exclude: Optional[PathLike] = None) -> Iterator[Path]:
+    """
+    Yield a single .ics file, or every .ics file under a directory in sorted order.
+
+    `exclude` names a file to skip, such as a delta being written into the
+    directory it is computed from.
+    """
+    source = Path(source)
+    skip = Path(exclude).resolve() if exclude is not None else None
+    if source.is_dir():
+        paths = sorted(p for p in source.rglob("*.ics") if p.is_file())
+    else:
+        paths = [source]
+    for path in paths:
+        if skip is None or path.resolve() != skip:
+            yield path
+
+
+def _uid_of(block: bytes) -> str:
+    for line in block.split(b"\n"):
+        if line[:4].upper() == b"UID:":
+            return line[4:].decode("utf-8", errors="replace").strip()
+    return ""
+
+
+def event_digest(raw: bytes) -> tuple[str, bytes]:
+    """Return (UID, digest) for a raw VEVENT, ignoring line folding and volatile properties."""
+    block = unfold(raw)
+    digest = blake2b(digest_size=16)
+    for line in block.split(b"\n"):
+        if line and not line.upper().startswith(VOLATILE_PROPERTIES):
+            digest.update(line)
+            digest.update(b"\n")
+    return _uid_of(block), digest.digest()
+
+
+def build_uid_index(source: PathLike, exclude: Optional[PathLike] = None) -> dict[str, bytes]:
+    """Map every UID in a file or output directory (minus `exclude`) to the digest of its VEVENT."""
+    index: dict[str, bytes] = {}
+    for path in iter_ics_files(source, exclude):
+        for raw in iter_raw_vevents(path):
+            uid, digest = event_digest(raw)
+            if uid:
+                index[uid] = digest
+    return index
+
+
+@dataclass
+class DeltaSummary:
+    """Counts and UIDs of what changed between two outputs."""
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    cancelled: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def total(self) -> int:
+        return len(self.added) + len(self.changed) + len(self.cancelled)
+
+    def __str__(self) -> str:
+        return (
+            f"➕ {len(self.added)} added, ✏️ {len(self.changed)} changed, "
+            f"❌ {len(self.cancelled)} cancelled, {self.unchanged} unchanged"
+        )
+
+
+def diff_indexes(old: dict[str, bytes], new: dict[str, bytes]) -> DeltaSummary:
+    """Compare two UID → digest indexes."""
+    summary = DeltaSummary()
+    for uid, digest in new.items():
+        previous = old.get(uid)
+        if previous is None:
+            summary.added.append(uid)
+        elif previous != digest:
+            summary.changed.append(uid)
+        else:
+            summary.unchanged += 1
+    summary.cancelled = [uid for uid in old if uid not in new]
+    return summary
+
+
+def cancel_vevent(raw: bytes) -> bytes:
+    """Return a copy of a VEVENT marked STATUS:CANCELLED (replacing any existing STATUS)."""
+    lines = [
+        line for line in raw.replace(b"\r\n", b"\n").split(b"\n")
+        if not line.upper().startswith(b"STATUS:")
+    ]
+    end = len(lines) - 1
+    while end > 0 and lines[end].strip().upper() != b"END:VEVENT":
+        end -= 1
+    return b"\r\n".join(lines[:end] + [b"STATUS:CANCELLED"] + lines[end:])
+
+
+def _note_timezones(raw: bytes, zones: dict[str, set[int]]) -> None:
+    """Record the TZIDs a VEVENT refers to, with the years its zoned values fall in."""
+    if b"TZID=" in raw:
+        for tzid, year in _TZID_LINE.findall(unfold(raw)):
+            zones.setdefault(tzid.decode("utf-8", errors="replace"), set()).add(int(year))
+
+
+def _selected_blocks(source: PathLike, wanted: set[str], exclude: PathLike) -> Iterable[bytes]:
+    """Stream the raw VEVENTs of a source whose UID is in `wanted`, each at most once."""
+    for path in iter_ics_files(source, exclude):
+        for raw in iter_raw_vevents(path):
+            uid, _ = event_digest(raw)
+            if uid in wanted:
+                wanted.discard(uid)
+                yield raw
+
+
+def write_delta(old_source: PathLike, new_source: PathLike, target_path: PathLike) -> DeltaSummary:
+    """
+    Diff two outputs (files or directories) and write a delta .ics.
+
+    Args:
+        old_source: Previous run's .ics file or output directory.
+        new_source: New run's .ics file or output directory.
+        target_path: Where to write the delta calendar. It may sit inside
+            either source; it is never read as part of one.
+
+    Returns:
+        DeltaSummary: What was added, changed and cancelled.
+    """
+    summary = diff_indexes(build_uid_index(old_source, target_path), build_uid_index(new_source, target_path))
+    zones: dict[str, set[int]] = {}
+
+    # The VTIMEZONEs go before the events but depend on them, so the events are staged first
+    with tempfile.SpooledTemporaryFile(max_size=BODY_SPOOL_BYTES) as body:
+        for raw in _selected_blocks(new_source, set(summary.added) | set(summary.changed), target_path):
+            _note_timezones(raw, zones)
+            body.write(raw.replace(b"\r\n", b"\n").replace(b"\n", b"\r\n") + b"\r\n")
+        for raw in _selected_blocks(old_source, set(summary.cancelled), target_path):
+            _note_timezones(raw, zones)
+            body.write(cancel_vevent(raw) + b"\r\n")
+        body.seek(0)
+
+        with open(target_path, "wb") as f:
+            header = create_ics_header(
+                calname="🧿 calmoji delta",
+                comments=[f"Delta from {old_source} to {new_source}: {summary}"],
+            )
+            f.write(header.encode("utf-8"))
+            for tzid in sorted(zones):
+                f.write(vtimezone_block(tzid, zones[tzid]).encode("utf-8"))
+            shutil.copyfileobj(body, f)
+            f.write(create_ics_footer().encode("utf-8"))
+
+    return summary
@@ -1,36 +1,216 @@
 # calmoji/dry_run.py
 
+"""
+Dry-run reporting: what a run would write, without writing it.
+
+`summarize` consumes an event iterator once, lazily, and keeps only counters:
+events per phase × (kind, city) × weekday, per EBI48 face, and the first/last
+occurrence of each kind. Detail lines are kept only for the requested page,
+so a multi-year preview of meetings, focus blocks and the expanded EBI48
+layer runs in constant memory:
+
+    dry_run(iter_combined(phases, ebi48_years=[2024], ebi48_expanded=True), label="2024")
+    dry_run(events, page=3, page_size=40, fmt="json")
+"""
+
+import datetime
+import json
+import sys
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, TextIO, Union
+
+from calmoji.ebi48 import EBI48_CLOCK
 from calmoji.types import Event
 
-# def dry_run(events: list[Event], phase_name: str):
-#     """
-#     Print a dry-run preview of meeting events for a given phase.
-#     """
-#     print(f"\n📆 Phase: {phase_name}")
-#     print("─" * (12 + len(phase_name)))
+DRY_RUN_FORMATS = ("text", "json")
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+DEFAULT_PAGE_SIZE = 50
+NO_PHASE = "(no phase)"
+
+
+def ebi48_face(start: Union[datetime.datetime, datetime.date]) -> Optional[str]:
+    """'🦊 Fox Face' for a start on an EBI48 slot boundary (:05/:35 UTC), else None."""
+    if not isinstance(start, datetime.datetime) or start.minute % 30 != 5:
+        return None
+    glyph, face = EBI48_CLOCK[start.hour * 2 + start.minute // 30]
+    return f"{glyph} {face}"
+
+
+@dataclass
+class DryRunReport:
+    """Aggregated view of one dry run."""
+    label: str
+    total: int = 0
+    # phase → (kind, city) → events per weekday (Mon…Sun)
+    counts: dict[str, dict[tuple[str, Optional[str]], list[int]]] = field(default_factory=dict)
+    faces: dict[str, int] = field(default_factory=dict)
+    first: dict[str, Event] = field(default_factory=dict)
+    last: dict[str, Event] = field(default_factory=dict)
+    page: Optional[int] = None
+    page_size: int = DEFAULT_PAGE_SIZE
+    detail: list[Event] = field(default_factory=list)
 
-#     for event in events:
-#         start_str = event.start.strftime('%a %Y-%m-%d %H:%M')
-#         summary_str = event.summary or "(No Summary)"
-#         print(f"{summary_str.ljust(48)}  [{start_str}]")
+    @property
+    def pages(self) -> int:
+        return max(1, -(-self.total // self.page_size))
 
-#     print(f"\nTotal: {len(events)} meeting slots\n")
+    def to_dict(self) -> dict:
+        """JSON-ready form of the report."""
+        data = {
+            "label": self.label,
+            "total": self.total,
+            "phases": [
+                {
+                    "phase": phase,
+                    "kind": kind,
+                    "city": city,
+                    "weekdays": dict(zip(WEEKDAYS, per_day)),
+                    "total": sum(per_day),
+                }
+                for phase, rows in self.counts.items()
+                for (kind, city), per_day in rows.items()
+            ],
+            "faces": self.faces,
+            "kinds": {
+                kind: {
+                    "first": {"start": _iso(self.first[kind].start), "summary": self.first[kind].summary},
+                    "last": {"start": _iso(self.last[kind].start), "summary": self.last[kind].summary},
+                }
+                for kind in self.first
+            },
+        }
+        if self.page is not None:
+            data["page"] = {
+                "number": self.page,
+                "size": self.page_size,
+                "pages": self.pages,
+                "events": [
+                    {"start": _iso(e.start), "end": _iso(e.end), "kind": e.kind, "city": e.city, "summary": e.summary}
+                    for e in self.detail
+                ],
+            }
+        return data
 
-def dry_run(events: list[Event], label: str = "Event Preview", kind: str = "slots"):
+
+def _iso(value: Union[datetime.datetime, datetime.date]) -> str:
+    return value.isoformat()
+
+
+def summarize(
+    events: Iterable[Event],
+    label: str = "Event Preview",
+    page: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> DryRunReport:
     """
-    Print a dry-run preview of a set of calendar events.
+    Aggregate an event stream in one pass.
 
     Args:
-        events (list[Event]): List of events to preview.
-        label (str): Title for this batch of events (e.g., phase name or week slug).
-        kind (str): Event type (e.g., 'slots', 'blocks', 'rituals') for reporting.
+        events: Any event iterable; it is consumed exactly once.
+        label: Title for the report (e.g. an academic year or phase name).
+        page: 1-based page of detail lines to keep, or None for summary only.
+        page_size: Events per detail page.
+
+    Returns:
+        DryRunReport: Counters, first/last occurrences and the requested page.
     """
-    print(f"\n📆 {label}")
-    print("─" * (12 + len(label)))
+    if page is not None and page < 1:
+        raise ValueError(f"Page numbers start at 1, got {page}")
+    if page_size < 1:
+        raise ValueError(f"Page size must be positive, got {page_size}")
+
+    report = DryRunReport(label=label, page=page, page_size=page_size)
+    lo = (page - 1) * page_size if page is not None else -1
+    hi = lo + page_size if page is not None else -1
+    counts, faces, first, last = report.counts, report.faces, report.first, report.last
+    total = 0
 
     for event in events:
-        start_str = event.start.strftime('%a %Y-%m-%d %H:%M')
-        summary_str = event.summary or "(No Summary)"
-        print(f"{summary_str.ljust(48)}  [{start_str}]")
+        if lo <= total < hi:
+            report.detail.append(event)
+        total += 1
+
+        kind = event.kind
+        rows = counts.setdefault(event.phase or NO_PHASE, {})
+        per_day = rows.get((kind, event.city))
+        if per_day is None:
+            per_day = rows[(kind, event.city)] = [0] * 7
+        per_day[event.start.weekday()] += 1
+
+        face = ebi48_face(event.start)
+        if face is not None:
+            faces[face] = faces.get(face, 0) + 1
+        if kind not in first:
+            first[kind] = event
+        last[kind] = event
+
+    report.total = total
+    return report
 
-    print(f"\nTotal: {len(events)} {kind}\n")
+
+def _when(value: Union[datetime.datetime, datetime.date]) -> str:
+    return f"{value:%a %Y-%m-%d %H:%M}" if isinstance(value, datetime.datetime) else f"{value:%a %Y-%m-%d}"
+
+
+def format_report(report: DryRunReport) -> str:
+    """Render a report as the terminal summary (plus the detail page, if any)."""
+    lines = [f"\n📆 {report.label}", "─" * (12 + len(report.label))]
+
+    header = "".join(f"{day:>6}" for day in WEEKDAYS) + f"{'Total':>8}"
+    for phase, rows in report.counts.items():
+        lines.append(f"\n{phase:<40}{header}")
+        for (kind, city), per_day in rows.items():
+            name = f"  {kind} {city}" if city else f"  {kind}"
+            lines.append(f"{name:<40}" + "".join(f"{n:>6}" for n in per_day) + f"{sum(per_day):>8}")
+
+    if report.faces:
+        lines.append("\n🕒 EBI48 faces")
+        for face, n in sorted(report.faces.items(), key=lambda item: -item[1]):
+            lines.append(f"  {face:<24}{n:>8}")
+
+    if report.first:
+        lines.append("\n⏱️ First → last")
+        for kind, event in report.first.items():
+            lines.append(f"  {kind:<10}{_when(event.start)}  →  {_when(report.last[kind].start)}")
+
+    if report.page is not None:
+        lines.append(f"\n📄 Page {report.page}/{report.pages} ({report.page_size} per page)")
+        for event in report.detail:
+            lines.append(f"{(event.summary or '(No Summary)'):<48}  [{_when(event.start)}]")
+
+    lines.append(f"\nTotal: {report.total} events\n")
+    return "\n".join(lines)
+
+
+def dry_run(
+    events: Iterable[Event],
+    label: str = "Event Preview",
+    page: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    fmt: str = "text",
+    file: Optional[TextIO] = None,
+) -> DryRunReport:
+    """
+    Print a dry-run report for a stream of calendar events.
+
+    Args:
+        events (Iterable[Event]): Events to preview; consumed lazily, once.
+        label (str): Title for this report (e.g., academic year or phase name).
+        page (Optional[int]): 1-based page of per-event detail to include.
+        page_size (int): Events per detail page.
+        fmt (str): 'text' for the terminal summary, 'json' for machine-readable output.
+        file (Optional[TextIO]): Where to print (default: stdout).
+
+    Returns:
+        DryRunReport: The aggregated report that was printed.
+    """
+    if fmt not in DRY_RUN_FORMATS:
+        raise ValueError(f"Unknown dry-run format: {fmt} (expected one of {DRY_RUN_FORMATS})")
+    report = summarize(events, label=label, page=page, page_size=page_size)
+    out = file or sys.stdout
+    if fmt == "json":
+        json.dump(report.to_dict(), out, ensure_ascii=False, indent=2)
+        out.write("\n")
+    else:
+        out.write(format_report(report) + "\n")
+    return report
@@ -1,7 +1,7 @@
- are swapping  are swapping # calmoji/ebi48.py
+# calmoji/ebi48.py
 
 import datetime
-from typing import Mapping
+from collections.abc import Mapping  # Not typing: this module is on the fast `calmoji ebi48` path
 
 """
 EBI48_CLOCK — The Canonical Emoji Time Table
@@ -88,6 +88,16 @@ def get_emoji_for_time(dt: datetime.datetime) -> tuple[str, str]:
 
     return get_emoji_for_slot(slot)
 
+def get_slot_for_time(dt: datetime.datetime) -> int:
+    """Return the 0–47 slot whose half hour (hh:05 or hh:35 onwards) contains `dt`."""
+    return ((dt.hour * 60 + dt.minute - 5) % 1440) // 30
+
+def slot_time_range(slot: int) -> tuple[str, str]:
+    """Return the ('HH:MM', 'HH:MM') UTC start and end of a slot's meeting window."""
+    start = slot * 30 + 5
+    end = start + 25
+    return f"{start // 60:02d}:{start % 60:02d}", f"{end // 60 % 24:02d}:{end % 60:02d}"
+
 def get_slot_index_for_emoji(emoji: str) -> int:
     for idx, (e, _) in EBI48_CLOCK.items():
         if e == emoji:
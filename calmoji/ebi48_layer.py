@@ -0,0 +1,200 @@
+# calmoji/ebi48_layer.py
+
+"""
+The EBI48 layer for any date range, recurring or fully expanded.
+
+The layer holds the 48 EBI48 slots of every Saturday in the range. Recurring
+mode writes 48 weekly RRULE masters; expanded mode writes every instance, for
+clients without RRULE support:
+
+    first, weeks = layer_weeks(date(2025, 1, 1), date(2034, 12, 31))
+    with open("ebi48.ics", "wb") as f:
+        write_layer_body(f, first, weeks, recurring=False)
+
+Expanded instances differ from one Saturday to the next only in their date,
+so each slot is rendered once through `Event.to_ics`, encoded, and split at
+the date. A Saturday is then one `bytes.join` of the 48 pre-encoded slot
+templates with that day's date, and the cost grows linearly with the number
+of weeks. Expanded instances use `ebi48_instance_uid` (their start time) as
+UID rather than a hash per event.
+"""
+
+import datetime
+from functools import lru_cache
+from typing import BinaryIO, Iterator, Optional
+
+from calmoji.ebi48 import EBI48_CLOCK
+from calmoji.exclusions import Exclusions
+from calmoji.types import Event
+from calmoji.uid import ebi48_instance_uid, generate_uid
+
+LAYER_WEEKDAY = 5  # Saturday
+SLOTS = 48
+SLOT_DURATION = datetime.timedelta(minutes=25)
+ONE_WEEK = datetime.timedelta(weeks=1)
+
+# Placeholders for the dates in a slot template (never produced by to_ics)
+_DAY = b"\x00"
+_NEXT_DAY = b"\x01"  # The last slot ends at midnight, on the following day
+_TEMPLATE_DAY = datetime.datetime(2000, 1, 1)  # A Saturday
+
+
+def slot_start(day: datetime.datetime, slot: int) -> datetime.datetime:
+    """Start of `slot` (hh:05 or hh:35 UTC) on `day`."""
+    return day + datetime.timedelta(minutes=slot * 30 + 5)
+
+
+def slot_summary(slot: int) -> str:
+    emoji, label = EBI48_CLOCK[slot]
+    return f"{emoji} {label} — EBI48"
+
+
+def slot_description(slot: int, version: int) -> str:
+    emoji, label = EBI48_CLOCK[slot]
+    minutes = slot * 30 + 5
+    return (
+        f"{emoji} {label} — Canonical EBI48 time at {minutes // 60:02d}:{minutes % 60:02d} UTC\n"
+        f"This slot is part of the EBI48 symbolic clock.\n"
+        f"🕒 UTC only — times do not shift with local time.\n"
+        f"v{version} — https://ebi48.org"
+    )
+
+
+def layer_weeks(first: datetime.date, last: datetime.date) -> tuple[datetime.date, int]:
+    """
+    The Saturdays of an inclusive date range, as (first Saturday, number of weeks).
+
+    Raises:
+        ValueError: If `last` is before `first`.
+    """
+    if last < first:
+        raise ValueError(f"EBI48 layer range ends ({last}) before it starts ({first})")
+    saturday = first + datetime.timedelta(days=(LAYER_WEEKDAY - first.weekday()) % 7)
+    return saturday, max(0, (last - saturday).days // 7 + 1)
+
+
+def _midnight(day: datetime.date) -> datetime.datetime:
+    return datetime.datetime(day.year, day.month, day.day)
+
+
+def iter_layer_events(
+    first: datetime.date,
+    weeks: int,
+    recurring: bool = True,
+    exclusions: Optional[Exclusions] = None,
+    version: Optional[int] = None,
+) -> Iterator[Event]:
+    """
+    Yield the layer's events in start-time order.
+
+    Args:
+        first: The first Saturday of the layer.
+        weeks: Number of Saturdays.
+        recurring: 48 weekly RRULE masters (blocked weeks become EXDATEs)
+            instead of every instance (blocked instances are dropped).
+        exclusions: Holidays and closures.
+        version: Year shown in the descriptions (default: the first Saturday's year).
+    """
+    version = version or first.year
+    day = _midnight(first)
+    for week in range(1 if recurring else weeks):
+        for slot in range(SLOTS):
+            start = slot_start(day, slot)
+            end = start + SLOT_DURATION
+            summary = slot_summary(slot)
+            if recurring:
+                exdates = []
+                if exclusions is not None:
+                    exdates = exclusions.blocked_occurrences(start, SLOT_DURATION, ONE_WEEK, weeks)
+                uid, recurrence = generate_uid(start, summary), f"FREQ=WEEKLY;COUNT={weeks}"
+            else:
+                if exclusions is not None and exclusions.blocks(start, end):
+                    continue
+                exdates, uid, recurrence = [], ebi48_instance_uid(start), None
+            yield Event(
+                start=start,
+                end=end,
+                summary=summary,
+                description=slot_description(slot, version),
+                emoji=EBI48_CLOCK[slot][0],
+                recurrence=recurrence,
+                exdates=exdates,
+                uid=uid,
+                kind="ebi48",
+            )
+        day += ONE_WEEK
+
+
+@lru_cache(maxsize=16)
+def slot_templates(version: int) -> tuple[bytes, ...]:
+    """Each slot's expanded VEVENT, encoded, with its dates replaced by placeholders."""
+    day = _TEMPLATE_DAY.strftime("%Y%m%d")
+    next_day = (_TEMPLATE_DAY + datetime.timedelta(days=1)).strftime("%Y%m%d")
+    events = iter_layer_events(_TEMPLATE_DAY.date(), 1, recurring=False, version=version)
+    return tuple(
+        event.to_ics().encode("utf-8").replace(day.encode(), _DAY).replace(next_day.encode(), _NEXT_DAY)
+        for event in events
+    )
+
+
+@lru_cache(maxsize=16)
+def _day_parts(version: int) -> tuple[list[bytes], list[bytes]]:
+    # A whole Saturday, split at its dates: (parts before the next-day date, parts after it)
+    head, tail = b"".join(slot_templates(version)).split(_NEXT_DAY)
+    return head.split(_DAY), tail.split(_DAY)
+
+
+def iter_layer_bytes(
+    first: datetime.date,
+    weeks: int,
+    recurring: bool = True,
+    exclusions: Optional[Exclusions] = None,
+    version: Optional[int] = None,
+) -> Iterator[tuple[bytes, int]]:
+    """
+    Yield the layer's VEVENTs as (encoded chunk, events in it).
+
+    Recurring mode yields the 48 masters. Expanded mode yields one chunk per
+    Saturday, assembled from the pre-encoded slot templates; the bytes equal
+    `Event.to_ics` of `iter_layer_events(..., recurring=False)`.
+    """
+    version = version or first.year
+    if recurring:
+        for event in iter_layer_events(first, weeks, True, exclusions, version):
+            yield event.to_ics().encode("utf-8"), 1
+        return
+
+    head, tail = _day_parts(version)
+    templates = slot_templates(version)
+    day = _midnight(first)
+    for _ in range(weeks):
+        date = day.strftime("%Y%m%d").encode()
+        next_date = (day + datetime.timedelta(days=1)).strftime("%Y%m%d").encode()
+        day_end = slot_start(day, SLOTS - 1) + SLOT_DURATION
+        if exclusions is None or not exclusions.blocks(slot_start(day, 0), day_end):
+            yield date.join(head) + next_date + date.join(tail), SLOTS
+        else:
+            kept = [
+                template.replace(_DAY, date).replace(_NEXT_DAY, next_date)
+                for slot, template in enumerate(templates)
+                if not exclusions.blocks(slot_start(day, slot), slot_start(day, slot) + SLOT_DURATION)
+            ]
+            if kept:
+                yield b"".join(kept), len(kept)
+        day += ONE_WEEK
+
+
+def write_layer_body(
+    f: BinaryIO,
+    first: datetime.date,
+    weeks: int,
+    recurring: bool = True,
+    exclusions: Optional[Exclusions] = None,
+    version: Optional[int] = None,
+) -> int:
+    """Write the layer's VEVENTs to a binary file and return how many were written."""
+    written = 0
+    for chunk, count in iter_layer_bytes(first, weeks, recurring, exclusions, version):
+        f.write(chunk)
+        written += count
+    return written
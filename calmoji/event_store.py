@@ -0,0 +1,264 @@
+# calmoji/event_store.py
+
+"""
+Persistent binary event store with memory-mapped random access.
+
+Generating a year of events just to look some up is wasteful, so generated
+events can be saved once into a compact `.calstore` file and reopened in
+milliseconds:
+
+    write_event_store("output/events.calstore", iter_combined(phases))
+    with EventStore("output/events.calstore") as store:
+        for record in store.between(date(2025, 1, 6), date(2025, 1, 10)):
+            print(record.start, record.kind, record.city)
+
+Layout (little-endian):
+
+    header    HEADER        magic, version, record size/count, day range, section offsets
+    records   RECORD × n    start minute, end minute, kind, city, EBI48 slot, phase
+    day index uint32 × d+1  first record starting on or after each day
+    strings   UTF-8 JSON    {"kinds": [...], "cities": [...], "phases": [...]}
+
+Times are minutes since the Unix epoch (UTC); the day index is native
+uint32, which is little-endian on every platform calmoji targets. Records
+are sorted by start, so a date-range lookup is two day-index reads and a
+slice; only the pages holding those records are ever touched, and nothing
+becomes a Python object until it is accessed.
+"""
+
+import datetime
+import json
+import mmap
+import os
+import struct
+from array import array
+from typing import Iterable, Iterator, NamedTuple, Optional, Union
+
+from calmoji.timezones import EPOCH, SECONDS_PER_DAY, utc_timestamp
+from calmoji.types import Event
+
+PathLike = Union[str, os.PathLike]
+
+STORE_MAGIC = b"CALMOJI\x00"
+STORE_FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<8sHHIiIQQ")  # magic, version, record size, count, first day, days, index offset, strings offset
+RECORD = struct.Struct("<iiBBBB")  # start minute, end minute, kind, city, slot, phase
+
+RAW_CHUNK_RECORDS = 4096  # Records copied out of the map per step of iter_raw
+NONE_CODE = 255  # "No city / slot / phase" in the one-byte fields
+MINUTES_PER_DAY = 1440
+
+
+class StoredEvent(NamedTuple):
+    """One decoded record."""
+    start_minute: int
+    end_minute: int
+    kind: str
+    city: Optional[str]
+    slot: Optional[int]
+    phase: Optional[str]
+
+    @property
+    def start(self) -> datetime.datetime:
+        return EPOCH + datetime.timedelta(minutes=self.start_minute)
+
+    @property
+    def end(self) -> datetime.datetime:
+        return EPOCH + datetime.timedelta(minutes=self.end_minute)
+
+
+def _minutes(value: Union[datetime.datetime, datetime.date]) -> int:
+    return utc_timestamp(value) // 60
+
+
+def ebi48_slot_of(start_minute: int) -> int:
+    """EBI48 slot index for a start time on an :05/:35 boundary, else NONE_CODE."""
+    minute_of_day = start_minute % MINUTES_PER_DAY
+    return (minute_of_day - 5) // 30 if minute_of_day % 30 == 5 else NONE_CODE
+
+
+class _StringTable:
+    """Assigns one-byte codes to strings in first-seen order."""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.codes: dict[str, int] = {}
+
+    def code(self, value: Optional[str]) -> int:
+        if value is None:
+            return NONE_CODE
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.codes)
+            if code >= NONE_CODE:
+                raise ValueError(f"Too many distinct {self.label} values for the store (max {NONE_CODE})")
+            self.codes[value] = code
+        return code
+
+    def values(self) -> list[str]:
+        return list(self.codes)
+
+
+def write_event_store(path: PathLike, events: Iterable[Event]) -> int:
+    """
+    Stream start-sorted events into a `.calstore` file.
+
+    Args:
+        path: Target file.
+        events: Events in start order (e.g. from `iter_combined`).
+
+    Returns:
+        int: Number of records written.
+
+    Raises:
+        ValueError: If events are not sorted by start.
+    """
+    kinds, cities, phases = _StringTable("kind"), _StringTable("city"), _StringTable("phase")
+    day_index = array("I")
+    first_day: Optional[int] = None
+    count = 0
+    previous_start = None
+
+    with open(path, "wb") as f:
+        f.write(b"\0" * HEADER.size)  # Placeholder until the counts are known
+        for event in events:
+            start, end = _minutes(event.start), _minutes(event.end)
+            if previous_start is not None and start < previous_start:
+                raise ValueError(f"Events must be sorted by start: {event.summary} at {event.start}")
+            previous_start = start
+
+            day = start // MINUTES_PER_DAY
+            if first_day is None:
+                first_day = day
+            while first_day + len(day_index) <= day:
+                day_index.append(count)  # Every day up to this one starts at the current record
+
+            f.write(RECORD.pack(
+                start, end,
+                kinds.code(event.kind),
+                cities.code(event.city),
+                ebi48_slot_of(start) if not event.all_day else NONE_CODE,
+                phases.code(event.phase),
+            ))
+            count += 1
+
+        if first_day is None:
+            first_day = 0
+        day_index.append(count)  # Sentinel: end of the last day
+        index_offset = HEADER.size + count * RECORD.size
+        f.write(day_index.tobytes())
+
+        strings_offset = f.tell()
+        f.write(json.dumps(
+            {"kinds": kinds.values(), "cities": cities.values(), "phases": phases.values()},
+            ensure_ascii=False,
+        ).encode("utf-8"))
+
+        f.seek(0)
+        f.write(HEADER.pack(
+            STORE_MAGIC, STORE_FORMAT_VERSION, RECORD.size, count,
+            first_day, len(day_index) - 1, index_offset, strings_offset,
+        ))
+    return count
+
+
+class EventStore:
+    """Read-only, memory-mapped view of a `.calstore` file."""
+
+    def __init__(self, path: PathLike):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path}: empty file is not an event store")
+
+        if len(self._mm) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path}: too short to be an event store")
+        magic, version, record_size, count, first_day, num_days, index_offset, strings_offset = (
+            HEADER.unpack_from(self._mm, 0)
+        )
+        if magic != STORE_MAGIC or version != STORE_FORMAT_VERSION or record_size != RECORD.size:
+            self.close()
+            raise ValueError(f"{path}: not a calmoji event store (or unsupported version {version})")
+
+        self.count = count
+        self.first_day = first_day
+        self.num_days = num_days
+        self._view = memoryview(self._mm)
+        self._day_index = self._view[index_offset:index_offset + 4 * (num_days + 1)].cast("I")
+        strings = json.loads(bytes(self._view[strings_offset:]).decode("utf-8"))
+        self.kinds: list[str] = strings["kinds"]
+        self.cities: list[str] = strings["cities"]
+        self.phases: list[str] = strings["phases"]
+
+    def __enter__(self) -> "EventStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if getattr(self, "_day_index", None) is not None:
+            self._day_index.release()
+            self._view.release()
+            self._day_index = None
+        self._mm.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _decode(self, raw: tuple[int, int, int, int, int, int]) -> StoredEvent:
+        start, end, kind, city, slot, phase = raw
+        return StoredEvent(
+            start, end,
+            self.kinds[kind],
+            self.cities[city] if city != NONE_CODE else None,
+            slot if slot != NONE_CODE else None,
+            self.phases[phase] if phase != NONE_CODE else None,
+        )
+
+    def __getitem__(self, i: int) -> StoredEvent:
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        return self._decode(RECORD.unpack_from(self._mm, HEADER.size + i * RECORD.size))
+
+    def span(self, first: datetime.date, last: datetime.date) -> tuple[int, int]:
+        """Record positions [lo, hi) of events starting on days first…last (inclusive)."""
+        lo_day = utc_timestamp(first) // SECONDS_PER_DAY - self.first_day
+        hi_day = utc_timestamp(last) // SECONDS_PER_DAY - self.first_day + 1
+        lo_day, hi_day = min(max(lo_day, 0), self.num_days), min(max(hi_day, 0), self.num_days)
+        if hi_day <= lo_day:
+            return 0, 0
+        return self._day_index[lo_day], self._day_index[hi_day]
+
+    def iter_raw(self, lo: int = 0, hi: Optional[int] = None) -> Iterator[tuple[int, int, int, int, int, int]]:
+        """
+        Undecoded record tuples for positions [lo, hi), from the mapped pages.
+
+        Records are copied out RAW_CHUNK_RECORDS at a time rather than
+        unpacked from a view of the map, so no buffer stays exported and the
+        store can be closed while an iterator is still alive.
+        """
+        hi = self.count if hi is None else hi
+        for chunk_lo in range(lo, hi, RAW_CHUNK_RECORDS):
+            chunk_hi = min(hi, chunk_lo + RAW_CHUNK_RECORDS)
+            yield from RECORD.iter_unpack(
+                self._mm[HEADER.size + chunk_lo * RECORD.size:HEADER.size + chunk_hi * RECORD.size]
+            )
+
+    def between(self, first: datetime.date, last: datetime.date) -> Iterator[StoredEvent]:
+        """Decoded events starting on days first…last (inclusive, UTC)."""
+        lo, hi = self.span(first, last)
+        for raw in self.iter_raw(lo, hi):
+            yield self._decode(raw)
+
+    def __iter__(self) -> Iterator[StoredEvent]:
+        for raw in self.iter_raw():
+            yield self._decode(raw)
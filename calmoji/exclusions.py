@@ -0,0 +1,249 @@
+# calmoji/exclusions.py
+
+"""
+Holiday and exclusion calendars, loaded once into sorted interval indexes.
+
+Exclusions come from ICS files (e.g. an institution's holiday calendar),
+plain date lists, and per-city holidays. Everything is normalized to
+half-open [start, end) UTC epoch-second intervals, sorted and merged, so
+rejecting a candidate slot is one `bisect` however many thousands of
+entries were loaded:
+
+    exclusions = build_exclusions(ics=["holidays.ics"], city_holidays="city_holidays.json")
+    events = generate_meeting_slots(phase, exclusions=exclusions)
+
+Date lists hold one `YYYY-MM-DD` (UTC day) or `YYYY-MM-DD..YYYY-MM-DD`
+(inclusive range) per line, with `#` comments. Per-city holidays are local
+calendar days, converted to UTC with the city's real zone rules.
+"""
+
+import datetime
+import json
+import os
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Union
+
+from calmoji.ics_reader import VEventRecord, iter_vevents, parse_ics_datetime, record_to_event
+from calmoji.reporter import get_reporter
+from calmoji.rrule import Recurrence, RecurrenceRule
+from calmoji.timezones import SECONDS_PER_DAY, resolve_tz_name, to_utc, utc_timestamp
+
+PathLike = Union[str, os.PathLike]
+DateLike = Union[datetime.date, str]
+Window = tuple[datetime.datetime, datetime.datetime]  # Naive UTC [start, end)
+
+
+@dataclass(frozen=True)
+class IntervalIndex:
+    """Sorted, non-overlapping [start, end) intervals in UTC epoch seconds."""
+    starts: tuple[int, ...] = ()
+    ends: tuple[int, ...] = ()
+
+    @classmethod
+    def from_intervals(cls, intervals: Iterable[tuple[int, int]]) -> "IntervalIndex":
+        """Sort and merge intervals; touching or overlapping intervals become one."""
+        merged: list[list[int]] = []
+        for start, end in sorted(intervals):
+            if end <= start:
+                continue
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        return cls(tuple(s for s, _ in merged), tuple(e for _, e in merged))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def overlaps(self, start_ts: int, end_ts: int) -> bool:
+        """True if [start_ts, end_ts) intersects any interval."""
+        i = bisect_right(self.starts, start_ts) - 1
+        if i >= 0 and self.ends[i] > start_ts:
+            return True
+        return i + 1 < len(self.starts) and self.starts[i + 1] < end_ts
+
+
+@dataclass(frozen=True)
+class Exclusions:
+    """Exclusions that apply everywhere, plus per-city holidays."""
+    everywhere: IntervalIndex = field(default_factory=IntervalIndex)
+    by_city: dict[str, IntervalIndex] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.everywhere) + sum(len(index) for index in self.by_city.values())
+
+    def blocks(self, start: datetime.datetime, end: datetime.datetime, city: Optional[str] = None) -> bool:
+        """True if an event from `start` to `end` (naive UTC) in `city` falls on an exclusion."""
+        start_ts, end_ts = utc_timestamp(start), utc_timestamp(end)
+        if self.everywhere.overlaps(start_ts, end_ts):
+            return True
+        index = self.by_city.get(city) if city else None
+        return index is not None and index.overlaps(start_ts, end_ts)
+
+    def blocked_occurrences(
+        self,
+        first_start: datetime.datetime,
+        duration: datetime.timedelta,
+        step: datetime.timedelta,
+        count: int,
+        city: Optional[str] = None,
+    ) -> list[datetime.datetime]:
+        """Start times of the occurrences of a fixed-step series that fall on an exclusion (for EXDATE)."""
+        blocked = []
+        for k in range(count):
+            start = first_start + k * step
+            if self.blocks(start, start + duration, city):
+                blocked.append(start)
+        return blocked
+
+
+# 📥 Loaders — each returns (start_ts, end_ts) intervals
+
+def _as_date(value: DateLike) -> datetime.date:
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(value.strip())
+
+
+def _date_span(token: DateLike) -> tuple[datetime.date, datetime.date]:
+    """Return the inclusive (first, last) days of a date or 'A..B' range token."""
+    if isinstance(token, str) and ".." in token:
+        first, _, last = token.partition("..")
+        first, last = _as_date(first), _as_date(last)
+        if last < first:
+            raise ValueError(f"Date range ends before it starts: {token}")
+        return first, last
+    day = _as_date(token)
+    return day, day
+
+
+def date_intervals(dates: Iterable[DateLike]) -> list[tuple[int, int]]:
+    """Whole UTC days (or inclusive 'A..B' ranges) as intervals."""
+    intervals = []
+    for token in dates:
+        first, last = _date_span(token)
+        intervals.append((utc_timestamp(first), utc_timestamp(last) + SECONDS_PER_DAY))
+    return intervals
+
+
+def read_date_list(path: PathLike) -> list[str]:
+    """Read date tokens from a text file: one per line, '#' starts a comment."""
+    tokens = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            token = line.split("#", 1)[0].strip()
+            if token:
+                tokens.append(token)
+    return tokens
+
+
+def _recurring_starts(
+    path: PathLike, record: VEventRecord, start: datetime.datetime, duration: datetime.timedelta, window: Optional[Window]
+) -> list[datetime.datetime]:
+    """
+    Occurrence starts of a recurring closure, minus its EXDATEs.
+
+    Unbounded rules are expanded over `window` (padded back by the event's
+    duration, so an occurrence running into the window counts). A rule that
+    cannot be expanded keeps only its first occurrence, with a warning.
+    """
+    try:
+        recurrence = Recurrence.from_event(record_to_event(record))
+        if window is None and not recurrence.bounded:
+            raise ValueError("repeats forever and no date window was given")
+        if window is None:
+            return list(recurrence)
+        return list(recurrence.between(window[0] - duration, window[1]))
+    except ValueError as e:
+        name = record.summary or record.uid or record.dtstart
+        get_reporter().info(f"⚠️ {path}: '{name}' RRULE not expanded ({e}); only its first occurrence is excluded")
+        return [start]
+
+
+def ics_intervals(path: PathLike, window: Optional[Window] = None) -> list[tuple[int, int]]:
+    """
+    Intervals for every VEVENT in an .ics file (cancelled events are skipped).
+
+    All-day events cover their UTC days; timed events with a TZID are
+    converted to UTC. Recurring events (DAILY or WEEKLY RRULEs, with EXDATE)
+    contribute each occurrence; unbounded rules only within `window`.
+    """
+    intervals = []
+    for record in iter_vevents(path):
+        if record.status and record.status.upper() == "CANCELLED":
+            continue
+        start = parse_ics_datetime(record.dtstart)
+        if record.all_day or not isinstance(start, datetime.datetime):
+            end = parse_ics_datetime(record.dtend) if record.dtend else start + datetime.timedelta(days=1)
+        else:
+            end = parse_ics_datetime(record.dtend) if record.dtend else start
+            if record.tzid:
+                start, end = to_utc(start, record.tzid), to_utc(end, record.tzid)
+        duration = end - start
+        starts = _recurring_starts(path, record, start, duration, window) if record.rrule else [start]
+        for first in starts:
+            # A zero-length timed event still blocks the instant it marks
+            intervals.append((utc_timestamp(first), max(utc_timestamp(first + duration), utc_timestamp(first) + 1)))
+    return intervals
+
+
+def city_holiday_intervals(city: str, dates: Iterable[DateLike]) -> list[tuple[int, int]]:
+    """Local calendar days in `city` (a MEETING_SLOTS city or IANA zone) as UTC intervals."""
+    tz_name = resolve_tz_name(city)
+    intervals = []
+    for token in dates:
+        first, last = _date_span(token)
+        local_start = datetime.datetime.combine(first, datetime.time())
+        local_end = datetime.datetime.combine(last + datetime.timedelta(days=1), datetime.time())
+        intervals.append((utc_timestamp(to_utc(local_start, tz_name)), utc_timestamp(to_utc(local_end, tz_name))))
+    return intervals
+
+
+def load_city_holidays(path: PathLike) -> dict[str, list[str]]:
+    """Read a JSON object mapping city names to lists of date tokens."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected a JSON object of city → dates")
+    return {city: list(dates) for city, dates in data.items()}
+
+
+def build_exclusions(
+    ics: Iterable[PathLike] = (),
+    date_lists: Iterable[PathLike] = (),
+    dates: Iterable[DateLike] = (),
+    city_holidays: Optional[Union[PathLike, dict[str, Iterable[DateLike]]]] = None,
+    window: Optional[Window] = None,
+) -> Exclusions:
+    """
+    Load every exclusion source once and index it.
+
+    Args:
+        ics: .ics files whose events apply to every city.
+        date_lists: Text files of UTC day tokens (see module docstring).
+        dates: Extra UTC day tokens or `date` objects.
+        city_holidays: city → local day tokens, or a JSON file of the same.
+        window: The naive UTC [start, end) being generated; recurring ICS
+            events that never end are expanded over it.
+
+    Returns:
+        Exclusions: Ready for `generate_meeting_slots(..., exclusions=...)`.
+    """
+    intervals: list[tuple[int, int]] = []
+    for path in ics:
+        intervals.extend(ics_intervals(path, window))
+    for path in date_lists:
+        intervals.extend(date_intervals(read_date_list(path)))
+    intervals.extend(date_intervals(dates))
+
+    if city_holidays is not None and not isinstance(city_holidays, dict):
+        city_holidays = load_city_holidays(city_holidays)
+    by_city = {
+        city: IntervalIndex.from_intervals(city_holiday_intervals(city, days))
+        for city, days in (city_holidays or {}).items()
+    }
+    return Exclusions(IntervalIndex.from_intervals(intervals), by_city)
+
@@ -0,0 +1,230 @@
+# calmoji/exporters.py
+
+"""
+Streaming NDJSON, CSV and jCal (RFC 7265) exporters.
+
+Every meeting slot, focus block and phase marker becomes a flat record:
+
+    kind, city, slot (EBI48 index), glyph, face, phase, density, start, end (UTC)
+
+`iter_records` formats the same day plans as the event generators
+(`spec.iter_day_plans`), but never builds Event objects or calls
+`Event.to_ics`.
+Each (template, phase) pair yields one shared RecordFields tuple, and the
+exporters encode the static part of its output (JSON prefix, CSV tail, jCal
+properties) once and reuse it, so per record only the start/end strings are
+joined in. Output is written in large chunks, keeping multi-year exports
+I/O-bound.
+"""
+
+import csv
+import datetime
+import io
+import json
+import os
+from hashlib import sha256
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional, Union
+
+from calmoji.exclusions import Exclusions
+from calmoji.spec import ScheduleSpec, default_spec, iter_day_plans, phase_days
+from calmoji.types import Phase
+
+PathLike = Union[str, os.PathLike]
+
+EXPORT_FORMATS = ("ndjson", "csv", "jcal")
+EXPORT_FIELDS = ("kind", "city", "slot", "glyph", "face", "phase", "density", "start", "end")
+CHUNK_RECORDS = 8192
+
+
+class RecordFields(NamedTuple):
+    """The static part of a record, shared by every occurrence of one template in one phase."""
+    kind: str
+    city: Optional[str]
+    slot: Optional[int]
+    glyph: Optional[str]
+    face: Optional[str]
+    phase: str
+    density: str
+    summary: str
+
+
+Record = tuple[str, str, RecordFields]  # (start, end, fields); times are ISO 8601 UTC ('…T…Z' or a date)
+
+
+# 🧱 Record generation
+
+def _clock_pair(t) -> tuple[str, str]:
+    return f"T{t.start_hour:02d}:{t.start_minute:02d}:00Z", f"T{t.end_hour:02d}:{t.end_minute:02d}:00Z"
+
+
+def iter_records(
+    phases: Iterable[Phase],
+    exclusions: Optional[Exclusions] = None,
+    phase_markers: bool = True,
+    meetings: bool = True,
+    focus_blocks: bool = True,
+    spec: Optional[ScheduleSpec] = None,
+) -> Iterator[Record]:
+    """
+    Yield (start, end, fields) for every phase marker, meeting slot and focus block, in start order.
+
+    The days and their slots come from `iter_day_plans`, the same schedule
+    `iter_meeting_slots` and `iter_focus_block_events` format as events.
+    """
+    spec = spec or default_spec()
+    clocks = {id(t): _clock_pair(t) for t in (*spec.meeting_slots, *spec.focus_blocks)}
+
+    for phase in phases:
+        if phase_markers:
+            yield (
+                phase.start.date().isoformat(),
+                (phase.end.date() + datetime.timedelta(days=1)).isoformat(),
+                RecordFields("phase", None, None, phase.emoji, None, phase.name, phase.meeting_density, phase.name),
+            )
+
+        # One (fields, start clock, end clock) entry per template for this phase, looked up by identity
+        entries = {
+            id(t): (RecordFields("meeting", t.city, t.slot, t.glyph, t.face, phase.name, phase.meeting_density,
+                                 f"{t.city} {t.glyph} {t.face} Slot ({t.label})"), *clocks[id(t)])
+            for t in spec.meeting_slots
+        }
+        entries.update(
+            (id(t), (RecordFields("focus", None, None, t.glyph, None, phase.name, phase.meeting_density,
+                                  f"{t.glyph} Focus Block"), *clocks[id(t)]))
+            for t in spec.focus_blocks
+        )
+        days = phase_days(phase)
+        for day, plan in iter_day_plans(days, phase, exclusions, spec, meetings=meetings, focus_blocks=focus_blocks):
+            date_str = day.strftime("%Y-%m-%d")
+            for t in plan:
+                fields, start_clock, end_clock = entries[id(t)]
+                yield date_str + start_clock, date_str + end_clock, fields
+
+
+# ✍️ Writers
+
+def _write_chunked(f, records: Iterable[Record], encode: Callable[[str, str, RecordFields], str], separator: str = "") -> int:
+    """Encode records and write them in chunks of CHUNK_RECORDS; returns the record count."""
+    count = 0
+    chunk: list[str] = []
+    for start, end, fields in records:
+        chunk.append(encode(start, end, fields))
+        if len(chunk) >= CHUNK_RECORDS:
+            f.write((separator if count else "") + separator.join(chunk))
+            count += len(chunk)
+            chunk = []
+    if chunk:
+        f.write((separator if count else "") + separator.join(chunk))
+        count += len(chunk)
+    return count
+
+
+def write_ndjson(records: Iterable[Record], path: PathLike) -> int:
+    """One JSON object per line, keys in EXPORT_FIELDS order."""
+    prefixes: dict[RecordFields, str] = {}
+
+    def encode(start: str, end: str, fields: RecordFields) -> str:
+        prefix = prefixes.get(fields)
+        if prefix is None:
+            static = {name: getattr(fields, name) for name in EXPORT_FIELDS[:-2]}
+            prefix = prefixes[fields] = json.dumps(static, ensure_ascii=False)[:-1] + ', "start": "'
+        return f'{prefix}{start}", "end": "{end}"}}\n'
+
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        return _write_chunked(f, records, encode)
+
+
+def write_csv(records: Iterable[Record], path: PathLike) -> int:
+    """RFC 4180 CSV with a header row, columns start, end, then the static fields."""
+    tails: dict[RecordFields, str] = {}
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def encode(start: str, end: str, fields: RecordFields) -> str:
+        tail = tails.get(fields)
+        if tail is None:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerow(["" if value is None else value for value in (getattr(fields, n) for n in EXPORT_FIELDS[:-2])])
+            tail = tails[fields] = buffer.getvalue()
+        return f"{start},{end},{tail}"
+
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(",".join(("start", "end") + EXPORT_FIELDS[:-2]) + "\r\n")
+        return _write_chunked(f, records, encode)
+
+
+def record_uid(start: str, summary: str) -> str:
+    """
+    The UID `Event` would assign, computed from the record's start string.
+
+    Same result as `event_uid`, minus the datetime parsing and formatting.
+    """
+    if "T" in start:
+        iso = start[:-1]  # Drop the Z
+        compact = iso.replace("-", "").replace(":", "")
+        label_stamp = compact
+    else:
+        iso = start + "T00:00:00"  # All-day Events hash their midnight start
+        compact = start.replace("-", "") + "T000000"
+        label_stamp = start.replace("-", "")
+    label = int(sha256((summary + label_stamp).encode()).hexdigest(), 16) & 0xffffffff
+    digest = sha256(f"calmoji:{iso}:{label}".encode("utf-8")).hexdigest()[:16]
+    return f"{digest}-{compact}@calmoji.local"
+
+
+def write_jcal(records: Iterable[Record], path: PathLike, calname: str = "🧿 calmoji export") -> int:
+    """A single RFC 7265 jCal document: ["vcalendar", [properties], [vevents…]]."""
+    properties: dict[RecordFields, str] = {}
+
+    def encode(start: str, end: str, fields: RecordFields) -> str:
+        static = properties.get(fields)
+        if static is None:
+            props = [["summary", {}, "text", fields.summary], ["x-calmoji-kind", {}, "text", fields.kind]]
+            for name in ("city", "glyph", "face", "phase", "density"):
+                value = getattr(fields, name)
+                if value is not None:
+                    props.append([f"x-calmoji-{name}", {}, "text", value])
+            if fields.slot is not None:
+                props.append(["x-calmoji-slot", {}, "integer", fields.slot])
+            static = properties[fields] = json.dumps(props, ensure_ascii=False)[1:-1]
+
+        start_type = "date-time" if "T" in start else "date"
+        return (
+            f'["vevent", [["uid", {{}}, "text", "{record_uid(start, fields.summary)}"], '
+            f'["dtstart", {{}}, "{start_type}", "{start}"], ["dtend", {{}}, "{start_type}", "{end}"], '
+            f"{static}], []]"
+        )
+
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        head = [
+            ["version", {}, "text", "2.0"],
+            ["prodid", {}, "text", "-//Threshold Continuity Alliance//calmoji//EN"],
+            ["x-wr-calname", {}, "text", calname],
+        ]
+        f.write(f'["vcalendar", {json.dumps(head, ensure_ascii=False)}, [\n')
+        count = _write_chunked(f, records, encode, separator=",\n")
+        f.write("\n]]\n")
+    return count
+
+
+WRITERS: dict[str, Callable[[Iterable[Record], PathLike], int]] = {
+    "ndjson": write_ndjson,
+    "csv": write_csv,
+    "jcal": write_jcal,
+}
+
+EXTENSIONS = {"ndjson": "ndjson", "csv": "csv", "jcal": "jcal.json"}
+
+
+def export_records(
+    fmt: str,
+    phases: list[Phase],
+    path: PathLike,
+    exclusions: Optional[Exclusions] = None,
+    spec: Optional[ScheduleSpec] = None,
+) -> int:
+    """Stream every record for `phases` to `path` in one of EXPORT_FORMATS; returns the record count."""
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown export format: {fmt} (expected one of {EXPORT_FORMATS})")
+    return WRITERS[fmt](iter_records(phases, exclusions=exclusions, spec=spec), path)
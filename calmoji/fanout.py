@@ -0,0 +1,231 @@
+# calmoji/fanout.py
+
+"""
+Personalized calendar fan-out for many subscribers in one pass.
+
+Each subscriber picks a cut of calmoji: some cities from MEETING_SLOTS,
+optionally the focus blocks, optionally the EBI48 layer, optionally a local
+TZID. Every distinct event is serialized exactly once, into a shared cache of
+byte fragments keyed by (source, tzid). A subscriber's file is then just a
+header plus references to the cached fragments, written with one
+`writelines` call, so the cost per calendar is I/O rather than rendering.
+
+Files are sharded by a hash of the subscriber id (`ab/cd/<id>.ics`) so no
+directory grows past a few hundred entries.
+"""
+
+import json
+import os
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from calmoji.combined import calendar_years
+from calmoji.exclusions import Exclusions
+from calmoji.focus_blocks_writer import iter_focus_block_events
+from calmoji.ics_writer import create_ics_footer, create_ics_header, iter_ebi48_events
+from calmoji.meeting_slots import MEETING_SLOTS
+from calmoji.slot_generator import iter_meeting_slots
+from calmoji.spec import ScheduleSpec
+from calmoji.timezones import check_tz_name, vtimezone_block
+from calmoji.types import Event, Phase
+from calmoji.utils import slugify
+
+PathLike = Union[str, os.PathLike]
+
+KNOWN_CITIES = frozenset(slot[0] for slot in MEETING_SLOTS)
+
+FOCUS_SOURCE = "focus"
+EBI48_SOURCE = "ebi48"
+
+
+@dataclass(frozen=True)
+class Subscriber:
+    """One subscriber's cut of the calendar."""
+    id: str
+    cities: frozenset[str] = frozenset()
+    focus_blocks: bool = False
+    ebi48: bool = False
+    tzid: Optional[str] = None
+
+    def __post_init__(self):
+        unknown = set(self.cities) - KNOWN_CITIES
+        if unknown:
+            raise ValueError(f"Subscriber {self.id}: unknown cities {sorted(unknown)}")
+        if self.tzid:
+            try:
+                object.__setattr__(self, "tzid", check_tz_name(self.tzid))  # Frozen: set once, at load
+            except ValueError as e:
+                raise ValueError(f"Subscriber {self.id}: {e}") from None
+
+    @property
+    def sources(self) -> tuple[str, ...]:
+        """Fragment sources this subscriber needs, in file order."""
+        sources = tuple(sorted(self.cities))
+        if self.focus_blocks:
+            sources += (FOCUS_SOURCE,)
+        if self.ebi48:
+            sources += (EBI48_SOURCE,)
+        return sources
+
+
+def load_subscribers(path: PathLike) -> list[Subscriber]:
+    """
+    Read subscribers from a JSON list of objects:
+
+        [{"id": "ana", "cities": ["Brussels", "Delhi"], "focus_blocks": true, "ebi48": false,
+          "tzid": "Europe/Brussels"}, ...]
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, list):
+        raise ValueError(f"{path}: expected a JSON list of subscribers")
+    return [
+        Subscriber(
+            id=str(entry["id"]),
+            cities=frozenset(entry.get("cities", ())),
+            focus_blocks=bool(entry.get("focus_blocks", False)),
+            ebi48=bool(entry.get("ebi48", False)),
+            tzid=entry.get("tzid"),
+        )
+        for entry in data
+    ]
+
+
+def shard_path(output_dir: PathLike, subscriber_id: str, levels: int = 2) -> Path:
+    """Return output_dir/ab/cd/<id>.ics, sharded by a hash of the subscriber id."""
+    digest = blake2b(subscriber_id.encode("utf-8"), digest_size=8).hexdigest()
+    shards = [digest[2 * i:2 * i + 2] for i in range(levels)]
+    return Path(output_dir, *shards, f"{slugify(subscriber_id) or digest}.ics")
+
+
+class FragmentCache:
+    """
+    Serialized event bytes, built lazily once per (source, tzid).
+
+    Events are generated once per source; each tzid only re-serializes them.
+    """
+
+    def __init__(
+        self,
+        phases: list[Phase],
+        exclusions: Optional[Exclusions] = None,
+        spec: Optional[ScheduleSpec] = None,
+    ):
+        self.phases = phases
+        self.exclusions = exclusions
+        self.spec = spec
+        self.years = calendar_years(phases)
+        self._events: dict[str, list[Event]] = {}
+        self._fragments: dict[tuple[str, Optional[str]], bytes] = {}
+        self._vtimezones: dict[str, bytes] = {}
+
+    def _source_events(self, source: str) -> list[Event]:
+        if not self._events:
+            by_city: dict[str, list[Event]] = defaultdict(list)
+            for phase in self.phases:
+                for event in iter_meeting_slots(phase, exclusions=self.exclusions, spec=self.spec):
+                    by_city[event.city].append(event)
+            self._events.update(by_city)
+        if source not in self._events:
+            if source == FOCUS_SOURCE:
+                self._events[source] = list(iter_focus_block_events(self.phases, exclusions=self.exclusions, spec=self.spec))
+            elif source == EBI48_SOURCE:
+                self._events[source] = [
+                    event for year in self.years for event in iter_ebi48_events(year, exclusions=self.exclusions)
+                ]
+            else:
+                self._events[source] = []  # A known city with no slots (e.g. Oceania disabled)
+        return self._events[source]
+
+    def fragment(self, source: str, tzid: Optional[str] = None) -> bytes:
+        key = (source, tzid)
+        if key not in self._fragments:
+            text = "".join(event.to_ics(tzid=tzid) for event in self._source_events(source))
+            self._fragments[key] = text.encode("utf-8")
+        return self._fragments[key]
+
+    def vtimezone(self, tzid: str) -> bytes:
+        if tzid not in self._vtimezones:
+            self._vtimezones[tzid] = vtimezone_block(tzid, self.years).encode("utf-8")
+        return self._vtimezones[tzid]
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+
+@dataclass
+class FanoutReport:
+    """What a fan-out run produced."""
+    calendars: int = 0
+    bytes_written: int = 0
+    fragments: int = 0
+    seconds: float = 0.0
+    paths: list[Path] = field(default_factory=list)
+
+    @property
+    def calendars_per_second(self) -> float:
+        return self.calendars / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"📬 {self.calendars} calendars from {self.fragments} fragments, "
+            f"{self.bytes_written / 1e6:.1f} MB in {self.seconds:.2f} s "
+            f"({self.calendars_per_second:,.0f} calendars/s)"
+        )
+
+
+def render_fanout(
+    subscribers: Iterable[Subscriber],
+    phases: list[Phase],
+    output_dir: PathLike = "output/subscribers",
+    exclusions: Optional[Exclusions] = None,
+    spec: Optional[ScheduleSpec] = None,
+) -> FanoutReport:
+    """
+    Render every subscriber's personalized .ics from a shared fragment cache.
+
+    Args:
+        subscribers: Who gets which cut.
+        phases: Phases to cover.
+        output_dir: Root of the sharded output tree.
+        exclusions: Optional holidays/exclusions applied to every source.
+        spec: Schedule to follow (defaults to the built-in one).
+
+    Returns:
+        FanoutReport: Counts, bytes, timing and written paths.
+    """
+    started = time.perf_counter()
+    cache = FragmentCache(phases, exclusions, spec)
+    report = FanoutReport()
+    footer = create_ics_footer().encode("utf-8")
+    made_dirs: set[Path] = set()
+
+    for subscriber in subscribers:
+        header = create_ics_header(
+            calname=f"🧿 calmoji for {subscriber.id}",
+            timezone=subscriber.tzid or "UTC",
+        ).encode("utf-8")
+        parts = [header]
+        if subscriber.tzid:
+            parts.append(cache.vtimezone(subscriber.tzid))
+        parts.extend(cache.fragment(source, subscriber.tzid) for source in subscriber.sources)
+        parts.append(footer)
+
+        path = shard_path(output_dir, subscriber.id)
+        if path.parent not in made_dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            made_dirs.add(path.parent)
+        with open(path, "wb") as f:
+            f.writelines(parts)
+
+        report.calendars += 1
+        report.bytes_written += sum(len(part) for part in parts)
+        report.paths.append(path)
+
+    report.fragments = len(cache)
+    report.seconds = time.perf_counter() - started
+    return report
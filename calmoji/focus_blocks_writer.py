@@ -1,30 +1,48 @@
 # calmoji/focus_blocks_writer.py
 
 from datetime import datetime, timedelta, date, time
-from calmoji.focus_blocks_config import FOCUS_BLOCKS, ACTIVE_WEEKDAYS
+from typing import Iterable, Iterator, Optional
+from calmoji.spec import ScheduleSpec, default_spec, iter_day_plans
 from calmoji.types import Phase, Event
 from calmoji.utils import group_phase_days_by_week, slugify
 from calmoji.ics_writer import write_events_to_ics
-
-
-def generate_focus_block_events_for_days(days: list[datetime]) -> list[Event]:
-    """Generate focus block events for a list of datetime days."""
-    events = []
-    for day in days:
-        if day.weekday() not in ACTIVE_WEEKDAYS:
-            continue
-        for index, (_, sh, sm, eh, em, emoji) in enumerate(FOCUS_BLOCKS):
-            start = day.replace(hour=sh, minute=sm)
-            end = day.replace(hour=eh, minute=em)
-            block_emoji = "⛩️" if index == len(FOCUS_BLOCKS) - 1 else emoji
-            events.append(Event(
+from calmoji.exclusions import Exclusions
+from calmoji.reporter import VERBOSE, get_reporter
+
+
+def iter_focus_block_events_for_days(
+    days: Iterable[datetime],
+    phase: Optional[Phase] = None,
+    exclusions: Optional[Exclusions] = None,
+    spec: Optional[ScheduleSpec] = None,
+) -> Iterator[Event]:
+    """Lazily yield focus block events for start-sorted days, in start-time order."""
+    for day, blocks in iter_day_plans(days, phase, exclusions, spec, meetings=False):
+        for block in blocks:
+            start = day.replace(hour=block.start_hour, minute=block.start_minute)
+            end = day.replace(hour=block.end_hour, minute=block.end_minute)
+            yield Event(
                 start=start,
                 end=end,
-                summary=f"{block_emoji} Focus Block",
+                summary=f"{block.glyph} Focus Block",
                 description=f"Focus block at {start.strftime('%H:%M')} UTC",
-                emoji=block_emoji,
-            ))
-    return events
+                emoji=block.glyph,
+                kind="focus",
+                phase=phase.name if phase else None,
+            )
+
+
+def generate_focus_block_events_for_days(
+    days: list[datetime],
+    phase: Optional[Phase] = None,
+    exclusions: Optional[Exclusions] = None,
+    spec: Optional[ScheduleSpec] = None,
+) -> list[Event]:
+    """Generate focus block events for a list of datetime days, optionally tagged with their phase.
+
+    Blocks that overlap an exclusion (holiday, closure) are skipped.
+    """
+    return list(iter_focus_block_events_for_days(days, phase=phase, exclusions=exclusions, spec=spec))
 
 
 # def generate_focus_block_glyph_key_event(day: datetime) -> Event:
@@ -72,8 +90,15 @@ def generate_focus_block_events_for_days(days: list[datetime]) -> list[Event]:
 #     )
 
 
-def generate_focus_block_glyph_key_event(day: datetime) -> Event:
-    """Return a single all-day event on Saturday with emoji reference key."""
+FOCUS_BLOCK_ROLES = (
+    "Deep Thinking", "Writing", "Reading", "Technical", "Admin",
+    "Comms", "Reflect", "Analysis", "Creative", "Maintenance", "Decision", "Closure",
+)
+
+
+def generate_focus_block_glyph_key_event(day: datetime, spec: Optional[ScheduleSpec] = None) -> Event:
+    """Return a single all-day event on Saturday with the emoji reference key of the spec's focus blocks."""
+    spec = spec or default_spec()
 
     # Normalize to datetime at midnight
     if isinstance(day, date) and not isinstance(day, datetime):
@@ -82,10 +107,12 @@ def generate_focus_block_glyph_key_event(day: datetime) -> Event:
     start = day.replace(hour=0, minute=0, second=0, microsecond=0)
     end = (start + timedelta(days=1))
 
-    emoji_lines = [f"{emoji}  {desc}" for (_, _, _, _, _, emoji), desc in zip(FOCUS_BLOCKS, [
-        "Deep Thinking", "Writing", "Reading", "Technical", "Admin",
-        "Comms", "Reflect", "Analysis", "Creative", "Maintenance", "Decision", "Closure"
-    ])]
+    # The last block is always the closing gate; the others keep their position's role
+    roles = [
+        FOCUS_BLOCK_ROLES[i] if i < len(FOCUS_BLOCK_ROLES) - 1 else f"Block {block.number}"
+        for i, block in enumerate(spec.focus_blocks[:-1])
+    ] + [FOCUS_BLOCK_ROLES[-1]]
+    emoji_lines = [f"{block.glyph}  {role}" for block, role in zip(spec.focus_blocks, roles)]
     description = "Focus Block Glyph Key:\n\n" + "\n".join(emoji_lines)
 
     return Event(
@@ -98,38 +125,55 @@ def generate_focus_block_glyph_key_event(day: datetime) -> Event:
     )
 
 
-def write_focus_blocks_weekly(phases: list[Phase]) -> list[str]:
+def write_focus_blocks_weekly(
+    phases: list[Phase],
+    tzid: Optional[str] = None,
+    exclusions: Optional[Exclusions] = None,
+    spec: Optional[ScheduleSpec] = None,
+) -> list[str]:
     written_paths = []
+    reporter = get_reporter()
+    spec = spec or default_spec()
 
     for phase in phases:
         week_spans = group_phase_days_by_week(phase)
-        print(f"📅 {phase.name} covers weeks: {[span.iso_week_label for span in week_spans]}")
+        reporter.verbose(f"📅 {phase.name} covers weeks: {[span.iso_week_label for span in week_spans]}")
 
         for span in week_spans:
             # ⏳ 1. Filter only eligible weekdays for focus blocks
-            focus_days = [d for d in span.days if d.weekday() in ACTIVE_WEEKDAYS]
-            events = generate_focus_block_events_for_days(focus_days)
+            focus_days = [d for d in span.days if d.weekday() in spec.focus_weekdays]
+            events = generate_focus_block_events_for_days(focus_days, exclusions=exclusions, spec=spec)
 
             # ⛩️ 2. Add glyph key on Saturday if it's inside phase bounds
             saturday = span.start + timedelta(days=(5 - span.start.weekday()) % 7)
             if phase.start.date() <= saturday <= phase.end.date():
-                events.append(generate_focus_block_glyph_key_event(saturday))
+                events.append(generate_focus_block_glyph_key_event(saturday, spec=spec))
 
             # 💾 3. Write file if any events exist
             if events:
                 filename = f"output/focus_blocks_{slugify(phase.name)}_{span.iso_week_label}.ics"
-                write_events_to_ics(events, filename)
+                write_events_to_ics(events, filename, tzid=tzid)
                 written_paths.append(filename)
-                print(f"✅ Wrote: {filename}")
+                reporter.wrote(filename, level=VERBOSE)
 
     return written_paths
 
 
-def generate_focus_block_events(phases: list[Phase]) -> list[Event]:
-    """Generate all focus block events across all phases (flattened list)."""
-    events: list[Event] = []
+def iter_focus_block_events(
+    phases: list[Phase],
+    exclusions: Optional[Exclusions] = None,
+    spec: Optional[ScheduleSpec] = None,
+) -> Iterator[Event]:
+    """Lazily yield the focus blocks of each phase, week by week."""
     for phase in phases:
-        week_spans = group_phase_days_by_week(phase)  # returns list[PhaseWeekSpan]
-        for span in week_spans:
-            events.extend(generate_focus_block_events_for_days(span.days))
-    return events
+        for span in group_phase_days_by_week(phase):  # returns list[PhaseWeekSpan]
+            yield from iter_focus_block_events_for_days(span.days, phase=phase, exclusions=exclusions, spec=spec)
+
+
+def generate_focus_block_events(
+    phases: list[Phase],
+    exclusions: Optional[Exclusions] = None,
+    spec: Optional[ScheduleSpec] = None,
+) -> list[Event]:
+    """Generate all focus block events across all phases (flattened list)."""
+    return list(iter_focus_block_events(phases, exclusions=exclusions, spec=spec))
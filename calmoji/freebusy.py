@@ -0,0 +1,161 @@
+# calmoji/freebusy.py
+
+"""
+Interval coalescing and VFREEBUSY export.
+
+Availability consumers don't need every 25-minute meeting slot or focus
+block as its own VEVENT, only when calmoji time is busy. `coalesce` merges
+adjacent or overlapping events (meetings, focus blocks, all-day phase
+markers) into busy ranges in one pass over the start-sorted events, and
+`write_freebusy` publishes them as one VFREEBUSY component per ISO week or
+per phase.
+"""
+
+import datetime
+from itertools import groupby
+from typing import Iterable, Iterator, Optional, Union
+
+from calmoji.ics_writer import create_ics_footer, create_ics_header
+from calmoji.types import CRLF, Event, Phase
+from calmoji.uid import generate_uid
+from calmoji.utils import fold_ics_line, group_phase_days_by_week
+
+Interval = tuple[datetime.datetime, datetime.datetime]
+
+FREEBUSY_MODES = ("week", "phase")
+
+
+def _as_datetime(value: Union[datetime.datetime, datetime.date]) -> datetime.datetime:
+    if isinstance(value, datetime.datetime):
+        return value
+    return datetime.datetime.combine(value, datetime.time())
+
+
+def busy_intervals(events: Iterable[Event]) -> list[Interval]:
+    """Start-sorted (start, end) intervals of events; all-day events span whole UTC days."""
+    intervals = [(_as_datetime(event.start), _as_datetime(event.end)) for event in events]
+    intervals.sort()  # Generator output is already in runs of start order, so this is near-linear
+    return intervals
+
+
+def coalesce(intervals: Iterable[Interval], gap: datetime.timedelta = datetime.timedelta(0)) -> list[Interval]:
+    """
+    Merge start-sorted intervals that overlap, touch, or are at most `gap` apart.
+
+    Args:
+        intervals: (start, end) pairs sorted by start.
+        gap: Largest gap between two intervals that still counts as continuous busy time.
+
+    Returns:
+        list[Interval]: Disjoint busy ranges in order.
+    """
+    merged: list[Interval] = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1] + gap:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def freebusy_windows(phases: list[Phase], mode: str = "week") -> list[tuple[str, datetime.datetime, datetime.datetime]]:
+    """Return (label, start, end) windows — one per ISO week or per phase — covering the phases."""
+    if mode not in FREEBUSY_MODES:
+        raise ValueError(f"Unknown free/busy mode: {mode} (expected one of {FREEBUSY_MODES})")
+
+    windows = []
+    for phase in phases:
+        if mode == "phase":
+            windows.append((
+                phase.name,
+                _as_datetime(phase.start.date()),
+                _as_datetime(phase.end.date()) + datetime.timedelta(days=1),
+            ))
+            continue
+        for span in group_phase_days_by_week(phase):
+            windows.append((
+                f"{phase.name} {span.iso_week_label}",
+                _as_datetime(span.start),
+                _as_datetime(span.end) + datetime.timedelta(days=1),
+            ))
+    return windows
+
+
+def split_by_windows(
+    busy: list[Interval], windows: list[tuple[str, datetime.datetime, datetime.datetime]]
+) -> Iterator[tuple[str, datetime.datetime, datetime.datetime, list[Interval]]]:
+    """Clip sorted busy ranges to sorted windows in a single two-pointer pass."""
+    i = 0
+    for label, window_start, window_end in windows:
+        while i < len(busy) and busy[i][1] <= window_start:
+            i += 1
+        periods = []
+        j = i
+        while j < len(busy) and busy[j][0] < window_end:
+            periods.append((max(busy[j][0], window_start), min(busy[j][1], window_end)))
+            j += 1
+        yield label, window_start, window_end, periods
+
+
+def _utc(dt: datetime.datetime) -> str:
+    return dt.strftime("%Y%m%dT%H%M%SZ")
+
+
+def vfreebusy_component(
+    label: str,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    periods: list[Interval],
+    dtstamp: datetime.datetime,
+) -> str:
+    """Render one VFREEBUSY component, packing each day's UTC periods into one folded FREEBUSY line."""
+    lines = [
+        "BEGIN:VFREEBUSY",
+        f"UID:{generate_uid(start, label, namespace='calmoji-freebusy')}",
+        f"DTSTAMP:{_utc(dtstamp)}",
+        f"DTSTART:{_utc(start)}",
+        f"DTEND:{_utc(end)}",
+        f"COMMENT:{label}",
+    ]
+    for _, day_periods in groupby(periods, key=lambda period: period[0].date()):
+        values = ",".join(f"{_utc(s)}/{_utc(e)}" for s, e in day_periods)
+        lines.append(fold_ics_line(f"FREEBUSY;FBTYPE=BUSY:{values}"))
+    lines.append("END:VFREEBUSY")
+    return CRLF.join(lines) + CRLF
+
+
+def write_freebusy(
+    events: Iterable[Event],
+    phases: list[Phase],
+    filename: str,
+    mode: str = "week",
+    gap: datetime.timedelta = datetime.timedelta(0),
+    dtstamp: Optional[datetime.datetime] = None,
+) -> int:
+    """
+    Coalesce events into busy ranges and write one VFREEBUSY per week or phase.
+
+    Args:
+        events: Meeting slots, focus blocks, phase markers… in any mix.
+        phases: Phases that define the published windows.
+        filename: Target .ics path.
+        mode: "week" (ISO weeks within each phase) or "phase".
+        gap: Merge busy ranges separated by at most this much free time.
+        dtstamp: DTSTAMP for every component (defaults to now, UTC).
+
+    Returns:
+        int: Number of FREEBUSY periods written.
+    """
+    busy = coalesce(busy_intervals(events), gap)
+    dtstamp = dtstamp or datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None, microsecond=0)
+    written = 0
+
+    with open(filename, "w", encoding="utf-8", newline="") as f:
+        f.write(create_ics_header(calname=f"🧿 calmoji free/busy ({mode})"))
+        for label, start, end, periods in split_by_windows(busy, freebusy_windows(phases, mode)):
+            f.write(vfreebusy_component(label, start, end, periods, dtstamp))
+            written += len(periods)
+        f.write(create_ics_footer())
+    return written
+
@@ -0,0 +1,253 @@
+# calmoji/ics_reader.py
+
+"""
+Streaming ICS reader for calmoji output and external calendars.
+
+The file is memory-mapped and scanned for BEGIN:VEVENT / END:VEVENT markers.
+Only one event's bytes are copied out at a time, unfolded (RFC 5545 §3.1) and
+split into properties, so memory stays constant however large the file is.
+
+    for record in iter_vevents("output/meeting_all_2024.ics"):
+        print(record.uid, record.dtstart, record.summary)
+
+`iter_batches` yields the same data column-wise, for bulk consumers.
+"""
+
+import datetime
+import mmap
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Iterator, NamedTuple, Optional, Union
+
+from calmoji.timezones import to_utc
+from calmoji.types import Event
+
+# Markers are matched at the start of a line so text values cannot fake them
+BEGIN_VEVENT = b"\nBEGIN:VEVENT"
+END_VEVENT = b"\nEND:VEVENT"
+
+_UNESCAPE = re.compile(r"\\([\\;,nN])")
+
+
+class VEventRecord(NamedTuple):
+    """One VEVENT as raw property values (text values unescaped)."""
+    uid: str
+    summary: str
+    dtstart: str
+    dtend: str
+    tzid: Optional[str]
+    all_day: bool
+    description: str
+    rrule: Optional[str]
+    exdates: tuple[str, ...]
+    exdate_params: tuple[str, ...]  # The parameters (e.g. "TZID=Asia/Tokyo") of each value's EXDATE line
+    status: Optional[str]
+    raw: bytes  # The VEVENT exactly as it appears in the file, BEGIN through END
+
+
+def unescape_ics_text(value: str) -> str:
+    """Undo RFC 5545 TEXT escaping (\\n, \\, \\; \\\\)."""
+    if "\\" not in value:
+        return value
+    return _UNESCAPE.sub(lambda m: "\n" if m.group(1) in "nN" else m.group(1), value)
+
+
+def unfold(block: bytes) -> bytes:
+    """Normalize line endings to LF and join folded continuation lines."""
+    if b"\r" in block:
+        block = block.replace(b"\r\n", b"\n")
+    if b"\n " in block or b"\n\t" in block:
+        block = block.replace(b"\n ", b"").replace(b"\n\t", b"")
+    return block
+
+
+def _split_property(line: str) -> tuple[str, str, str]:
+    """Split 'NAME;PARAMS:value' into (NAME, PARAMS, value), respecting quoted parameters."""
+    colon = line.find(":")
+    semi = line.find(";", 0, colon) if colon != -1 else -1
+    if semi != -1 and '"' in line[semi:colon]:
+        in_quotes = False
+        for i in range(semi, len(line)):
+            ch = line[i]
+            if ch == '"':
+                in_quotes = not in_quotes
+            elif ch == ":" and not in_quotes:
+                colon = i
+                break
+    if colon == -1:
+        return line.upper(), "", ""
+    if semi == -1:
+        return line[:colon].upper(), "", line[colon + 1:]
+    return line[:semi].upper(), line[semi + 1:colon], line[colon + 1:]
+
+
+def _param(params: str, key: str) -> Optional[str]:
+    for part in params.split(";"):
+        name, _, value = part.partition("=")
+        if name.upper() == key:
+            return value.strip('"')
+    return None
+
+
+def parse_vevent(raw: bytes) -> VEventRecord:
+    """Parse one BEGIN:VEVENT … END:VEVENT block."""
+    uid = summary = dtstart = dtend = description = ""
+    tzid = rrule = status = None
+    all_day = False
+    exdates: list[str] = []
+    exdate_params: list[str] = []
+    depth = 0
+
+    for line in unfold(raw).decode("utf-8", errors="replace").split("\n"):
+        head, _, value = line.partition(":")
+        if ";" in head:
+            if '"' in head:
+                name, params, value = _split_property(line)
+            else:
+                name, _, params = head.partition(";")
+                name = name.upper()
+        else:
+            name, params = head.upper(), ""
+
+        if name == "BEGIN":
+            depth += 1
+        elif name == "END":
+            depth -= 1
+        elif depth != 1:
+            continue  # Skip nested components such as VALARM
+        elif name == "UID":
+            uid = value
+        elif name == "SUMMARY":
+            summary = unescape_ics_text(value)
+        elif name == "DTSTART":
+            dtstart = value
+            if params:
+                tzid = _param(params, "TZID")
+                all_day = _param(params, "VALUE") == "DATE"
+        elif name == "DTEND":
+            dtend = value
+        elif name == "DESCRIPTION":
+            description = unescape_ics_text(value)
+        elif name == "RRULE":
+            rrule = value
+        elif name == "EXDATE":
+            values = value.split(",")
+            exdates.extend(values)
+            exdate_params.extend([params] * len(values))
+        elif name == "STATUS":
+            status = value
+
+    return VEventRecord(
+        uid, summary, dtstart, dtend, tzid, all_day, description, rrule, tuple(exdates), tuple(exdate_params), status, raw
+    )
+
+
+def iter_raw_vevents(path: Union[str, os.PathLike]) -> Iterator[bytes]:
+    """Yield the raw bytes of each VEVENT block in a file, via mmap."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = 0
+            while True:
+                if pos == 0 and mm[:len(BEGIN_VEVENT) - 1] == BEGIN_VEVENT[1:]:
+                    start = 0  # A headerless file starts with its first VEVENT, with no newline before it
+                else:
+                    start = mm.find(BEGIN_VEVENT, pos)
+                    if start == -1:
+                        return
+                    start += 1  # Skip the newline that anchors the marker
+                end = mm.find(END_VEVENT, start)
+                if end == -1:
+                    raise ValueError(f"Unterminated VEVENT at byte {start} in {path}")
+                end += len(END_VEVENT)
+                yield mm[start:end]
+                pos = end
+
+
+def iter_vevents(path: Union[str, os.PathLike]) -> Iterator[VEventRecord]:
+    """Lazily yield every VEVENT in a file as a VEventRecord."""
+    for raw in iter_raw_vevents(path):
+        yield parse_vevent(raw)
+
+
+@dataclass
+class EventBatch:
+    """A column-oriented batch of VEVENTs: one list per property."""
+    uid: list[str] = field(default_factory=list)
+    summary: list[str] = field(default_factory=list)
+    dtstart: list[str] = field(default_factory=list)
+    dtend: list[str] = field(default_factory=list)
+    tzid: list[Optional[str]] = field(default_factory=list)
+    all_day: list[bool] = field(default_factory=list)
+    description: list[str] = field(default_factory=list)
+    rrule: list[Optional[str]] = field(default_factory=list)
+    status: list[Optional[str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.uid)
+
+    def append(self, record: VEventRecord) -> None:
+        self.uid.append(record.uid)
+        self.summary.append(record.summary)
+        self.dtstart.append(record.dtstart)
+        self.dtend.append(record.dtend)
+        self.tzid.append(record.tzid)
+        self.all_day.append(record.all_day)
+        self.description.append(record.description)
+        self.rrule.append(record.rrule)
+        self.status.append(record.status)
+
+
+def iter_batches(path: Union[str, os.PathLike], batch_size: int = 10_000) -> Iterator[EventBatch]:
+    """Yield VEVENTs in column-oriented batches of up to `batch_size` events."""
+    batch = EventBatch()
+    for record in iter_vevents(path):
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = EventBatch()
+    if len(batch):
+        yield batch
+
+
+def parse_ics_datetime(value: str) -> Union[datetime.datetime, datetime.date]:
+    """Parse an ICS DATE (YYYYMMDD) or DATE-TIME (YYYYMMDDTHHMMSS[Z]) value into a naive object."""
+    value = value.rstrip("Z")
+    if "T" in value:
+        return datetime.datetime.strptime(value, "%Y%m%dT%H%M%S")
+    return datetime.datetime.strptime(value, "%Y%m%d").date()
+
+
+def _exdate_to_utc(value: str, params: str, default_tzid: Optional[str]) -> Union[datetime.datetime, datetime.date]:
+    """One EXDATE value in UTC: by its own TZID, as UTC with a trailing Z, else in DTSTART's TZID."""
+    moment = parse_ics_datetime(value)
+    if not isinstance(moment, datetime.datetime) or value.endswith("Z"):
+        return moment
+    tzid = (_param(params, "TZID") if params else None) or default_tzid
+    return to_utc(moment, tzid) if tzid else moment
+
+
+def record_to_event(record: VEventRecord) -> Event:
+    """Rebuild an Event from a VEventRecord, converting TZID-local times back to UTC."""
+    start = parse_ics_datetime(record.dtstart)
+    end = parse_ics_datetime(record.dtend) if record.dtend else None
+    if record.tzid and not record.all_day:
+        start = to_utc(start, record.tzid)
+        end = to_utc(end, record.tzid) if end else None
+    default_tzid = None if record.all_day else record.tzid
+    exdates = [
+        _exdate_to_utc(value, params, default_tzid) for value, params in zip(record.exdates, record.exdate_params)
+    ]
+    return Event(
+        start=start,
+        end=end,
+        summary=record.summary,
+        description=record.description,
+        uid=record.uid or None,
+        all_day=record.all_day,
+        recurrence=record.rrule,
+        exdates=exdates,
+        recurrence_tzid=default_tzid if record.rrule else None,
+    )
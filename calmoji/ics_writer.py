@@ -1,17 +1,24 @@
 import datetime
-from typing import Optional
+import os
+from typing import Iterator, Optional
 
-from calmoji.ebi48 import get_emoji_for_time
+from calmoji.ebi48_layer import iter_layer_events, layer_weeks, write_layer_body
 from calmoji.utils import (
     slugify,
     format_datetime,
     generate_uid,
     get_first_weekday_of_year,
 )
-from calmoji.types import Event, Phase
+from calmoji.timezones import vtimezone_block
+from calmoji.exclusions import Exclusions
+from calmoji.reporter import get_reporter
+from calmoji.types import CRLF, Event, Phase, fold_ics_line
 
 def create_ics_header(
-    calname: str = "🧿 calmoji calendar", version: str = "", comments: Optional[list[str]] = None
+    calname: str = "🧿 calmoji calendar",
+    version: str = "",
+    comments: Optional[list[str]] = None,
+    timezone: str = "UTC",
 ) -> str:
     full_name = f"{calname} {version}".strip()
     lines = [
@@ -21,12 +28,12 @@ def create_ics_header(
         "PRODID:-//Threshold Continuity Alliance//calmoji//EN",
         f"NAME:{full_name}",
         f"X-WR-CALNAME:{full_name}",
-        "X-WR-TIMEZONE:UTC",
+        f"X-WR-TIMEZONE:{timezone}",
         "METHOD:PUBLISH",
     ]
     if comments:
         lines += [f"COMMENT:{comment}" for comment in comments]
-    return "\n".join(lines) + "\n"
+    return CRLF.join(map(fold_ics_line, lines)) + CRLF
 
 # def create_event(event: Event) -> str:
 #     lines = ["BEGIN:VEVENT"]
@@ -55,44 +62,87 @@ def create_ics_header(
 #     return "\n".join(lines) + "\n"
 
 def create_ics_footer() -> str:
-    return "END:VCALENDAR\n"
-
-def write_events_to_ics(events: list[Event], filename: str, header: bool = True, footer: bool = True) -> None:
-    with open(filename, "w", encoding="utf-8") as f:
+    return "END:VCALENDAR" + CRLF
+
+def create_vtimezones(events: list[Event], tzid: str) -> str:
+    """Return the VTIMEZONE block for `tzid` covering every year the timed events touch."""
+    years = {
+        year
+        for event in events if not event.all_day
+        for year in (event.start.year, event.end.year)
+    }
+    return vtimezone_block(tzid, years) if years else ""
+
+def write_events_to_ics(
+    events: list[Event],
+    filename: str,
+    header: bool = True,
+    footer: bool = True,
+    tzid: Optional[str] = None,
+) -> None:
+    """
+    Write events to an .ics file.
+
+    By default timed events are written in UTC. With `tzid` (an IANA zone name),
+    they are written as local wall time with TZID parameters, preceded by a
+    generated VTIMEZONE block.
+    """
+    with open(filename, "w", encoding="utf-8", newline="") as f:
         if header:
-            f.write(create_ics_header())
+            f.write(create_ics_header(timezone=tzid or "UTC"))
+            if tzid:
+                f.write(create_vtimezones(events, tzid))
         for i, event in enumerate(events):
             try:
-                f.write("\n".join(event.to_ics()))
+                f.write(event.to_ics(tzid=tzid))
             except Exception as e:
                 raise ValueError(f"Failed to render event at index {i}: {event}") from e
         if footer:
             f.write(create_ics_footer())
+    get_reporter().count(events=len(events), nbytes=os.path.getsize(filename))
 
-def write_semester_blocks(phases: list[Phase], filename: Optional[str] = None) -> None:
-    if not filename:
-        anchor_year = phases[0].start.year if phases and phases[0].start else "unknown"
-        filename = f"output/semester_phases_{anchor_year}.ics"
-
-    events = [
-        Event(
+def iter_semester_block_events(phases: list[Phase]) -> Iterator[Event]:
+    """Yield one all-day marker event per phase, in phase order."""
+    for phase in phases:
+        yield Event(
             start=phase.start,
             end=phase.end,
             summary=phase.name,
             description=f"{phase.emoji} {phase.name} block",
             emoji=phase.emoji,
             all_day=True,
+            kind="phase",
+            phase=phase.name,
         )
-        for phase in phases
-    ]
-    write_events_to_ics(events, filename)
 
-def write_ebi48_layer(target_path: str, year: int, recurring: bool = True, expanded: bool = False) -> None:
+def write_semester_blocks(phases: list[Phase], filename: Optional[str] = None) -> None:
+    if not filename:
+        anchor_year = phases[0].start.year if phases and phases[0].start else "unknown"
+        filename = f"output/semester_phases_{anchor_year}.ics"
+
+    write_events_to_ics(list(iter_semester_block_events(phases)), filename)
+
+def iter_ebi48_events(
+    year: int,
+    recurring: bool = True,
+    expanded: bool = False,
+    exclusions: Optional[Exclusions] = None,
+) -> Iterator[Event]:
+    """
+    Yield the EBI48 layer's events in start-time order: 48 weekly slots over 52 weeks.
+
+    With `exclusions`, blocked weeks are dropped in expanded mode and become
+    EXDATEs on the recurring events in RRULE mode. With neither mode, only
+    the first week is yielded. Other ranges: see `calmoji.ebi48_layer`.
+    """
     assert not (recurring and expanded), "Choose either recurring or expanded mode, not both."
 
-    ref_day = get_first_weekday_of_year(year, weekday=5)  # Saturday
+    first = get_first_weekday_of_year(year, weekday=5).date()  # Saturday
+    weeks = 52 if recurring or expanded else 1
+    yield from iter_layer_events(first, weeks, recurring=recurring, exclusions=exclusions, version=year)
 
-    header = create_ics_header(
+def ebi48_header(year: int) -> str:
+    return create_ics_header(
         calname=f"🧿 calmoji EBI48 Clock — Canonical Emoji Time (UTC Only) v{year}",
         comments=[
             "EBI48 is a deterministic, symbolic emoji-based time layer.",
@@ -101,45 +151,51 @@ def write_ebi48_layer(target_path: str, year: int, recurring: bool = True, expan
         ],
     )
 
-    with open(target_path, "w", encoding="utf-8") as f:
-        f.write(header)
-
-        for hour in range(24):
-            for minute in (5, 35):
-                base_start = ref_day.replace(hour=hour, minute=minute)
-                base_end = base_start + datetime.timedelta(minutes=25)
-                emoji, label = get_emoji_for_time(base_start)
-                summary = f"{emoji} {label} — EBI48"
-                description = (
-                    f"{emoji} {label} — Canonical EBI48 time at {hour:02d}:{minute:02d} UTC\n"
-                    f"This slot is part of the EBI48 symbolic clock.\n"
-                    f"🕒 UTC only — times do not shift with local time.\n"
-                    f"v{year} — https://ebi48.org"
-                )
-
-                if expanded:
-                    for week in range(52):
-                        inst_start = base_start + datetime.timedelta(weeks=week)
-                        inst_end = base_end + datetime.timedelta(weeks=week)
-                        event = Event(
-                            start=inst_start,
-                            end=inst_end,
-                            summary=summary,
-                            description=description,
-                            emoji=emoji,
-                            uid=generate_uid(inst_start, summary),
-                        )
-                        f.write("\n".join(event.to_ics()))
-                else:
-                    event = Event(
-                        start=base_start,
-                        end=base_end,
-                        summary=summary,
-                        description=description,
-                        emoji=emoji,
-                        recurrence="RRULE:FREQ=WEEKLY;COUNT=52" if recurring else None,
-                        uid=generate_uid(base_start, summary),
-                    )
-                    f.write("\n".join(event.to_ics()))
-
-        f.write(create_ics_footer())
+def write_ebi48_layer(
+    target_path: str,
+    year: int,
+    recurring: bool = True,
+    expanded: bool = False,
+    exclusions: Optional[Exclusions] = None,
+) -> None:
+    """
+    Write the EBI48 emoji clock layer: 48 weekly slots over 52 weeks.
+
+    With `exclusions`, blocked weeks are dropped in expanded mode and become
+    EXDATEs on the recurring events in RRULE mode.
+    """
+    assert not (recurring and expanded), "Choose either recurring or expanded mode, not both."
+    first = get_first_weekday_of_year(year, weekday=5).date()  # Saturday
+    _write_ebi48(target_path, first, 52 if recurring or expanded else 1, recurring, exclusions, year)
+
+def write_ebi48_range(
+    target_path: str,
+    first: datetime.date,
+    last: datetime.date,
+    recurring: bool = True,
+    exclusions: Optional[Exclusions] = None,
+) -> int:
+    """
+    Write the EBI48 layer for every Saturday from `first` to `last` (inclusive),
+    as weekly RRULEs or, with `recurring=False`, fully expanded.
+
+    Returns:
+        int: Number of events written.
+    """
+    saturday, weeks = layer_weeks(first, last)
+    return _write_ebi48(target_path, saturday, weeks, recurring, exclusions, first.year)
+
+def _write_ebi48(
+    target_path: str,
+    first: datetime.date,
+    weeks: int,
+    recurring: bool,
+    exclusions: Optional[Exclusions],
+    version: int,
+) -> int:
+    with open(target_path, "wb") as f:
+        f.write(ebi48_header(version).encode("utf-8"))
+        written = write_layer_body(f, first, weeks, recurring, exclusions, version)
+        f.write(create_ics_footer().encode("utf-8"))
+    get_reporter().count(events=written, nbytes=os.path.getsize(target_path))
+    return written
@@ -20,3 +20,8 @@ MEETING_SLOTS = [
     ("Seattle",      20, 35, 21, 0,  "13:35–14:00 PDT"),   # Slot A
     ("Seattle",      21,  5, 21, 30, "14:05–14:30 PDT"),   # Slot B
 ]
+
+# Weekdays each city meets on (0 = Monday, 6 = Sunday); every other city meets Monday–Friday
+CITY_WEEKDAYS = {
+    "Mecca": {6, 0, 1, 2, 3},  # Sunday–Thursday
+}
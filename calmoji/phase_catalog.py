@@ -0,0 +1,194 @@
+# calmoji/phase_catalog.py
+
+"""
+Memoized phase catalog: "what is active at time T?" without regenerating.
+
+    phase_at(datetime(2025, 1, 3))  # ❄️ Winter Break of 2024–25
+    print(format_status(status()))  # 🔥 Semester B (Flame) · 🦦 Otter Face · 📚 focus · next: Tokyo … (in 0h 40m)
+
+Each academic year's phases are built once per (start date, phase table)
+and kept in an LRU cache together with their sorted start times, so
+`phase_at` is a cache hit plus a bisect, and `status` adds only the EBI48
+arithmetic and a walk over one day's focus and meeting templates. That keeps
+a status bar polling every second well under a millisecond per call.
+
+All times are naive UTC, like the rest of calmoji; aware datetimes are
+converted. Cached Phase objects are shared: treat them as read-only.
+"""
+
+import bisect
+import dataclasses
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+from calmoji.ebi48 import get_emoji_for_slot, get_slot_for_time
+from calmoji.spec import FocusTemplate, MeetingTemplate, PhaseRow, ScheduleSpec, default_spec
+from calmoji.types import Phase
+
+MAX_LOOKAHEAD_DAYS = 400  # How far `next_meeting` searches (phase gaps included) before giving up
+
+
+class YearCatalog(NamedTuple):
+    """One academic year's phases, with start/end times ready for bisecting."""
+    start: datetime
+    phases: tuple[Phase, ...]
+    starts: tuple[datetime, ...]
+    ends: tuple[datetime, ...]  # Exclusive: midnight after each phase's last day
+
+
+class Status(NamedTuple):
+    """What is active at one moment."""
+    at: datetime
+    phase: Optional[Phase]
+    slot: int
+    glyph: str
+    face: str
+    focus: Optional[FocusTemplate]
+    next_meeting: Optional[MeetingTemplate]
+    next_meeting_start: Optional[datetime]
+
+
+@lru_cache(maxsize=64)
+def year_catalog(start: datetime, rows: tuple[PhaseRow, ...]) -> YearCatalog:
+    """
+    Build (once) the phases of the academic year starting at `start`.
+
+    Args:
+        start: Academic year start (midnight UTC).
+        rows: The spec's phase table (`ScheduleSpec.phases`).
+
+    Returns:
+        YearCatalog: Phases in order, with their start and exclusive end times.
+    """
+    phases = tuple(
+        Phase(
+            name=row.name,
+            start_offset=row.start_offset,
+            end_offset=row.end_offset,
+            emoji=row.emoji,
+            start=start + timedelta(days=row.start_offset),
+            end=start + timedelta(days=row.end_offset),
+            allow_meetings=row.allow_meetings,
+            meeting_density=row.meeting_density,
+            note=f"Auto-tagged density: {row.meeting_density}",
+        )
+        for row in rows
+    )
+    return YearCatalog(
+        start=start,
+        phases=phases,
+        starts=tuple(p.start for p in phases),
+        ends=tuple(p.end + timedelta(days=1) for p in phases),
+    )
+
+
+def copy_phases(start: datetime, spec: ScheduleSpec) -> list[Phase]:
+    """The year's phases as fresh objects the caller may modify (what `get_semester_phases` returns)."""
+    return [dataclasses.replace(p) for p in year_catalog(start, spec.phases).phases]
+
+
+def _utc(dt: Optional[datetime]) -> datetime:
+    if dt is None:
+        return datetime.now(timezone.utc).replace(tzinfo=None)
+    if dt.tzinfo is not None:
+        return dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def catalog_for(dt: datetime, spec: Optional[ScheduleSpec] = None) -> YearCatalog:
+    """The catalog of the academic year containing `dt` (years start on the spec's year_start)."""
+    spec = spec or default_spec()
+    start = datetime(dt.year, spec.start_month, spec.start_day)
+    if dt < start:
+        start = start.replace(year=dt.year - 1)
+    return year_catalog(start, spec.phases)
+
+
+def phase_at(dt: Optional[datetime] = None, spec: Optional[ScheduleSpec] = None) -> Optional[Phase]:
+    """
+    Return the phase active at `dt` (default: now), or None in a gap between phases.
+
+    A new academic year takes over on its start date, even where the previous
+    year's closing phase nominally runs a day longer.
+    """
+    dt = _utc(dt)
+    catalog = catalog_for(dt, spec)
+    i = bisect.bisect_right(catalog.starts, dt) - 1
+    if i < 0 or dt >= catalog.ends[i]:
+        return None
+    return catalog.phases[i]
+
+
+def focus_block_at(dt: datetime, spec: Optional[ScheduleSpec] = None) -> Optional[FocusTemplate]:
+    """The focus block running at `dt` (focus blocks run on the spec's focus weekdays of every phase)."""
+    spec = spec or default_spec()
+    if dt.weekday() not in spec.focus_weekdays or phase_at(dt, spec) is None:
+        return None
+    clock = (dt.hour, dt.minute)
+    for block in spec.focus_blocks:
+        if (block.start_hour, block.start_minute) <= clock < (block.end_hour, block.end_minute):
+            return block
+    return None
+
+
+def next_meeting(
+    dt: Optional[datetime] = None,
+    spec: Optional[ScheduleSpec] = None,
+) -> Optional[tuple[datetime, MeetingTemplate]]:
+    """Return (start, template) of the first meeting slot held at or after `dt`, or None."""
+    dt = _utc(dt)
+    spec = spec or default_spec()
+    day = dt.replace(hour=0, minute=0, second=0, microsecond=0)
+    for _ in range(MAX_LOOKAHEAD_DAYS):
+        phase = phase_at(day, spec)
+        if phase is not None:
+            for template in spec.meetings_on(day, phase):  # In start order
+                start = day.replace(hour=template.start_hour, minute=template.start_minute)
+                if start >= dt:
+                    return start, template
+        day += timedelta(days=1)
+    return None
+
+
+def status(dt: Optional[datetime] = None, spec: Optional[ScheduleSpec] = None) -> Status:
+    """
+    Phase, EBI48 slot, focus block and next meeting slot at `dt` (default: now).
+
+    Args:
+        dt: Moment to describe (naive UTC or aware).
+        spec: Schedule to follow (defaults to the built-in one).
+
+    Returns:
+        Status: Everything a status bar shows.
+    """
+    dt = _utc(dt)
+    spec = spec or default_spec()
+    slot = get_slot_for_time(dt)
+    glyph, face = get_emoji_for_slot(slot)
+    upcoming = next_meeting(dt, spec)
+    return Status(
+        at=dt,
+        phase=phase_at(dt, spec),
+        slot=slot,
+        glyph=glyph,
+        face=face,
+        focus=focus_block_at(dt, spec),
+        next_meeting=upcoming[1] if upcoming else None,
+        next_meeting_start=upcoming[0] if upcoming else None,
+    )
+
+
+def format_status(current: Status) -> str:
+    """One line for a status bar."""
+    parts = [f"{current.phase.emoji} {current.phase.name}" if current.phase else "— between phases"]
+    parts.append(f"{current.glyph} {current.face}")
+    if current.focus:
+        parts.append(f"{current.focus.glyph} focus")
+    if current.next_meeting:
+        minutes = int((current.next_meeting_start - current.at).total_seconds() // 60)
+        days, hours = divmod(minutes // 60, 24)
+        wait = (f"{days}d " if days else "") + f"{hours}h {minutes % 60:02d}m"
+        meeting = current.next_meeting
+        parts.append(f"next: {meeting.city} {meeting.glyph} {current.next_meeting_start:%H:%M} UTC (in {wait})")
+    return " · ".join(parts)
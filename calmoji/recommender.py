@@ -0,0 +1,197 @@
+# calmoji/recommender.py
+
+"""
+Fair-time slot recommender — which EBI48 slots are humane for which cities?
+
+Every EBI48 slot is scored for every city on every day of a range by the local
+hour it falls on (see `HUMANE_HOUR_SCORES`), using real `zoneinfo` offsets so
+DST is honoured. Offsets are constant between transitions, so instead of
+looping over days the scorer counts, for each constant-offset run from the
+cached transition tables, how many days of each slot fall inside it. The cost
+is cities × runs × 48 regardless of how many days the range spans.
+"""
+
+import datetime
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable
+
+from calmoji.ebi48 import get_emoji_for_slot
+from calmoji.timezones import (
+    SECONDS_PER_DAY,
+    get_transition_table,
+    offset_runs,
+    resolve_tz_name,
+    utc_timestamp,
+)
+from calmoji.types import Phase
+
+SLOTS_PER_DAY = 48
+SLOT_MINUTES = 25
+
+# 🌞 How humane each local hour is for a meeting (0 = asleep, 1 = ideal)
+HUMANE_HOUR_SCORES: tuple[float, ...] = (
+    0.0, 0.0, 0.0, 0.0, 0.0, 0.0,   # 00–05 night
+    0.1, 0.3, 0.7, 1.0, 1.0, 1.0,   # 06–11 morning
+    0.8, 1.0, 1.0, 1.0, 0.9, 0.7,   # 12–17 afternoon (lunch dip at 12)
+    0.4, 0.2, 0.1, 0.0, 0.0, 0.0,   # 18–23 evening
+)
+
+
+def slot_start_minute(slot: int) -> int:
+    """Minutes after 00:00 UTC at which an EBI48 slot starts."""
+    return slot * 30 + 5
+
+
+@lru_cache(maxsize=None)
+def slot_scores_for_offset(offset_seconds: int) -> tuple[float, ...]:
+    """Humaneness of all 48 slots for a fixed UTC offset."""
+    offset_minutes = offset_seconds // 60
+    return tuple(
+        HUMANE_HOUR_SCORES[((slot_start_minute(slot) + offset_minutes) % 1440) // 60]
+        for slot in range(SLOTS_PER_DAY)
+    )
+
+
+def _as_date(d) -> datetime.date:
+    return d.date() if isinstance(d, datetime.datetime) else d
+
+
+def _day_range(start: datetime.datetime, end: datetime.datetime) -> tuple[int, int]:
+    """Return (epoch second of the first UTC midnight, number of days) for an inclusive range."""
+    first, last = _as_date(start), _as_date(end)
+    return utc_timestamp(first), (last - first).days + 1
+
+
+def _slot_day_counts(day0: int, num_days: int, run_start: int, run_end: int) -> list[int]:
+    """For each slot, how many of the days fall in [run_start, run_end) at that slot's start."""
+    counts = []
+    for slot in range(SLOTS_PER_DAY):
+        t = day0 + slot_start_minute(slot) * 60
+        lo = max(-((t - run_start) // SECONDS_PER_DAY), 0)     # ceil((run_start - t) / day)
+        hi = min(-((t - run_end) // SECONDS_PER_DAY), num_days)  # ceil((run_end - t) / day)
+        counts.append(max(hi - lo, 0))
+    return counts
+
+
+def _score_city(tz_name: str, day0: int, num_days: int) -> tuple[list[float], list[Counter]]:
+    """Sum slot scores over the days, and count the days each (offset, abbreviation) applies per slot."""
+    totals = [0.0] * SLOTS_PER_DAY
+    offsets_seen = [Counter() for _ in range(SLOTS_PER_DAY)]
+    window_end = day0 + num_days * SECONDS_PER_DAY
+
+    for run_start, run_end, offset, name in offset_runs(tz_name, day0, window_end):
+        counts = _slot_day_counts(day0, num_days, run_start, run_end)
+        for slot, (count, score) in enumerate(zip(counts, slot_scores_for_offset(offset))):
+            if count:
+                totals[slot] += count * score
+                offsets_seen[slot][(offset, name)] += count
+    return totals, offsets_seen
+
+
+def score_slots(
+    cities: Iterable[str], start: datetime.datetime, end: datetime.datetime
+) -> dict[str, list[float]]:
+    """
+    Average humaneness of every EBI48 slot for each city over an inclusive day range.
+
+    Args:
+        cities (Iterable[str]): MEETING_SLOTS city names or IANA zone names.
+        start (datetime): First day (UTC).
+        end (datetime): Last day (UTC), inclusive.
+
+    Returns:
+        dict[str, list[float]]: city → 48 average scores, indexed by EBI48 slot.
+    """
+    day0, num_days = _day_range(start, end)
+    scores = {}
+    for city in cities:
+        totals, _ = _score_city(resolve_tz_name(city), day0, num_days)
+        scores[city] = [total / num_days for total in totals]
+    return scores
+
+
+def best_window(scores: list[float], width: int) -> list[int]:
+    """Return the `width` consecutive slots with the highest total score (earliest wins ties)."""
+    best_start, best_total = 0, float("-inf")
+    for first in range(SLOTS_PER_DAY - width + 1):
+        total = sum(scores[first:first + width])
+        if total > best_total:
+            best_start, best_total = first, total
+    return list(range(best_start, best_start + width))
+
+
+def best_shared_slots(scores: dict[str, list[float]], count: int = 2) -> list[int]:
+    """Return the slots whose worst score across all cities is highest (fairest for everyone)."""
+    ranked = sorted(range(SLOTS_PER_DAY), key=lambda slot: (-min(s[slot] for s in scores.values()), slot))
+    return sorted(ranked[:count])
+
+
+def _format_local(slot: int, offset_seconds: int, name: str) -> str:
+    start = (slot_start_minute(slot) + offset_seconds // 60) % 1440
+    end = (start + SLOT_MINUTES) % 1440
+    return f"{start // 60:02d}:{start % 60:02d}–{end // 60:02d}:{end % 60:02d} {name}"
+
+
+def local_slot_label(city: str, slot: int, day: datetime.date) -> str:
+    """Format an EBI48 slot on a given UTC day as local time, e.g. '13:35–14:00 CET'."""
+    day = _as_date(day)
+    table = get_transition_table(resolve_tz_name(city), day.year)
+    start_ts = utc_timestamp(day) + slot_start_minute(slot) * 60
+    return _format_local(slot, table.offset_at(start_ts), table.name_at(start_ts))
+
+
+@dataclass
+class PhaseRecommendation:
+    """Recommended slots for one phase, in `MEETING_SLOTS` tuple format."""
+    phase: str
+    slots: list[tuple[str, int, int, int, int, str]]
+    scores: dict[str, list[float]]
+    shared: list[int]
+
+
+def recommend_phase_slots(
+    phases: list[Phase], cities: Iterable[str], slots_per_city: int = 2, shared_count: int = 2
+) -> list[PhaseRecommendation]:
+    """
+    Pick the best consecutive slot window per city for every phase.
+
+    Labels are regenerated from the real zone rules: each slot gets the local
+    label in force on most days of the phase.
+    """
+    cities = list(cities)
+    recommendations = []
+
+    for phase in phases:
+        day0, num_days = _day_range(phase.start, phase.end)
+        scores, rows = {}, []
+
+        for city in cities:
+            totals, offsets_seen = _score_city(resolve_tz_name(city), day0, num_days)
+            scores[city] = [total / num_days for total in totals]
+
+            for slot in best_window(scores[city], slots_per_city):
+                (offset, name), _ = offsets_seen[slot].most_common(1)[0]
+                start_min = slot_start_minute(slot)
+                end_min = (start_min + SLOT_MINUTES) % 1440
+                rows.append((
+                    city,
+                    start_min // 60, start_min % 60,
+                    end_min // 60, end_min % 60,
+                    _format_local(slot, offset, name),
+                ))
+
+        recommendations.append(PhaseRecommendation(
+            phase=phase.name,
+            slots=rows,
+            scores=scores,
+            shared=best_shared_slots(scores, shared_count),
+        ))
+    return recommendations
+
+
+def describe_slot(slot: int) -> str:
+    """Return '<emoji> <face>' for a slot, for reports."""
+    emoji, face = get_emoji_for_slot(slot)
+    return f"{emoji} {face}"
@@ -0,0 +1,166 @@
+# calmoji/reporter.py
+
+"""
+Leveled, buffered console reporting.
+
+Library code never calls print(): it asks the shared reporter, which drops
+messages below the configured level and batches the rest into a buffer that
+is written in one call when it fills, when the progress line is redrawn, or
+on flush(). Hot paths guard their messages with `enabled()` so a silenced
+level costs nothing.
+
+    QUIET    errors only                        (--quiet)
+    NORMAL   one line per written file          (default)
+    VERBOSE  per-phase / per-week detail        (-v)
+    DEBUG    per-event detail                   (-vv)
+
+On a terminal, a single progress line shows events/s and bytes/s; writers
+feed it through `count()`.
+"""
+
+import atexit
+import sys
+import time
+from typing import Optional, TextIO
+
+QUIET, NORMAL, VERBOSE, DEBUG = 0, 1, 2, 3
+ERROR = QUIET  # Errors are shown at every level
+
+DEFAULT_BUFFER_CHARS = 16 * 1024
+PROGRESS_INTERVAL = 0.1  # Seconds between progress redraws
+
+
+def level_from_flags(quiet: bool = False, verbose: int = 0) -> int:
+    """Map --quiet / -v / -vv to a level."""
+    return QUIET if quiet else min(NORMAL + verbose, DEBUG)
+
+
+def _human(value: float, unit: str) -> str:
+    for prefix in ("", "k", "M", "G"):
+        if value < 1000:
+            return f"{value:,.1f} {prefix}{unit}"
+        value /= 1000
+    return f"{value:,.1f} T{unit}"
+
+
+class Reporter:
+    """Buffered sink for leveled messages plus a throughput progress line."""
+
+    def __init__(
+        self,
+        level: int = NORMAL,
+        stream: Optional[TextIO] = None,
+        progress: Optional[bool] = None,
+        buffer_chars: int = DEFAULT_BUFFER_CHARS,
+    ):
+        self.level = level
+        self._stream = stream
+        if progress is None:
+            isatty = getattr(self.stream, "isatty", None)
+            progress = bool(isatty and isatty()) and level >= NORMAL
+        self.show_progress = progress
+        self.buffer_chars = buffer_chars
+        self.events = 0
+        self.bytes = 0
+        self._buffer: list[str] = []
+        self._buffered = 0
+        self._started = time.perf_counter()
+        self._last_draw = 0.0
+        self._progress_visible = False
+
+    @property
+    def stream(self) -> TextIO:
+        return self._stream or sys.stdout  # Resolved late so redirected stdout is honoured
+
+    # 📣 Messages
+
+    def enabled(self, level: int) -> bool:
+        return level <= self.level
+
+    def emit(self, level: int, message: str) -> None:
+        if level > self.level:
+            return
+        line = message + "\n"
+        self._buffer.append(line)
+        self._buffered += len(line)
+        if self._buffered >= self.buffer_chars or level == ERROR:
+            self.flush()
+
+    def error(self, message: str) -> None:
+        self.emit(ERROR, message)
+
+    def info(self, message: str) -> None:
+        self.emit(NORMAL, message)
+
+    def verbose(self, message: str) -> None:
+        self.emit(VERBOSE, message)
+
+    def debug(self, message: str) -> None:
+        self.emit(DEBUG, message)
+
+    def wrote(self, path: str, detail: Optional[str] = None, level: int = NORMAL) -> None:
+        """The standard '✅ Wrote: path (detail)' line."""
+        if self.enabled(level):
+            self.emit(level, f"✅ Wrote: {path}" + (f" ({detail})" if detail else ""))
+
+    # ⏱️ Progress
+
+    def count(self, events: int = 0, nbytes: int = 0) -> None:
+        """Add to the run's throughput counters and redraw the progress line if due."""
+        self.events += events
+        self.bytes += nbytes
+        if self.show_progress:
+            now = time.perf_counter()
+            if now - self._last_draw >= PROGRESS_INTERVAL:
+                self._last_draw = now
+                self.flush(redraw=True)
+
+    def rate_line(self) -> str:
+        elapsed = max(time.perf_counter() - self._started, 1e-9)
+        return (
+            f"⏳ {self.events:,} events, {_human(self.bytes, 'B')} in {elapsed:.1f} s "
+            f"({_human(self.events / elapsed, 'ev/s')}, {_human(self.bytes / elapsed, 'B/s')})"
+        )
+
+    # 💾 Output
+
+    def flush(self, redraw: bool = False) -> None:
+        """Write buffered lines in one call, keeping the progress line (if any) last."""
+        parts = []
+        if self._progress_visible and (self._buffer or redraw):
+            parts.append("\r\x1b[K")  # Clear the progress line before printing over it
+            self._progress_visible = False
+        parts.extend(self._buffer)
+        if redraw and self.show_progress:
+            parts.append(self.rate_line())
+            self._progress_visible = True
+        if parts:
+            self.stream.write("".join(parts))
+            self.stream.flush()
+        self._buffer.clear()
+        self._buffered = 0
+
+    def close(self) -> None:
+        """Flush and leave the cursor on a fresh line."""
+        self.flush()
+        if self._progress_visible:
+            self.stream.write("\r\x1b[K")
+            self.stream.flush()
+            self._progress_visible = False
+
+
+_reporter = Reporter()
+atexit.register(lambda: _reporter.close())
+
+
+def get_reporter() -> Reporter:
+    """The process-wide reporter used by library code."""
+    return _reporter
+
+
+def configure(level: int = NORMAL, stream: Optional[TextIO] = None, progress: Optional[bool] = None) -> Reporter:
+    """Replace the process-wide reporter (flushing the old one) and return it."""
+    global _reporter
+    _reporter.close()
+    _reporter = Reporter(level=level, stream=stream, progress=progress)
+    return _reporter
@@ -0,0 +1,301 @@
+# calmoji/rrule.py
+
+"""
+RRULE expansion for the RFC 5545 subset calmoji writes and reads.
+
+Supported: FREQ=DAILY|WEEKLY, INTERVAL, COUNT, UNTIL, BYDAY (plain weekdays,
+week start Monday), plus EXDATE. Anything else is rejected with ValueError.
+
+    recurrence = Recurrence(datetime(2025, 1, 4, 0, 5), RecurrenceRule.parse("FREQ=WEEKLY;COUNT=52"))
+    recurrence.between(datetime(2025, 6, 1), datetime(2025, 7, 1))   # lazy, [start, end)
+    recurrence.timestamps(datetime(2025, 6, 1), datetime(2025, 7, 1))  # array('q') of epoch seconds
+
+These rules are periodic: every period (INTERVAL days or weeks) repeats the
+same offsets from the period's start. So occurrence j is computed directly
+from its index, and the first occurrence in a window is found with a
+`divmod` and a bisect. Expanding a window of a 50-year rule costs only the
+window's own occurrences. `timestamps` fills each offset's arithmetic
+progression into an `array('q')` with one slice assignment, so no Python
+loop runs per occurrence.
+
+Times are naive UTC and kept to the second. A rule read with a TZID
+(`tzid=`, or `Event.recurrence_tzid`) repeats in that zone's wall time, as
+RFC 5545 requires: the periodic arithmetic runs on local wall times and
+each occurrence is converted to UTC on the way out, so a weekly 13:35 in
+Brussels stays at 13:35 across daylight-saving changes.
+"""
+
+import dataclasses
+import datetime
+import math
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+from calmoji.timezones import EPOCH, SECONDS_PER_DAY, to_local, to_utc, utc_timestamp
+from calmoji.types import Event
+from calmoji.uid import ebi48_instance_uid
+
+FREQUENCIES = ("DAILY", "WEEKLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+SECONDS_PER_WEEK = 7 * SECONDS_PER_DAY
+ONE_DAY = datetime.timedelta(days=1)  # Pads a UTC window converted to wall time; wider than any UTC offset change
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """A parsed RRULE value."""
+    freq: str
+    interval: int = 1
+    count: Optional[int] = None
+    until: Optional[datetime.datetime] = None  # Inclusive
+    byday: tuple[int, ...] = ()  # Weekdays, 0=Monday…6=Sunday
+
+    @classmethod
+    def parse(cls, value: str) -> "RecurrenceRule":
+        """
+        Parse an RRULE value such as "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,TH;COUNT=10".
+
+        Raises:
+            ValueError: On a malformed value or a part outside the supported subset.
+        """
+        from calmoji.ics_reader import parse_ics_datetime  # Only for UNTIL; keeps mmap/re off the import path
+
+        if value.upper().startswith("RRULE:"):
+            value = value[len("RRULE:"):]
+        parts: dict[str, str] = {}
+        for part in value.split(";"):
+            name, sep, part_value = part.partition("=")
+            name = name.strip().upper()
+            if not sep or not name or name in parts:
+                raise ValueError(f"Malformed RRULE part {part!r} in {value!r}")
+            parts[name] = part_value.strip().upper()
+
+        freq = parts.pop("FREQ", None)
+        if freq not in FREQUENCIES:
+            raise ValueError(f"Unsupported RRULE FREQ {freq!r} (supported: {', '.join(FREQUENCIES)})")
+        if parts.pop("WKST", "MO") != "MO":
+            raise ValueError("Only WKST=MO is supported")
+
+        try:
+            interval = int(parts.pop("INTERVAL", "1"))
+            count = int(parts.pop("COUNT")) if "COUNT" in parts else None
+        except ValueError:
+            raise ValueError(f"Malformed RRULE number in {value!r}") from None
+        until = None
+        if "UNTIL" in parts:
+            until = parse_ics_datetime(parts.pop("UNTIL"))
+            if not isinstance(until, datetime.datetime):  # A date: the whole day is included
+                until = datetime.datetime.combine(until, datetime.time(23, 59, 59))
+        byday = ()
+        if "BYDAY" in parts:
+            days = parts.pop("BYDAY").split(",")
+            if any(day not in WEEKDAYS for day in days):
+                raise ValueError(f"Unsupported BYDAY in {value!r} (plain weekdays only)")
+            byday = tuple(sorted({WEEKDAYS.index(day) for day in days}))
+        if parts:
+            raise ValueError(f"Unsupported RRULE part(s): {', '.join(sorted(parts))}")
+
+        if interval < 1 or (count is not None and count < 0):
+            raise ValueError(f"RRULE INTERVAL must be ≥ 1 and COUNT ≥ 0: {value!r}")
+        if count is not None and until is not None:
+            raise ValueError(f"RRULE cannot have both COUNT and UNTIL: {value!r}")
+        return cls(freq, interval, count, until, byday)
+
+    def __str__(self) -> str:
+        parts = [f"FREQ={self.freq}"]
+        if self.interval != 1:
+            parts.append(f"INTERVAL={self.interval}")
+        if self.byday:
+            parts.append("BYDAY=" + ",".join(WEEKDAYS[day] for day in self.byday))
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        if self.until is not None:
+            parts.append(f"UNTIL={self.until:%Y%m%dT%H%M%S}")
+        return ";".join(parts)
+
+
+def _datetime(ts: int) -> datetime.datetime:
+    return EPOCH + datetime.timedelta(seconds=ts)
+
+
+class Recurrence:
+    """
+    The occurrences of a rule from a DTSTART, minus EXDATEs.
+
+    As in RFC 5545, COUNT counts occurrences before EXDATEs are removed, and
+    a DTSTART that does not match the rule (e.g. not on a BYDAY) is not an
+    occurrence. DTSTART, UNTIL, EXDATEs and all results are UTC; with `tzid`
+    the rule repeats in that zone's wall time.
+    """
+
+    def __init__(
+        self,
+        dtstart: datetime.datetime,
+        rule: RecurrenceRule,
+        exdates: Iterable[datetime.datetime] = (),
+        tzid: Optional[str] = None,
+    ):
+        if not isinstance(dtstart, datetime.datetime):
+            dtstart = datetime.datetime(dtstart.year, dtstart.month, dtstart.day)
+            tzid = None  # All-day rules repeat on dates
+        self.dtstart = dtstart
+        self.rule = rule
+        self.tzid = tzid
+        self.exdates = frozenset(map(utc_timestamp, exdates))
+        if tzid:
+            # The periodic arithmetic below runs on wall times; only results are converted back
+            dtstart = to_local(dtstart, tzid)
+            if rule.until is not None:
+                rule = dataclasses.replace(rule, until=to_local(rule.until, tzid))
+
+        # One period's occurrences as offsets (seconds) from the period's start
+        start = utc_timestamp(dtstart)
+        weekday = dtstart.weekday()
+        if rule.freq == "WEEKLY":
+            self._base = start - weekday * SECONDS_PER_DAY  # Monday of DTSTART's week, at DTSTART's time
+            self._period = rule.interval * SECONDS_PER_WEEK
+            self._offsets = tuple(day * SECONDS_PER_DAY for day in (rule.byday or (weekday,)))
+        else:
+            self._base = start
+            days = math.lcm(rule.interval, 7) if rule.byday else rule.interval  # BYDAY filters days
+            self._period = days * SECONDS_PER_DAY
+            self._offsets = tuple(
+                k * SECONDS_PER_DAY for k in range(0, days, rule.interval)
+                if not rule.byday or (weekday + k) % 7 in rule.byday
+            )
+        # Indexes count offsets from the first period; those before DTSTART are skipped
+        self._skip = bisect_left(self._offsets, start - self._base)
+        self._end: Optional[int] = None  # Exclusive index bound, None when unbounded
+        if rule.count is not None:
+            self._end = self._skip + rule.count
+        elif rule.until is not None:
+            self._end = max(self._skip, self._index_at(utc_timestamp(rule.until) + 1))
+        if not self._offsets:
+            self._end = self._skip
+
+    @classmethod
+    def from_event(cls, event: Event) -> "Recurrence":
+        """The recurrence of an Event with an RRULE in `event.recurrence`."""
+        if not event.recurrence:
+            raise ValueError(f"Event has no recurrence: {event.summary}")
+        return cls(event.start, RecurrenceRule.parse(event.recurrence), event.exdates, event.recurrence_tzid)
+
+    def _index_at(self, ts: int) -> int:
+        """Index of the first occurrence at or after `ts` (EXDATEs and bounds ignored)."""
+        if ts <= self._base:
+            return 0
+        period, rest = divmod(ts - self._base, self._period)
+        return period * len(self._offsets) + bisect_left(self._offsets, rest)
+
+    def _timestamp(self, index: int) -> int:
+        period, k = divmod(index, len(self._offsets))
+        return self._base + period * self._period + self._offsets[k]
+
+    def _utc(self, ts: int) -> int:
+        """An occurrence's timestamp in UTC (its wall time read in `tzid`, if any)."""
+        return utc_timestamp(to_utc(_datetime(ts), self.tzid)) if self.tzid else ts
+
+    def _window(self, start: Optional[datetime.datetime], end: Optional[datetime.datetime]) -> tuple[int, int]:
+        if self.tzid:  # Wall-time bounds, padded; callers trim to the exact UTC window
+            start = to_local(start, self.tzid) - ONE_DAY if start is not None else None
+            end = to_local(end, self.tzid) + ONE_DAY if end is not None else None
+        lo = max(self._skip, self._index_at(utc_timestamp(start))) if start is not None else self._skip
+        hi = self._end
+        if end is not None:
+            stop = self._index_at(utc_timestamp(end))
+            hi = stop if hi is None else min(hi, stop)
+        if hi is None:
+            raise ValueError(f"Unbounded rule {self.rule}: give an end to the window")
+        return lo, max(lo, hi)
+
+    @property
+    def bounded(self) -> bool:
+        """True if the rule ends (COUNT or UNTIL)."""
+        return self._end is not None
+
+    def occurrence(self, n: int) -> datetime.datetime:
+        """The rule's n-th occurrence (0-based, EXDATEs included), in O(1)."""
+        if n < 0 or (self._end is not None and self._skip + n >= self._end):
+            raise IndexError(f"Occurrence {n} is out of range for {self.rule}")
+        return _datetime(self._utc(self._timestamp(self._skip + n)))
+
+    def between(
+        self,
+        start: Optional[datetime.datetime] = None,
+        end: Optional[datetime.datetime] = None,
+    ) -> Iterator[datetime.datetime]:
+        """Lazily yield the occurrences in [start, end), in order; `end` may be omitted for bounded rules."""
+        lo, hi = self._window(start, end)
+        exdates = self.exdates
+        first = utc_timestamp(start) if start is not None and self.tzid else None
+        last = utc_timestamp(end) if end is not None and self.tzid else None
+        for index in range(lo, hi):
+            ts = self._utc(self._timestamp(index))
+            if (first is not None and ts < first) or ts in exdates:
+                continue
+            if last is not None and ts >= last:
+                return
+            yield _datetime(ts)
+
+    def __iter__(self) -> Iterator[datetime.datetime]:
+        return self.between()
+
+    def timestamps(
+        self,
+        start: Optional[datetime.datetime] = None,
+        end: Optional[datetime.datetime] = None,
+    ) -> array:
+        """
+        The occurrences in [start, end) as an array('q') of epoch seconds.
+
+        UTC rules are built without a per-occurrence loop; wall-time (`tzid`)
+        rules convert each occurrence.
+        """
+        if self.tzid:
+            return array("q", map(utc_timestamp, self.between(start, end)))
+        lo, hi = self._window(start, end)
+        if lo == hi:
+            return array("q")
+        m = len(self._offsets)
+        first_period, last_period = lo // m, -(-hi // m)
+        periods = last_period - first_period
+        grid = array("q", bytes(8 * periods * m))
+        origin = self._base + first_period * self._period
+        for k, offset in enumerate(self._offsets):
+            first = origin + offset
+            grid[k::m] = array("q", range(first, first + periods * self._period, self._period))
+        out = grid[lo - first_period * m:hi - first_period * m]
+        if self.exdates and any(out[0] <= ts <= out[-1] for ts in self.exdates):
+            out = array("q", (ts for ts in out if ts not in self.exdates))
+        return out
+
+
+def expand_event(
+    event: Event,
+    start: Optional[datetime.datetime] = None,
+    end: Optional[datetime.datetime] = None,
+) -> Iterator[Event]:
+    """
+    Materialize a recurring Event's occurrences in [start, end) as single events.
+
+    Each instance keeps the master's text and duration. EBI48 instances get
+    `ebi48_instance_uid`, as in the expanded EBI48 layer; others get the
+    default UID derived from their start and summary.
+    """
+    duration = event.end - event.start
+    for occurrence in Recurrence.from_event(event).between(start, end):
+        yield Event(
+            start=occurrence,
+            end=occurrence + duration,
+            summary=event.summary,
+            description=event.description,
+            emoji=event.emoji,
+            uid=ebi48_instance_uid(occurrence) if event.kind == "ebi48" else None,
+            private=event.private,
+            transparent=event.transparent,
+            kind=event.kind,
+            city=event.city,
+            phase=event.phase,
+        )
@@ -0,0 +1,252 @@
+# calmoji/schedule_index.py
+
+"""
+ScheduleIndex — an in-memory inverted index over generated calendar events.
+
+Every event gets a document id (its position in the index). For each attribute
+value (city, EBI48 face, phase, density, weekday, ...) the index keeps a posting
+list: the ids of the documents carrying that value, as a sorted `array('I')`.
+Ids are handed out in increasing order, so adding an event only appends to its
+postings and building is linear. AND queries intersect postings starting from
+the shortest one (bisecting into the longer ones), OR queries merge them;
+neither scans every event.
+
+    index = build_schedule_index(get_semester_phases(start_date))
+    hits = index.query(city="Brussels", face="Badger Face", phase="Semester B (Flame)")
+
+The index can be saved to disk (zlib-compressed JSON, postings as id gaps)
+and loaded again without regenerating the schedule.
+"""
+
+import datetime
+import json
+import zlib
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import accumulate, chain
+from typing import Any, Iterable, Optional
+
+from calmoji.ebi48 import get_emoji_for_time, get_slot_index_for_emoji
+from calmoji.focus_blocks_writer import generate_focus_block_events
+from calmoji.slot_generator import generate_meeting_slots
+from calmoji.types import Event, Phase
+
+INDEX_FORMAT_VERSION = 2
+
+# Attributes that get posting lists, in the order they are stored on disk
+ATTRIBUTES = ("kind", "city", "face", "slot", "phase", "density", "weekday")
+
+
+def _face_and_slot(event: Event) -> tuple[Optional[str], Optional[int]]:
+    """Return the (face name, slot index) of an event's start, or (None, None) for off-grid times."""
+    if event.all_day or not isinstance(event.start, datetime.datetime):
+        return None, None
+    try:
+        emoji, face = get_emoji_for_time(event.start)
+    except ValueError:
+        return None, None
+    return face, get_slot_index_for_emoji(emoji)
+
+
+def _intersect(short: array, long: array) -> array:
+    """Ids in both sorted postings; bisects into `long`, so it costs O(len(short) · log len(long))."""
+    out = array("I")
+    lo, end = 0, len(long)
+    for doc_id in short:
+        lo = bisect_left(long, doc_id, lo)
+        if lo == end:
+            break
+        if long[lo] == doc_id:
+            out.append(doc_id)
+    return out
+
+
+def _union(postings: list[array]) -> array:
+    """Ids in any of the sorted postings of one attribute's distinct values, sorted."""
+    if len(postings) == 1:
+        return postings[0]
+    # Postings of distinct values of one attribute are disjoint, and sorting concatenated sorted runs is a merge
+    return array("I", sorted(chain.from_iterable(postings)))
+
+
+class ScheduleIndex:
+    """
+    Inverted index with sorted posting lists over calmoji events.
+
+    Records are kept as compact tuples so the index can be persisted and
+    queried without holding full Event objects in memory.
+    """
+
+    def __init__(self) -> None:
+        # (start_iso, end_iso, all_day, summary, description, uid, emoji, kind, city, phase)
+        self.records: list[tuple] = []
+        self.postings: dict[str, dict[Any, array]] = {attr: defaultdict(lambda: array("I")) for attr in ATTRIBUTES}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    # 🧱 Building
+
+    def add(self, event: Event, phase: Optional[Phase] = None) -> int:
+        """Add one event and return its document id."""
+        doc_id = len(self.records)
+        phase_name = phase.name if phase else event.phase
+
+        self.records.append((
+            event.start.isoformat(),
+            event.end.isoformat() if event.end else None,
+            event.all_day,
+            event.summary,
+            event.description,
+            event.uid,
+            event.emoji,
+            event.kind,
+            event.city,
+            phase_name,
+        ))
+
+        face, slot = _face_and_slot(event)
+        values = {
+            "kind": event.kind,
+            "city": event.city,
+            "face": face,
+            "slot": slot,
+            "phase": phase_name,
+            "density": phase.meeting_density if phase else None,
+            "weekday": event.start.weekday(),
+        }
+        for attr, value in values.items():
+            if value is not None:
+                self.postings[attr][value].append(doc_id)  # Ids only grow, so postings stay sorted
+
+        return doc_id
+
+    def add_events(self, events: Iterable[Event], phase: Optional[Phase] = None) -> None:
+        """Add every event from an iterable, e.g. the output of `generate_meeting_slots`."""
+        for event in events:
+            self.add(event, phase=phase)
+
+    # 🔎 Querying
+
+    def posting(self, attr: str, value: Any) -> array:
+        """Return the sorted document ids for a single attribute value (empty if the value is unknown)."""
+        if attr not in self.postings:
+            raise KeyError(f"Unknown index attribute: {attr}")
+        return self.postings[attr].get(value, array("I"))
+
+    def match(self, **criteria: Any) -> array:
+        """
+        Return the sorted ids of the documents matching all criteria.
+
+        Each keyword is an attribute name. A scalar value must match exactly;
+        a list, tuple or set matches any of its values (OR). Criteria are
+        combined with AND. With no criteria, every document matches.
+        """
+        candidates = []
+        for attr, wanted in criteria.items():
+            if isinstance(wanted, (list, tuple, set, frozenset)):
+                candidates.append(_union([self.posting(attr, value) for value in set(wanted)]))
+            else:
+                candidates.append(self.posting(attr, wanted))
+        if not candidates:
+            return array("I", range(len(self.records)))
+
+        candidates.sort(key=len)
+        result = candidates[0]
+        for posting in candidates[1:]:
+            if not result:
+                break
+            result = _intersect(result, posting)
+        return result[:]  # A copy, never one of the index's own postings
+
+    def count(self, **criteria: Any) -> int:
+        """Return the number of documents matching the criteria."""
+        return len(self.match(**criteria))
+
+    def events(self, doc_ids: Iterable[int]) -> list[Event]:
+        """Materialize the events with the given ids, in that order."""
+        return [self.event(doc_id) for doc_id in doc_ids]
+
+    def query(self, **criteria: Any) -> list[Event]:
+        """Return the matching events (see `match` for the criteria syntax)."""
+        return self.events(self.match(**criteria))
+
+    def event(self, doc_id: int) -> Event:
+        """Rebuild the Event stored under a document id."""
+        start_iso, end_iso, all_day, summary, description, uid, emoji, kind, city, phase = self.records[doc_id]
+        parse = datetime.date.fromisoformat if all_day else datetime.datetime.fromisoformat
+        return Event(
+            start=parse(start_iso),
+            end=parse(end_iso) if end_iso else None,
+            summary=summary,
+            description=description,
+            uid=uid,
+            emoji=emoji,
+            all_day=all_day,
+            kind=kind,
+            city=city,
+            phase=phase,
+        )
+
+    def values(self, attr: str) -> list[Any]:
+        """Return the distinct values indexed for an attribute."""
+        if attr not in self.postings:
+            raise KeyError(f"Unknown index attribute: {attr}")
+        return list(self.postings[attr])
+
+    # 💾 Persistence
+
+    def save(self, path: str) -> None:
+        """Write the index to disk as zlib-compressed JSON."""
+        payload = {
+            "version": INDEX_FORMAT_VERSION,
+            "records": self.records,
+            "postings": {
+                # Gaps between consecutive ids are small and compress well
+                attr: [[value, [b - a for a, b in zip(chain((0,), ids), ids)]] for value, ids in postings.items()]
+                for attr, postings in self.postings.items()
+            },
+        }
+        data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(zlib.compress(data, 6))
+
+    @classmethod
+    def load(cls, path: str) -> "ScheduleIndex":
+        """Load an index previously written by `save`."""
+        with open(path, "rb") as f:
+            payload = json.loads(zlib.decompress(f.read()).decode("utf-8"))
+
+        if payload.get("version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported schedule index version: {payload.get('version')}")
+
+        index = cls()
+        index.records = [tuple(record) for record in payload["records"]]
+        for attr, pairs in payload["postings"].items():
+            for value, gaps in pairs:
+                index.postings[attr][value] = array("I", accumulate(gaps))
+        return index
+
+
+def build_schedule_index(
+    phases: list[Phase], meetings: bool = True, focus_blocks: bool = True
+) -> ScheduleIndex:
+    """
+    Build a ScheduleIndex from the generator output for each phase.
+
+    Args:
+        phases (list[Phase]): Enriched phases from `get_semester_phases`.
+        meetings (bool): Index `generate_meeting_slots` output.
+        focus_blocks (bool): Index `generate_focus_block_events` output.
+
+    Returns:
+        ScheduleIndex: The populated index.
+    """
+    index = ScheduleIndex()
+    for phase in phases:
+        if meetings:
+            index.add_events(generate_meeting_slots(phase), phase=phase)
+        if focus_blocks:
+            index.add_events(generate_focus_block_events([phase]), phase=phase)
+    return index
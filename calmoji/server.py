@@ -0,0 +1,404 @@
+# calmoji/server.py
+
+"""
+On-demand calendar server (stdlib asyncio, HTTP/1.1 with keep-alive).
+
+    python calmoji.py serve --port 8048
+
+Routes:
+    /meetings?city=Tokyo&from=2025-01-06&to=2025-02-01&tzid=Asia/Tokyo
+    /focus/2025-W03
+    /ebi48/2025
+    /healthz
+
+Phase tables stay warm in process (`lru_cache`), and rendered responses are
+kept in an LRU keyed by the normalized request. Each entry carries a strong
+ETag (`If-None-Match` → 304) and a lazily built gzip body for clients that
+send `Accept-Encoding: gzip`. Requests are answered in worker threads
+(`asyncio.to_thread`), so a slow render does not stall other connections.
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import datetime
+import gzip
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from hashlib import blake2b
+from itertools import chain
+from typing import Callable, Iterable, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from calmoji.calendar_phases import get_semester_phases
+from calmoji.fanout import KNOWN_CITIES
+from calmoji.focus_blocks_writer import iter_focus_block_events_for_days
+from calmoji.ics_writer import create_ics_footer, create_ics_header, ebi48_header, iter_ebi48_events
+from calmoji.reporter import configure, get_reporter, level_from_flags
+from calmoji.slot_generator import iter_meeting_slots
+from calmoji.timezones import get_zone, vtimezone_block
+from calmoji.types import Event, Phase
+from calmoji.utils import get_start_date_from_year
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8048
+DEFAULT_CACHE_SIZE = 256
+MAX_RANGE_DAYS = 3 * 366
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 64 * 1024  # Request bodies are read and discarded; larger ones close the connection
+MIN_YEAR, MAX_YEAR = 1970, 9998  # Clear of datetime's year-1 and year-9999 edges
+
+ISO_WEEK = re.compile(r"^(\d{4})-W(\d{2})$")
+REASONS = {
+    200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+
+class HttpError(Exception):
+    """An error with an HTTP status, rendered as a plain-text response."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# 🗓️ Warm phase tables
+
+@lru_cache(maxsize=None)
+def phases_for_academic_year(year: int) -> tuple[Phase, ...]:
+    return tuple(get_semester_phases(get_start_date_from_year(year)))
+
+
+def academic_year_of(day: datetime.date) -> int:
+    """Academic years start on 15 September."""
+    return day.year if (day.month, day.day) >= (9, 15) else day.year - 1
+
+
+def phases_between(first: datetime.date, last: datetime.date) -> list[Phase]:
+    """Phases clipped to [first, last] (inclusive days), without overlapping boundary days."""
+    clipped: list[Phase] = []
+    next_day = datetime.datetime.combine(first, datetime.time())
+    last_dt = datetime.datetime.combine(last, datetime.time())
+    for year in range(academic_year_of(first), academic_year_of(last) + 1):
+        for phase in phases_for_academic_year(year):
+            start, end = max(phase.start, next_day), min(phase.end, last_dt)
+            if start <= end:
+                clipped.append(dataclasses.replace(phase, start=start, end=end))
+                next_day = end + datetime.timedelta(days=1)
+    return clipped
+
+
+# 🧾 Rendering
+
+def _param(query: dict[str, list[str]], name: str) -> Optional[str]:
+    """A single-valued parameter; repeating it is an error rather than a silent pick."""
+    values = query.get(name)
+    if not values:
+        return None
+    if len(values) > 1:
+        raise HttpError(400, f"Parameter '{name}' given {len(values)} times")
+    return values[0]
+
+
+def _check_year(year: int, what: str) -> None:
+    if not MIN_YEAR <= year <= MAX_YEAR:
+        raise HttpError(400, f"{what} is outside the supported years {MIN_YEAR}–{MAX_YEAR}")
+
+
+def _date_param(query: dict[str, list[str]], name: str, default: datetime.date) -> datetime.date:
+    value = _param(query, name)
+    if value is None:
+        return default
+    try:
+        day = datetime.date.fromisoformat(value)
+    except ValueError:
+        raise HttpError(400, f"Invalid {name} date: {value} (expected YYYY-MM-DD)")
+    _check_year(day.year, f"'{name}' date {value}")
+    return day
+
+
+def _tzid_param(query: dict[str, list[str]]) -> Optional[str]:
+    tzid = _param(query, "tzid")
+    if tzid:
+        try:
+            get_zone(tzid)
+        except ValueError as e:
+            raise HttpError(400, str(e))
+    return tzid
+
+
+def render_calendar(calname: str, events: Iterable[Event], tzid: Optional[str], years: Iterable[int]) -> bytes:
+    parts = [create_ics_header(calname=calname, timezone=tzid or "UTC")]
+    if tzid:
+        parts.append(vtimezone_block(tzid, years))
+    parts.extend(event.to_ics(tzid=tzid) for event in events)
+    parts.append(create_ics_footer())
+    return "".join(parts).encode("utf-8")
+
+
+def meetings_range(query: dict[str, list[str]]) -> tuple[datetime.date, datetime.date]:
+    """The inclusive (first, last) days a /meetings request covers; `from` defaults to today."""
+    first = _date_param(query, "from", datetime.date.today())
+    last = _date_param(query, "to", first + datetime.timedelta(days=27))
+    _check_year(last.year, f"'to' date {last}")
+    if last < first:
+        raise HttpError(400, "'to' is before 'from'")
+    if (last - first).days >= MAX_RANGE_DAYS:
+        raise HttpError(400, f"Range too long (max {MAX_RANGE_DAYS} days)")
+    return first, last
+
+
+def render_meetings(query: dict[str, list[str]]) -> bytes:
+    first, last = meetings_range(query)
+
+    cities = {city for value in query.get("city", []) for city in value.split(",") if city}
+    unknown = cities - KNOWN_CITIES
+    if unknown:
+        raise HttpError(400, f"Unknown cities: {', '.join(sorted(unknown))}")
+    tzid = _tzid_param(query)
+
+    events = chain.from_iterable(iter_meeting_slots(phase) for phase in phases_between(first, last))
+    if cities:
+        events = (event for event in events if event.city in cities)
+    label = ", ".join(sorted(cities)) or "all cities"
+    return render_calendar(
+        f"🧿 calmoji meetings — {label} {first}–{last}", events, tzid, range(first.year, last.year + 1)
+    )
+
+
+def render_focus_week(week_label: str, query: dict[str, list[str]]) -> bytes:
+    match = ISO_WEEK.match(week_label)
+    if not match:
+        raise HttpError(400, f"Invalid ISO week: {week_label} (expected YYYY-Www)")
+    _check_year(int(match.group(1)), f"Week {week_label}")
+    try:
+        monday = datetime.date.fromisocalendar(int(match.group(1)), int(match.group(2)), 1)
+    except ValueError as e:
+        raise HttpError(400, str(e))
+    tzid = _tzid_param(query)
+    days = [datetime.datetime.combine(monday, datetime.time()) + datetime.timedelta(days=i) for i in range(7)]
+    events = iter_focus_block_events_for_days(days)
+    return render_calendar(f"🧿 calmoji focus blocks {week_label}", events, tzid, {days[0].year, days[-1].year})
+
+
+def render_ebi48_year(year_label: str, query: dict[str, list[str]]) -> bytes:
+    if not year_label.isdigit():
+        raise HttpError(400, f"Invalid year: {year_label}")
+    year = int(year_label)
+    _check_year(year, f"Year {year}")
+    parts = [ebi48_header(year)]
+    parts.extend(event.to_ics() for event in iter_ebi48_events(year))
+    parts.append(create_ics_footer())
+    return "".join(parts).encode("utf-8")
+
+
+def route(path: str, query: dict[str, list[str]]) -> tuple[bytes, str]:
+    """Return (body, content type) for a GET, raising HttpError for bad requests."""
+    segments = [segment for segment in path.split("/") if segment]
+    if segments == ["healthz"]:
+        return b"ok\n", "text/plain; charset=utf-8"
+    if segments == ["meetings"]:
+        return render_meetings(query), "text/calendar; charset=utf-8"
+    if len(segments) == 2 and segments[0] == "focus":
+        return render_focus_week(segments[1], query), "text/calendar; charset=utf-8"
+    if len(segments) == 2 and segments[0] == "ebi48":
+        return render_ebi48_year(segments[1], query), "text/calendar; charset=utf-8"
+    raise HttpError(404, f"No such calendar: {path}")
+
+
+# 💾 Response cache
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    content_type: str
+    etag: str
+    _gzipped: Optional[bytes] = None
+
+    @property
+    def gzipped(self) -> bytes:
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, compresslevel=6, mtime=0)
+        return self._gzipped
+
+
+class ResponseCache:
+    """A small LRU of rendered responses keyed by normalized request."""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()  # Requests are answered from worker threads
+
+    def get_or_render(self, key: str, render: Callable[[], tuple[bytes, str]]) -> CachedResponse:
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+        body, content_type = render()  # Outside the lock, so one slow render does not block hits
+        entry = CachedResponse(body, content_type, f'"{blake2b(body, digest_size=12).hexdigest()}"')
+        with self._lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return entry
+
+
+def cache_key(path: str, query: dict[str, list[str]]) -> str:
+    """
+    Normalize a request into its cache key.
+
+    /meetings is keyed on its resolved date range rather than the raw query,
+    so a request relying on the default `from` (today) is not served
+    yesterday's calendar.
+    """
+    path = path.rstrip("/") or "/"
+    if path == "/meetings":
+        first, last = meetings_range(query)
+        query = {**query, "from": [first.isoformat()], "to": [last.isoformat()]}
+    normalized = "&".join(f"{name}={','.join(sorted(values))}" for name, values in sorted(query.items()))
+    return f"{path}?{normalized}"
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+# 🌐 HTTP
+
+class CalendarServer:
+    """Serve calmoji calendars over HTTP/1.1 from a warm in-process cache."""
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.cache = ResponseCache(cache_size)
+
+    def respond(self, method: str, target: str, headers: dict[str, str]) -> tuple[int, dict[str, str], bytes]:
+        """Build (status, headers, body) for one request."""
+        if method not in ("GET", "HEAD"):
+            return self._error(405, f"Method {method} not allowed")
+
+        parts = urlsplit(target)
+        query = parse_qs(parts.query)
+        try:
+            entry = self.cache.get_or_render(cache_key(parts.path, query), lambda: route(parts.path, query))
+        except HttpError as e:
+            return self._error(e.status, str(e))
+        except Exception as e:  # A rendering bug must not drop the connection
+            get_reporter().info(f"💥 {method} {target}: {type(e).__name__}: {e}")
+            return self._error(500, "Internal server error")
+
+        response_headers = {
+            "Content-Type": entry.content_type,
+            "ETag": entry.etag,
+            "Cache-Control": "public, max-age=300",
+            "Vary": "Accept-Encoding",
+        }
+        if etag_matches(headers.get("if-none-match"), entry.etag):
+            return 304, response_headers, b""
+
+        body = entry.body
+        if "gzip" in headers.get("accept-encoding", ""):
+            body = entry.gzipped
+            response_headers["Content-Encoding"] = "gzip"
+        return 200, response_headers, body
+
+    @staticmethod
+    def _error(status: int, message: str) -> tuple[int, dict[str, str], bytes]:
+        return status, {"Content-Type": "text/plain; charset=utf-8"}, f"{message}\n".encode("utf-8")
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = request_line.split(" ", 2)
+                except ValueError:
+                    writer.write(self._serialize(*self._error(400, "Malformed request line"), keep_alive=False))
+                    await writer.drain()
+                    return
+                headers = {}
+                for line in header_lines:
+                    name, sep, value = line.partition(":")
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" and (version == "HTTP/1.1" or connection == "keep-alive")
+
+                # No route takes a body, but its bytes must not be parsed as the next request
+                length = headers.get("content-length", "0")
+                if "transfer-encoding" in headers or not length.isdigit() or int(length) > MAX_BODY_BYTES:
+                    keep_alive = False
+                elif int(length):
+                    try:
+                        await reader.readexactly(int(length))
+                    except (asyncio.IncompleteReadError, ConnectionError):
+                        return
+
+                # Rendering a miss (or gzipping it) is CPU work; keep it off the event loop
+                status, response_headers, body = await asyncio.to_thread(self.respond, method, target, headers)
+                writer.write(self._serialize(
+                    status, response_headers, body, keep_alive=keep_alive, head_only=method == "HEAD",
+                ))
+                await writer.drain()
+                if not keep_alive:
+                    return
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _serialize(
+        status: int, headers: dict[str, str], body: bytes, keep_alive: bool = True, head_only: bool = False
+    ) -> bytes:
+        lines = [f"HTTP/1.1 {status} {REASONS.get(status, '')}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        lines.append(f"Content-Length: {len(body)}")
+        lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        return head if head_only else head + body
+
+    async def serve(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER_BYTES)
+        bound = ", ".join(f"http://{sock.getsockname()[0]}:{sock.getsockname()[1]}" for sock in server.sockets)
+        reporter = get_reporter()
+        reporter.info(f"🛰️ calmoji serving on {bound}")
+        reporter.flush()
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    from calmoji.cli import level_parser
+
+    parser = argparse.ArgumentParser(
+        prog="calmoji.py serve", description="🧿 Serve calmoji calendars on demand", parents=[level_parser()]
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE, help="Rendered responses kept in memory")
+    args = parser.parse_args(argv)
+    if args.quiet or args.verbose:
+        configure(level_from_flags(args.quiet, args.verbose))
+
+    try:
+        asyncio.run(CalendarServer(args.cache_size).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        get_reporter().info("\n🛰️ calmoji server stopped")
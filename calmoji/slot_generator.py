@@ -1,67 +1,59 @@
 # calmoji/slot_generator.py
 
-from datetime import timedelta
-from collections import defaultdict
-from calmoji.config import OCEANIA_SLOTS_ENABLED
-from calmoji.meeting_slots import MEETING_SLOTS
-from calmoji.types import Event, Phase
-from calmoji.ebi48 import get_emoji_for_time, get_emoji_name_for_slot
+from typing import Iterator, Optional
+from calmoji.spec import ScheduleSpec, iter_day_plans, phase_days
+from calmoji.types import Event
+from calmoji.exclusions import Exclusions
 
-def generate_meeting_slots(phase):
+
+def iter_meeting_slots(
+    phase,
+    exclusions: Optional[Exclusions] = None,
+    spec: Optional[ScheduleSpec] = None,
+) -> Iterator[Event]:
     """
-    Generate a list of Event objects for all weekday meeting slots in a phase.
+    Lazily yield the meeting slots of a phase in start-time order.
+
+    Only the slots its density and the series cadence call for are held
+    (see `ScheduleSpec.meetings_on`); phases that disallow meetings yield none.
 
     Args:
         phase: Phase object
+        exclusions: Optional holidays/exclusions; slots that overlap one are skipped
+        spec: Schedule to follow (defaults to the built-in one)
 
-    Returns:
-        List of Event objects, one per city/time slot per weekday.
+    Yields:
+        Event objects, one per city/time slot per meeting day.
     """
-    events = []
-    current_date = phase.start
-
-    # Define city-specific valid weekdays (0 = Monday, 6 = Sunday)
-    CITY_WEEKDAYS = {
-        "Mecca": {6, 0, 1, 2, 3},  # Sunday–Thursday
-        # Default for all others is Monday–Friday (0–4)
-    }
-
-    while current_date <= phase.end:
-        for slot in MEETING_SLOTS:
-            city, start_hr, start_min, end_hr, end_min, local_desc = slot
-
-            # Optional filter (for now only Auckland)
-            if city == "Auckland" and not OCEANIA_SLOTS_ENABLED:
-                continue
-
-            # Determine valid weekdays for this city
-            valid_weekdays = CITY_WEEKDAYS.get(city, {0, 1, 2, 3, 4})
-            if current_date.weekday() not in valid_weekdays:
-                continue
-
-            # Handle Mecca's Sunday–Thursday week (6 = Sunday, 4 = Thursday)
-            if city == "Mecca" and current_date.weekday() in {4, 5}:  # Friday (4), Saturday (5)
-                continue
-
-            # All others default to Monday–Friday (0–4)
-            if city != "Mecca" and current_date.weekday() > 4:
-                continue
-            
-            start_dt = current_date.replace(hour=start_hr, minute=start_min)
-            end_dt = current_date.replace(hour=end_hr, minute=end_min)
-
-            emoji, face_name = get_emoji_for_time(start_dt)
-
-            summary = f"{city} {emoji} {face_name} Slot ({local_desc})"
-            description = f"{phase.emoji} — {phase.name}"
-
-            events.append(Event(
-                start=start_dt,
-                end=end_dt,
-                summary=summary,
-                description=description
-            ))
+    # The spec already holds each series' weekday slots, filtered and sorted, with their glyphs
+    description = f"{phase.emoji} — {phase.name}"
+    for day, slots in iter_day_plans(phase_days(phase), phase, exclusions, spec, focus_blocks=False):
+        for slot in slots:
+            yield Event(
+                start=day.replace(hour=slot.start_hour, minute=slot.start_minute),
+                end=day.replace(hour=slot.end_hour, minute=slot.end_minute),
+                summary=f"{slot.city} {slot.glyph} {slot.face} Slot ({slot.label})",
+                description=description,
+                kind="meeting",
+                city=slot.city,
+                phase=phase.name,
+            )
+
+
+def generate_meeting_slots(
+    phase,
+    exclusions: Optional[Exclusions] = None,
+    spec: Optional[ScheduleSpec] = None,
+):
+    """
+    Generate a list of Event objects for the meeting slots held in a phase.
 
-        current_date += timedelta(minutes=1439)
+    Args:
+        phase: Phase object
+        exclusions: Optional holidays/exclusions; slots that overlap one are skipped
+        spec: Schedule to follow (defaults to the built-in one)
 
-    return events
+    Returns:
+        List of Event objects, one per city/time slot per meeting day.
+    """
+    return list(iter_meeting_slots(phase, exclusions=exclusions, spec=spec))
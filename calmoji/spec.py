@@ -0,0 +1,491 @@
+# calmoji/spec.py
+
+"""
+Declarative schedule configs compiled into an immutable, cached ScheduleSpec.
+
+The built-in schedule lives in Python modules (config.SEMESTER_PHASES,
+meeting_slots.MEETING_SLOTS, focus_blocks_config.FOCUS_BLOCKS …). A variant
+can instead be described in a TOML or JSON file (see
+docs/schedule.example.toml) and loaded with:
+
+    spec = load_spec("variants/late_start.toml")
+    phases = get_phases_for_years(2025, spec=spec)
+    events = generate_meeting_slots(phases[0], spec=spec)
+
+Loading validates the file once and compiles it into a ScheduleSpec that
+already holds everything the generators derive per run: the phase offset
+table, the meeting plan per series and weekday (in UTC start order, with
+EBI48 slot, glyph and face resolved) and the focus block plan. Compiled specs are
+memoized in-process and pickled under the cache directory, keyed by a hash
+of the file's bytes and the built-in defaults, so repeated runs and large batches of variants skip
+parsing and derivation entirely. The cache is local build output: only point
+`cache_dir` at directories you trust.
+"""
+
+import json
+import os
+import pickle
+import tomllib
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Iterable, Iterator, NamedTuple, Optional, Union
+
+from calmoji.config import (
+    DENSITY_SERIES, NUM_SERIES, OCEANIA_SLOTS_ENABLED, SEMESTER_PHASES, SERIES_INTERVAL_WEEKS, YEAR_START_DATE,
+)
+from calmoji.ebi48 import EBI48_CLOCK
+from calmoji.exclusions import Exclusions
+from calmoji.focus_blocks_config import ACTIVE_WEEKDAYS, FOCUS_BLOCKS
+from calmoji.meeting_slots import CITY_WEEKDAYS, MEETING_SLOTS
+from calmoji.types import Phase
+
+PathLike = Union[str, os.PathLike]
+
+SPEC_FORMAT_VERSION = 2
+DEFAULT_SPEC_CACHE = "output/.spec_cache"
+DENSITIES = ("none", "low", "normal", "high")
+WEEKDAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+DEFAULT_MEETING_WEEKDAYS = (0, 1, 2, 3, 4)
+
+
+class PhaseRow(NamedTuple):
+    """One phase, as offsets from the academic year start."""
+    name: str
+    start_offset: int
+    end_offset: int
+    emoji: str
+    allow_meetings: bool
+    meeting_density: str
+
+
+class MeetingTemplate(NamedTuple):
+    """A meeting slot with its EBI48 slot, glyph and face already resolved."""
+    city: str
+    start_hour: int
+    start_minute: int
+    end_hour: int
+    end_minute: int
+    label: str
+    slot: int
+    glyph: str
+    face: str
+    series: int = 0  # Meets in weeks where week % series_interval_weeks == series
+
+
+class FocusTemplate(NamedTuple):
+    """A focus block, with the glyph it is published under."""
+    number: int
+    start_hour: int
+    start_minute: int
+    end_hour: int
+    end_minute: int
+    glyph: str
+
+
+@dataclass(frozen=True)
+class ScheduleSpec:
+    """A validated schedule, precompiled for the generators."""
+    start_month: int
+    start_day: int
+    phases: tuple[PhaseRow, ...]
+    meeting_slots: tuple[MeetingTemplate, ...]  # In UTC start order
+    weekday_meetings: tuple[tuple[MeetingTemplate, ...], ...]  # Monday … Sunday, every week
+    focus_blocks: tuple[FocusTemplate, ...]
+    focus_weekdays: frozenset[int]
+    series_interval_weeks: int = SERIES_INTERVAL_WEEKS
+    series_count: int = NUM_SERIES
+    # [active series][week % series_interval_weeks][weekday] → the slots that meet
+    series_meetings: tuple[tuple[tuple[tuple[MeetingTemplate, ...], ...], ...], ...] = ()
+    digest: str = ""
+
+    def meetings_on(self, day: datetime, phase: Phase) -> tuple[MeetingTemplate, ...]:
+        """
+        The meeting slots held on `day` of `phase`, in start order.
+
+        A phase runs as many series as its density calls for (DENSITY_SERIES,
+        none if it disallows meetings); each series meets every
+        `series_interval_weeks`, staggered by week. Weeks are Monday-based and
+        counted on a fixed calendar, so the cadence carries on across phases and
+        years and does not depend on how a phase was clipped.
+        """
+        active = min(DENSITY_SERIES.get(phase.meeting_density, 0), self.series_count) if phase.allow_meetings else 0
+        if not active:
+            return ()
+        week = (day.toordinal() - 1) // 7  # Day 1 (0001-01-01) is a Monday
+        return self.series_meetings[active][week % self.series_interval_weeks][day.weekday()]
+
+
+Template = Union[MeetingTemplate, FocusTemplate]
+
+
+# 📆 Day plans
+
+def phase_days(phase: Phase) -> Iterator[datetime]:
+    """Midnight of each day of a phase, first to last."""
+    day = phase.start.replace(hour=0, minute=0, second=0, microsecond=0)
+    while day <= phase.end:
+        yield day
+        day += timedelta(days=1)
+
+
+def iter_day_plans(
+    days: Iterable[datetime],
+    phase: Optional[Phase] = None,
+    exclusions: Optional[Exclusions] = None,
+    spec: Optional[ScheduleSpec] = None,
+    meetings: bool = True,
+    focus_blocks: bool = True,
+) -> Iterator[tuple[datetime, tuple[Template, ...]]]:
+    """
+    Yield (day, templates) for the meeting slots and focus blocks held on each day, in start order.
+
+    This is the one place the scheduling rules are applied; the ICS
+    generators, the SQLite export and the record exporters all format its
+    output. Meetings follow `ScheduleSpec.meetings_on` for `phase` (there are
+    none without a phase), focus blocks follow `focus_weekdays`, and templates
+    that overlap an exclusion are dropped. Days with nothing held are skipped.
+
+    Args:
+        days: Midnights (UTC), in order.
+        phase: The phase the days belong to.
+        exclusions: Optional holidays/exclusions.
+        spec: Schedule to follow (defaults to the built-in one).
+        meetings: Include meeting slots.
+        focus_blocks: Include focus blocks.
+    """
+    spec = spec or default_spec()
+    no_meetings = phase is None or not meetings
+    # Each distinct (meeting plan, focus day) pair is merged into start order once
+    merged: dict[tuple[int, bool], tuple[Template, ...]] = {}
+
+    for day in days:
+        due = () if no_meetings else spec.meetings_on(day, phase)
+        focus = focus_blocks and day.weekday() in spec.focus_weekdays
+        key = (id(due), focus)  # `due` is one of the spec's own plan tuples, so its id is stable
+        plan = merged.get(key)
+        if plan is None:
+            plan = merged[key] = tuple(sorted(
+                (*due, *(spec.focus_blocks if focus else ())), key=lambda t: (t.start_hour, t.start_minute),
+            ))
+        if exclusions is not None and plan:
+            plan = tuple(
+                t for t in plan
+                if not exclusions.blocks(
+                    day.replace(hour=t.start_hour, minute=t.start_minute),
+                    day.replace(hour=t.end_hour, minute=t.end_minute),
+                    t.city if isinstance(t, MeetingTemplate) else None,
+                )
+            )
+        if plan:
+            yield day, plan
+
+
+# 🧾 Parsing and validation
+
+def classify_phase(name: str) -> tuple[bool, str]:
+    """The built-in (allow_meetings, density) heuristic, applied when a phase does not set them."""
+    if any(kw in name for kw in ["Break", "Rest", "Drift"]):
+        return False, "none"
+    if any(kw in name for kw in ["Downtime", "Prep"]):
+        return True, "low"
+    if "Deep Work" in name:
+        return True, "high"
+    return True, "normal"
+
+
+def _where(section: str, index: Optional[int] = None) -> str:
+    return section if index is None else f"{section}[{index}]"
+
+
+def _require(entry: dict, key: str, where: str) -> Any:
+    if key not in entry:
+        raise ValueError(f"{where}: missing '{key}'")
+    return entry[key]
+
+
+def _table(value: Any, where: str) -> dict:
+    if not isinstance(value, dict):
+        raise ValueError(f"{where}: expected a table of settings, got {type(value).__name__}")
+    return value
+
+
+def _tables(values: Any, where: str) -> list[dict]:
+    """A list of tables, such as the entries of `phases`."""
+    if not isinstance(values, list):
+        raise ValueError(f"{where}: expected a list, got {type(values).__name__}")
+    return [_table(value, _where(where, i)) for i, value in enumerate(values)]
+
+
+def _integer(value: Any, where: str) -> int:
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"{where}: expected a whole number, got {value!r}")
+    return value
+
+
+def _boolean(value: Any, where: str) -> bool:
+    if not isinstance(value, bool):
+        raise ValueError(f"{where}: expected true or false, got {value!r}")
+    return value
+
+
+def _text(value: Any, where: str) -> str:
+    if not isinstance(value, str):
+        raise ValueError(f"{where}: expected text, got {value!r}")
+    return value
+
+
+def _clock(value: Any, where: str) -> tuple[int, int]:
+    """'HH:MM' → (hour, minute)."""
+    try:
+        hour, minute = (int(part) for part in value.split(":"))
+    except (AttributeError, ValueError):
+        raise ValueError(f"{where}: expected a 'HH:MM' time, got {value!r}") from None
+    if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        raise ValueError(f"{where}: time out of range: {value!r}")
+    return hour, minute
+
+
+def _weekdays(values: Any, where: str) -> tuple[int, ...]:
+    if not isinstance(values, list) or not values:
+        raise ValueError(f"{where}: expected a non-empty list of weekdays")
+    days = []
+    for value in values:
+        if isinstance(value, str) and value[:3].lower() in WEEKDAY_NAMES:
+            days.append(WEEKDAY_NAMES.index(value[:3].lower()))
+        elif isinstance(value, int) and 0 <= value <= 6:
+            days.append(value)
+        else:
+            raise ValueError(f"{where}: not a weekday (0 = Monday … 6 = Sunday, or 'Mon' …): {value!r}")
+    return tuple(sorted(set(days)))
+
+
+def _ebi48_slot(hour: int, minute: int, where: str) -> int:
+    if minute % 30 != 5:
+        raise ValueError(f"{where}: meeting slots must start on the EBI48 grid (hh:05 or hh:35)")
+    return hour * 2 + minute // 30
+
+
+def compile_spec(data: dict, digest: str = "") -> ScheduleSpec:
+    """
+    Validate a parsed config and precompute the generator plans.
+
+    Args:
+        data: Parsed TOML/JSON (see docs/schedule.example.toml for the schema).
+        digest: Content hash recorded on the spec.
+
+    Returns:
+        ScheduleSpec: The compiled, immutable schedule.
+
+    Raises:
+        ValueError: On any missing, malformed or inconsistent setting.
+    """
+    _table(data, "config")
+    try:
+        month, day = (int(part) for part in str(data.get("year_start", "09-15")).split("-"))
+        datetime(2001, month, day)  # Rejects 02-30 etc. (not a leap year, so 02-29 too)
+    except ValueError:
+        raise ValueError(f"year_start: not a MM-DD date: {data.get('year_start')!r}") from None
+
+    phases = []
+    for i, entry in enumerate(_tables(_require(data, "phases", "config"), "phases")):
+        where = _where("phases", i)
+        name = _text(_require(entry, "name", where), f"{where}.name")
+        start = _integer(_require(entry, "start", where), f"{where}.start")
+        end = _integer(_require(entry, "end", where), f"{where}.end")
+        allow, density = classify_phase(name)
+        allow = _boolean(entry.get("allow_meetings", allow), f"{where}.allow_meetings")
+        density = entry.get("density", density)
+        if density not in DENSITIES:
+            raise ValueError(f"{where}: density must be one of {DENSITIES}, got {density!r}")
+        if end < start:
+            raise ValueError(f"{where}: ends (day {end}) before it starts (day {start})")
+        if phases and start <= phases[-1].end_offset:
+            raise ValueError(f"{where}: overlaps or precedes '{phases[-1].name}'")
+        emoji = _text(entry.get("emoji", "📅"), f"{where}.emoji")
+        phases.append(PhaseRow(name, start, end, emoji, allow, density))
+    if not phases:
+        raise ValueError("phases: at least one phase is required")
+
+    city_weekdays = {
+        city: _weekdays(days, _where("city_weekdays") + f".{city}")
+        for city, days in _table(data.get("city_weekdays", {}), "city_weekdays").items()
+    }
+    default_weekdays = _weekdays(data.get("meeting_weekdays", list(DEFAULT_MEETING_WEEKDAYS)), "meeting_weekdays")
+    disabled_cities = data.get("disabled_cities", [])
+    if not isinstance(disabled_cities, list):
+        raise ValueError(f"disabled_cities: expected a list of cities, got {type(disabled_cities).__name__}")
+    disabled = {_text(city, "disabled_cities") for city in disabled_cities}
+
+    meetings = []
+    for i, entry in enumerate(_tables(data.get("meeting_slots", []), "meeting_slots")):
+        where = _where("meeting_slots", i)
+        city = _text(_require(entry, "city", where), f"{where}.city")
+        sh, sm = _clock(_require(entry, "start", where), where)
+        eh, em = _clock(_require(entry, "end", where), where)
+        if (eh, em) <= (sh, sm):
+            raise ValueError(f"{where}: must end after it starts (slots may not cross midnight)")
+        slot = _ebi48_slot(sh, sm, where)
+        if city not in disabled:
+            label = _text(entry.get("label", ""), f"{where}.label")
+            meetings.append(MeetingTemplate(city, sh, sm, eh, em, label, slot, *EBI48_CLOCK[slot]))
+    series = _table(data.get("series", {}), "series")
+    interval = _integer(series.get("interval_weeks", SERIES_INTERVAL_WEEKS), "series.interval_weeks")
+    count = _integer(series.get("count", NUM_SERIES), "series.count")
+    if not 1 <= count <= interval:
+        raise ValueError(f"series: need 1 <= count <= interval_weeks, got count={count}, interval_weeks={interval}")
+
+    meetings.sort(key=lambda t: (t.start_hour, t.start_minute))
+    meetings = [t._replace(series=j % count) for j, t in enumerate(meetings)]  # Deal slots round-robin
+    weekday_meetings = tuple(
+        tuple(t for t in meetings if weekday in city_weekdays.get(t.city, default_weekdays))
+        for weekday in range(7)
+    )
+    series_meetings = tuple(
+        tuple(
+            tuple(tuple(t for t in day if t.series == week and t.series < active) for day in weekday_meetings)
+            for week in range(interval)
+        )
+        for active in range(count + 1)
+    )
+
+    blocks = []
+    focus = _tables(data.get("focus_blocks", []), "focus_blocks")
+    for i, entry in enumerate(focus):
+        where = _where("focus_blocks", i)
+        sh, sm = _clock(_require(entry, "start", where), where)
+        eh, em = _clock(_require(entry, "end", where), where)
+        if (eh, em) <= (sh, sm):
+            raise ValueError(f"{where}: must end after it starts")
+        # The day's last block is published as the closing gate
+        glyph = "⛩️" if i == len(focus) - 1 else _text(_require(entry, "emoji", where), f"{where}.emoji")
+        number = _integer(entry.get("number", i + 1), f"{where}.number")
+        blocks.append(FocusTemplate(number, sh, sm, eh, em, glyph))
+    blocks.sort(key=lambda t: (t.start_hour, t.start_minute))
+
+    return ScheduleSpec(
+        start_month=month,
+        start_day=day,
+        phases=tuple(phases),
+        meeting_slots=tuple(meetings),
+        weekday_meetings=weekday_meetings,
+        focus_blocks=tuple(blocks),
+        focus_weekdays=frozenset(_weekdays(data.get("focus_weekdays", list(ACTIVE_WEEKDAYS)), "focus_weekdays")),
+        series_interval_weeks=interval,
+        series_count=count,
+        series_meetings=series_meetings,
+        digest=digest,
+    )
+
+
+def builtin_config() -> dict:
+    """The schedule defined by the Python config modules, in config-file form."""
+    return {
+        "year_start": YEAR_START_DATE.strftime("%m-%d"),
+        "phases": [
+            {"name": p.name, "start": p.start_offset, "end": p.end_offset, "emoji": p.emoji}
+            for p in SEMESTER_PHASES
+        ],
+        "meeting_slots": [
+            {"city": city, "start": f"{sh:02d}:{sm:02d}", "end": f"{eh:02d}:{em:02d}", "label": label}
+            for city, sh, sm, eh, em, label in MEETING_SLOTS
+        ],
+        "city_weekdays": {city: sorted(days) for city, days in CITY_WEEKDAYS.items()},
+        "disabled_cities": [] if OCEANIA_SLOTS_ENABLED else ["Auckland"],
+        "focus_blocks": [
+            {"number": n, "start": f"{sh:02d}:{sm:02d}", "end": f"{eh:02d}:{em:02d}", "emoji": emoji}
+            for n, sh, sm, eh, em, emoji in FOCUS_BLOCKS
+        ],
+        "focus_weekdays": sorted(ACTIVE_WEEKDAYS),
+        "series": {"interval_weeks": SERIES_INTERVAL_WEEKS, "count": NUM_SERIES},
+    }
+
+
+@lru_cache(maxsize=1)
+def default_spec() -> ScheduleSpec:
+    """The compiled built-in schedule (what every generator uses without an explicit spec)."""
+    return compile_spec(builtin_config(), digest="builtin")
+
+
+# 💾 Loading and caching
+
+_compiled: dict[str, ScheduleSpec] = {}
+
+
+def _defaults_fingerprint() -> bytes:
+    """
+    Hash of the built-in defaults a config falls back on for settings it omits.
+
+    Covers builtin_config(), the default meeting weekdays and the
+    classify_phase heuristic, so changing any of them in code invalidates
+    cached specs compiled against the old values.
+    """
+    code = classify_phase.__code__
+    defaults = {**builtin_config(), "meeting_weekdays": list(DEFAULT_MEETING_WEEKDAYS)}
+    h = blake2b(json.dumps(defaults, sort_keys=True).encode(), digest_size=16)
+    h.update(code.co_code)
+    h.update(repr(code.co_consts).encode())
+    return h.digest()
+
+
+def spec_digest(raw: bytes) -> str:
+    """Cache key: hash of the config bytes, the built-in defaults and the spec format version."""
+    h = blake2b(digest_size=16, person=f"calmoji-spec-v{SPEC_FORMAT_VERSION}".encode())
+    h.update(_defaults_fingerprint())
+    h.update(raw)
+    return h.hexdigest()
+
+
+def parse_config(raw: bytes, suffix: str) -> dict:
+    """Parse TOML (.toml) or JSON (anything else) config bytes."""
+    try:
+        if suffix.lower() == ".toml":
+            return tomllib.loads(raw.decode("utf-8"))
+        return json.loads(raw)
+    except (tomllib.TOMLDecodeError, json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"Unreadable schedule config: {e}") from e
+
+
+def load_spec(path: PathLike, cache_dir: Optional[PathLike] = DEFAULT_SPEC_CACHE) -> ScheduleSpec:
+    """
+    Load a schedule config, compiling it only if no cached spec matches its content.
+
+    Args:
+        path: TOML or JSON schedule config.
+        cache_dir: Directory for pickled specs, or None to keep them in memory only.
+
+    Returns:
+        ScheduleSpec: The compiled spec (shared between calls with identical content).
+    """
+    raw = Path(path).read_bytes()
+    digest = spec_digest(raw)
+    spec = _compiled.get(digest)
+    if spec is not None:
+        return spec
+
+    cache_file = Path(cache_dir, f"{digest}.spec") if cache_dir is not None else None
+    if cache_file is not None and cache_file.exists():
+        try:
+            with open(cache_file, "rb") as f:
+                spec = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            spec = None  # Stale or truncated cache entry: recompile below
+        if not isinstance(spec, ScheduleSpec) or spec.digest != digest:
+            spec = None
+
+    if spec is None:
+        try:
+            spec = compile_spec(parse_config(raw, Path(path).suffix), digest=digest)
+        except ValueError as e:
+            raise ValueError(f"{path}: {e}") from None
+        if cache_file is not None:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(f".tmp{os.getpid()}")
+            with open(tmp, "wb") as f:
+                pickle.dump(spec, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_file)  # Atomic: concurrent runs never read a half-written spec
+
+    _compiled[digest] = spec
+    return spec
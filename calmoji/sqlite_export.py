@@ -0,0 +1,204 @@
+# calmoji/sqlite_export.py
+
+"""
+SQLite export of the schedule for ad-hoc SQL analysis.
+
+    export_sqlite("output/calmoji.sqlite", get_phases_for_years(2024, 100))
+
+    sqlite> SELECT COUNT(*) FROM events
+       ...> WHERE kind = 'meeting' AND city = 'Delhi' AND phase = 'Semester B (Flame)';
+
+Tables:
+    phases       one row per phase (name, emoji, start, end, density, allow_meetings)
+    events       meeting slots and focus blocks (kind, start, end, city, phase, slot, glyph, face)
+    ebi48_slots  the 48 canonical EBI48 slots (slot, utc_start, glyph, face)
+
+Rows are formatted straight from the day plans that `iter_meeting_slots` /
+`iter_focus_block_events` also use (`spec.iter_day_plans`), without
+constructing Event objects, and loaded with batched `executemany` in a
+single transaction, with journaling relaxed for the bulk load and indexes
+built once at the end.
+"""
+
+import os
+import sqlite3
+from itertools import islice
+from typing import Iterable, Iterator, Optional, Union
+
+from calmoji.ebi48 import get_all_ebi48_slots
+from calmoji.exclusions import Exclusions
+from calmoji.spec import ScheduleSpec, default_spec, iter_day_plans, phase_days
+from calmoji.types import Phase
+
+PathLike = Union[str, os.PathLike]
+
+DEFAULT_BATCH_SIZE = 50_000
+
+SCHEMA = """
+CREATE TABLE phases (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    emoji TEXT NOT NULL,
+    start TEXT NOT NULL,
+    end TEXT NOT NULL,
+    density TEXT NOT NULL,
+    allow_meetings INTEGER NOT NULL
+);
+CREATE TABLE events (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    start TEXT NOT NULL,
+    end TEXT NOT NULL,
+    city TEXT,
+    phase TEXT,
+    slot INTEGER,
+    glyph TEXT,
+    face TEXT
+);
+CREATE TABLE ebi48_slots (
+    slot INTEGER PRIMARY KEY,
+    utc_start TEXT NOT NULL,
+    glyph TEXT NOT NULL,
+    face TEXT NOT NULL
+);
+"""
+
+INDEXES = """
+CREATE INDEX events_start ON events (start);
+CREATE INDEX events_city ON events (city, start);
+CREATE INDEX events_phase ON events (phase, kind);
+CREATE INDEX events_glyph ON events (glyph);
+"""
+
+# Relaxed durability for a one-shot bulk load into a fresh file
+BULK_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",
+)
+
+EventRow = tuple[str, str, str, Optional[str], Optional[str], Optional[int], Optional[str], Optional[str]]
+
+
+def _clock(hour: int, minute: int) -> str:
+    return f" {hour:02d}:{minute:02d}:00"
+
+
+def _iter_rows(
+    kind: str,
+    phases: Iterable[Phase],
+    exclusions: Optional[Exclusions],
+    spec: Optional[ScheduleSpec],
+) -> Iterator[EventRow]:
+    spec = spec or default_spec()
+    meetings = kind == "meeting"
+    templates = spec.meeting_slots if meetings else spec.focus_blocks
+    # Times are formatted once per template, dates once per day
+    clocks = {id(t): (_clock(t.start_hour, t.start_minute), _clock(t.end_hour, t.end_minute)) for t in templates}
+
+    for phase in phases:
+        days = phase_days(phase)
+        for day, plan in iter_day_plans(days, phase, exclusions, spec, meetings=meetings, focus_blocks=not meetings):
+            date_str = day.strftime("%Y-%m-%d")
+            for t in plan:
+                start_clock, end_clock = clocks[id(t)]
+                if meetings:
+                    yield (kind, date_str + start_clock, date_str + end_clock, t.city, phase.name, t.slot, t.glyph, t.face)
+                else:
+                    yield (kind, date_str + start_clock, date_str + end_clock, None, phase.name, None, t.glyph, None)
+
+
+def iter_meeting_rows(
+    phases: Iterable[Phase],
+    exclusions: Optional[Exclusions] = None,
+    spec: Optional[ScheduleSpec] = None,
+) -> Iterator[EventRow]:
+    """Meeting slot rows, from the same day plans as `iter_meeting_slots`."""
+    return _iter_rows("meeting", phases, exclusions, spec)
+
+
+def iter_focus_rows(
+    phases: Iterable[Phase],
+    exclusions: Optional[Exclusions] = None,
+    spec: Optional[ScheduleSpec] = None,
+) -> Iterator[EventRow]:
+    """Focus block rows, from the same day plans as `iter_focus_block_events`."""
+    return _iter_rows("focus", phases, exclusions, spec)
+
+
+def _insert_batches(conn: sqlite3.Connection, sql: str, rows: Iterable[tuple], batch_size: int) -> int:
+    rows = iter(rows)
+    total = 0
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return total
+        conn.executemany(sql, batch)
+        total += len(batch)
+
+
+def export_sqlite(
+    path: PathLike,
+    phases: list[Phase],
+    exclusions: Optional[Exclusions] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    spec: Optional[ScheduleSpec] = None,
+) -> dict[str, int]:
+    """
+    Write phases, meeting slots, focus blocks and EBI48 slots to a fresh SQLite database.
+
+    Args:
+        path: Database file; an existing file (and its WAL/SHM) is replaced.
+        phases: Phases to export, in order.
+        exclusions: Optional holidays/exclusions applied to meetings and focus blocks.
+        batch_size: Rows per `executemany` call.
+        spec: Schedule to follow (defaults to the built-in one).
+
+    Returns:
+        dict[str, int]: Rows written per table.
+    """
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(f"{path}{suffix}"):
+            os.remove(f"{path}{suffix}")
+
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        for pragma in BULK_PRAGMAS:
+            conn.execute(pragma)
+        conn.executescript(SCHEMA)
+
+        conn.execute("BEGIN")
+        counts = {
+            "phases": _insert_batches(
+                conn,
+                "INSERT INTO phases (name, emoji, start, end, density, allow_meetings) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (p.name, p.emoji, p.start.date().isoformat(), p.end.date().isoformat(),
+                     p.meeting_density, int(p.allow_meetings))
+                    for p in phases
+                ),
+                batch_size,
+            ),
+            "ebi48_slots": _insert_batches(
+                conn,
+                "INSERT INTO ebi48_slots (slot, utc_start, glyph, face) VALUES (?, ?, ?, ?)",
+                (
+                    (slot, f"{slot // 2:02d}:{5 if slot % 2 == 0 else 35:02d}", glyph, face)
+                    for slot, glyph, face in get_all_ebi48_slots()
+                ),
+                batch_size,
+            ),
+        }
+        insert_event = (
+            "INSERT INTO events (kind, start, end, city, phase, slot, glyph, face) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+        )
+        counts["meetings"] = _insert_batches(conn, insert_event, iter_meeting_rows(phases, exclusions, spec), batch_size)
+        counts["focus_blocks"] = _insert_batches(conn, insert_event, iter_focus_rows(phases, exclusions, spec), batch_size)
+        conn.execute("COMMIT")
+
+        conn.executescript(INDEXES)
+        conn.execute("PRAGMA optimize")
+    finally:
+        conn.close()
+    return counts
@@ -0,0 +1,256 @@
+# calmoji/timezones.py
+
+"""
+Cached UTC offset transition tables built from `zoneinfo`.
+
+calmoji works in naive UTC datetimes. To show local times it needs each city's
+UTC offset at a given instant. Rather than asking `zoneinfo` for every event,
+each (zone, year) pair is scanned once into a TransitionTable: a sorted list of
+UTC instants at which the offset changes, plus the offset and abbreviation in
+force from each instant on. Looking up an offset is then a `bisect`.
+
+The same tables drive `to_local` / `tz_abbreviation` conversions and the
+VTIMEZONE blocks written alongside TZID-based (local time) events.
+"""
+
+import datetime
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Union
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# 🌐 IANA zones for the cities in MEETING_SLOTS
+CITY_TIMEZONES: dict[str, str] = {
+    "Auckland": "Pacific/Auckland",
+    "Tokyo": "Asia/Tokyo",
+    "Delhi": "Asia/Kolkata",
+    "Mecca": "Asia/Riyadh",
+    "Brussels": "Europe/Brussels",
+    "Havana": "America/Havana",
+    "Seattle": "America/Los_Angeles",
+}
+
+EPOCH = datetime.datetime(1970, 1, 1)
+SECONDS_PER_DAY = 86400
+
+
+def utc_timestamp(dt: Union[datetime.datetime, datetime.date]) -> int:
+    """Seconds since the Unix epoch for a naive UTC datetime (or a date at 00:00 UTC)."""
+    if not isinstance(dt, datetime.datetime):
+        dt = datetime.datetime(dt.year, dt.month, dt.day)
+    return (dt - EPOCH) // datetime.timedelta(seconds=1)
+
+
+def resolve_tz_name(city_or_tz: str) -> str:
+    """Map a MEETING_SLOTS city name to its IANA zone; other names pass through unchanged."""
+    return CITY_TIMEZONES.get(city_or_tz, city_or_tz)
+
+
+def check_tz_name(city_or_tz: str) -> str:
+    """Resolve a city or IANA name (see `resolve_tz_name`) and check the zone exists, raising ValueError if not."""
+    tz_name = resolve_tz_name(city_or_tz)
+    get_zone(tz_name)
+    return tz_name
+
+
+@lru_cache(maxsize=None)
+def get_zone(tz_name: str) -> ZoneInfo:
+    """Return the ZoneInfo for an IANA name, raising ValueError for unknown zones."""
+    try:
+        return ZoneInfo(tz_name)
+    except (ZoneInfoNotFoundError, ValueError) as e:
+        raise ValueError(f"Unknown time zone: {tz_name}") from e
+
+
+@dataclass(frozen=True)
+class TransitionTable:
+    """
+    UTC offset runs for one zone over one calendar year (UTC).
+
+    `starts[i]` is the epoch second at which `offsets[i]` (seconds east of UTC)
+    and abbreviation `names[i]` take effect. `starts[0]` is 1 January 00:00 UTC.
+    """
+    tz_name: str
+    year: int
+    starts: tuple[int, ...]
+    offsets: tuple[int, ...]
+    names: tuple[str, ...]
+
+    @property
+    def end(self) -> int:
+        """Epoch second at which the table stops applying (next 1 January 00:00 UTC)."""
+        return utc_timestamp(datetime.date(self.year + 1, 1, 1))
+
+    def index_at(self, ts: int) -> int:
+        return max(bisect_right(self.starts, ts) - 1, 0)
+
+    def offset_at(self, ts: int) -> int:
+        return self.offsets[self.index_at(ts)]
+
+    def name_at(self, ts: int) -> str:
+        return self.names[self.index_at(ts)]
+
+
+def _offset_and_name(zone: ZoneInfo, ts: int) -> tuple[int, str]:
+    local = datetime.datetime.fromtimestamp(ts, zone)
+    return int(local.utcoffset().total_seconds()), local.tzname() or ""
+
+
+@lru_cache(maxsize=None)
+def get_transition_table(tz_name: str, year: int) -> TransitionTable:
+    """
+    Build (once) the offset transition table for a zone and UTC calendar year.
+
+    The year is sampled at every UTC midnight; whenever the offset or
+    abbreviation differs between two samples, the exact transition second is
+    located by bisection.
+    """
+    zone = get_zone(tz_name)
+    day = utc_timestamp(datetime.date(year, 1, 1))
+    year_end = utc_timestamp(datetime.date(year + 1, 1, 1))
+
+    current = _offset_and_name(zone, day)
+    starts, offsets, names = [day], [current[0]], [current[1]]
+
+    while day < year_end:
+        next_day = min(day + SECONDS_PER_DAY, year_end)
+        sample = _offset_and_name(zone, next_day)
+        if sample != current:
+            lo, hi = day, next_day  # current holds at lo, sample holds at hi
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if _offset_and_name(zone, mid) == current:
+                    lo = mid
+                else:
+                    hi = mid
+            if hi < year_end:
+                starts.append(hi)
+                offsets.append(sample[0])
+                names.append(sample[1])
+            current = sample
+        day = next_day
+
+    return TransitionTable(tz_name, year, tuple(starts), tuple(offsets), tuple(names))
+
+
+def offset_runs(tz_name: str, start_ts: int, end_ts: int) -> list[tuple[int, int, int, str]]:
+    """
+    Return the constant-offset runs covering [start_ts, end_ts).
+
+    Each run is (run_start, run_end, offset_seconds, abbreviation), clipped to
+    the requested window; adjacent runs with the same offset and name are merged.
+    """
+    runs: list[tuple[int, int, int, str]] = []
+    first_year = (EPOCH + datetime.timedelta(seconds=start_ts)).year
+    last_year = (EPOCH + datetime.timedelta(seconds=max(end_ts - 1, start_ts))).year
+
+    for year in range(first_year, last_year + 1):
+        table = get_transition_table(tz_name, year)
+        bounds = table.starts[1:] + (table.end,)
+        for run_start, run_end, offset, name in zip(table.starts, bounds, table.offsets, table.names):
+            lo, hi = max(run_start, start_ts), min(run_end, end_ts)
+            if lo >= hi:
+                continue
+            if runs and runs[-1][1] == lo and runs[-1][2:] == (offset, name):
+                runs[-1] = (runs[-1][0], hi, offset, name)
+            else:
+                runs.append((lo, hi, offset, name))
+    return runs
+
+
+# 🔁 Conversion
+
+def to_local(dt: datetime.datetime, tz_name: str) -> datetime.datetime:
+    """Convert a naive UTC datetime to naive local wall time in `tz_name` (bisect + add)."""
+    table = get_transition_table(tz_name, dt.year)
+    return dt + datetime.timedelta(seconds=table.offset_at(utc_timestamp(dt)))
+
+
+def to_utc(local: datetime.datetime, tz_name: str) -> datetime.datetime:
+    """
+    Convert naive local wall time in `tz_name` back to naive UTC.
+
+    Ambiguous wall times (the repeated hour when clocks go back) resolve to
+    the later occurrence; wall times inside a spring-forward gap are read with
+    the offset in force after the gap.
+    """
+    guess = local
+    for _ in range(3):
+        table = get_transition_table(tz_name, guess.year)
+        candidate = local - datetime.timedelta(seconds=table.offset_at(utc_timestamp(guess)))
+        if candidate == guess:
+            break
+        guess = candidate
+    return guess
+
+
+def tz_abbreviation(dt: datetime.datetime, tz_name: str) -> str:
+    """Return the zone abbreviation (e.g. 'CEST') in force at a naive UTC datetime."""
+    return get_transition_table(tz_name, dt.year).name_at(utc_timestamp(dt))
+
+
+# 🗺️ VTIMEZONE emission
+
+def _format_utc_offset(seconds: int) -> str:
+    sign = "-" if seconds < 0 else "+"
+    hours, rest = divmod(abs(seconds), 3600)
+    minutes, secs = divmod(rest, 60)
+    return f"{sign}{hours:02d}{minutes:02d}" + (f"{secs:02d}" if secs else "")
+
+
+def _observance(kind: str, onset_ts: int, offset_from: int, offset_to: int, name: str) -> str:
+    # DTSTART of an observance is the onset in local time of the offset being left
+    onset_local = EPOCH + datetime.timedelta(seconds=onset_ts + offset_from)
+    return "\r\n".join([
+        f"BEGIN:{kind}",
+        f"DTSTART:{onset_local:%Y%m%dT%H%M%S}",
+        f"TZOFFSETFROM:{_format_utc_offset(offset_from)}",
+        f"TZOFFSETTO:{_format_utc_offset(offset_to)}",
+        f"TZNAME:{name}",
+        f"END:{kind}",
+    ])
+
+
+@lru_cache(maxsize=None)
+def vtimezone_observances(tz_name: str, year: int) -> tuple[str, ...]:
+    """
+    Return the STANDARD/DAYLIGHT components needed to interpret local times in a year.
+
+    The first component is the onset of the offset in force on 1 January (taken
+    from the latest earlier transition), followed by every transition in the year.
+    """
+    table = get_transition_table(tz_name, year)
+    standard = min(table.offsets)
+
+    def kind(offset: int) -> str:
+        return "DAYLIGHT" if offset > standard else "STANDARD"
+
+    # Find the onset of the offset in force at the start of the year
+    onset = None
+    for previous_year in range(year - 1, year - 11, -1):
+        previous = get_transition_table(tz_name, previous_year)
+        if len(previous.starts) > 1:
+            onset = (previous.starts[-1], previous.offsets[-2], previous.offsets[-1], previous.names[-1])
+            break
+
+    if onset is None:
+        components = [_observance("STANDARD", 0, table.offsets[0], table.offsets[0], table.names[0])]
+    else:
+        components = [_observance(kind(onset[2]), *onset)]
+
+    for i in range(1, len(table.starts)):
+        components.append(_observance(
+            kind(table.offsets[i]), table.starts[i], table.offsets[i - 1], table.offsets[i], table.names[i]
+        ))
+    return tuple(components)
+
+
+def vtimezone_block(tz_name: str, years: Iterable[int]) -> str:
+    """Return one VTIMEZONE component covering all the given years, built from cached observances."""
+    components: list[str] = []
+    for year in sorted(set(years)):
+        for component in vtimezone_observances(tz_name, year):
+            if component not in components:
+                components.append(component)
+    return "\r\n".join(["BEGIN:VTIMEZONE", f"TZID:{tz_name}", *components, "END:VTIMEZONE"]) + "\r\n"
@@ -1,10 +1,58 @@
 # calmoji/types.py
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
 from typing import Optional, List, Union
-from calmoji.uid import generate_uid
-from hashlib import sha256
+from calmoji.reporter import DEBUG, get_reporter
+from calmoji.timezones import to_local
+
+
+CRLF = "\r\n"  # RFC 5545 content lines end with CRLF
+MAX_LINE_OCTETS = 75
+
+
+def fold_ics_line(line: str, limit: int = MAX_LINE_OCTETS, newline: str = CRLF) -> str:
+    """
+    Fold a content line per RFC 5545 section 3.1: at most `limit` octets per
+    line, continuations indented by one space, never splitting a UTF-8 character.
+    """
+    if len(line) <= limit and line.isascii():
+        return line
+    encoded = line.encode("utf-8")
+    if len(encoded) <= limit:
+        return line
+    parts = []
+    width = limit
+    while len(encoded) > width:
+        cut = width
+        while encoded[cut] & 0xC0 == 0x80:  # Back off to the start of a multi-octet character
+            cut -= 1
+        parts.append(encoded[:cut])
+        encoded = encoded[cut:]
+        width = limit - 1  # Room for the leading space
+    parts.append(encoded)
+    return (newline + " ").join(part.decode("utf-8") for part in parts)
+
+
+def escape_ics_text(value: str) -> str:
+    """Escape a TEXT property value per RFC 5545 section 3.3.11."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def event_uid(start: Union[datetime, date], summary: str, all_day: bool = False) -> str:
+    """The deterministic UID an Event gets when none is given."""
+    from hashlib import sha256  # Deferred so importing the types does not load OpenSSL
+    from calmoji.uid import generate_uid
+
+    dt_str = start.strftime('%Y%m%dT%H%M%S') if not all_day else start.strftime('%Y%m%d')
+    label = int(sha256((summary + dt_str).encode()).hexdigest(), 16) & 0xffffffff
+    return generate_uid(dt=start, label=label, namespace="calmoji")
 
 
 @dataclass
@@ -19,12 +67,15 @@ class Event:
     recurrence: Optional[str] = None
     private: bool = True
     transparent: bool = True
+    kind: str = "event"  # Options: 'meeting', 'focus', 'phase', 'ebi48'
+    city: Optional[str] = None
+    phase: Optional[str] = None
+    exdates: List[datetime] = field(default_factory=list)  # Excluded recurrence starts (UTC)
+    recurrence_tzid: Optional[str] = None  # Zone whose wall time the RRULE repeats in (None: UTC)
     
     def __post_init__(self):
         if self.uid is None:
-            dt_str = self.start.strftime('%Y%m%dT%H%M%S') if not self.all_day else self.start.strftime('%Y%m%d')
-            label = int(sha256((self.summary + dt_str).encode()).hexdigest(), 16) & 0xffffffff
-            self.uid = generate_uid(dt=self.start, label=label, namespace="calmoji")
+            self.uid = event_uid(self.start, self.summary, self.all_day)
 
         if self.all_day:
             if isinstance(self.start, datetime):
@@ -38,44 +89,56 @@ class Event:
                 self.end = self.start + timedelta(hours=1)
         
 
-    def dtstart(self) -> str:
+    def dtstart(self, tzid: Optional[str] = None) -> str:
         if self.all_day:
             return f"DTSTART;VALUE=DATE:{self.start.strftime('%Y%m%d')}"
+        if tzid:
+            return f"DTSTART;TZID={tzid}:{to_local(self.start, tzid).strftime('%Y%m%dT%H%M%S')}"
         return f"DTSTART:{self.start.strftime('%Y%m%dT%H%M%S')}"
 
-    def dtend(self) -> str:
+    def dtend(self, tzid: Optional[str] = None) -> str:
         if self.all_day:
             return f"DTEND;VALUE=DATE:{self.end.strftime('%Y%m%d')}"
+        if tzid:
+            return f"DTEND;TZID={tzid}:{to_local(self.end, tzid).strftime('%Y%m%dT%H%M%S')}"
         return f"DTEND:{self.end.strftime('%Y%m%dT%H%M%S')}"
 
-    def to_ics(self) -> str:
+    def exdate(self, tzid: Optional[str] = None) -> str:
+        if tzid:
+            values = ",".join(to_local(dt, tzid).strftime('%Y%m%dT%H%M%S') for dt in self.exdates)
+            return f"EXDATE;TZID={tzid}:{values}"
+        return f"EXDATE:{','.join(dt.strftime('%Y%m%dT%H%M%S') for dt in self.exdates)}"
+
+    def to_ics(self, tzid: Optional[str] = None) -> str:
+        """
+        Serialize as a VEVENT. Timed events are written in UTC, or as local
+        wall time with a TZID parameter when `tzid` is given.
+        """
         lines = [
             "BEGIN:VEVENT",
             f"UID:{self.uid}",
         ]
         summary = f"{self.emoji} {self.summary}" if self.emoji else self.summary
-        lines.append(f"SUMMARY:{summary}")
+        lines.append(f"SUMMARY:{escape_ics_text(summary)}")
 
-        if self.all_day:
-            lines.append(f"DTSTART;VALUE=DATE:{self.start.strftime('%Y%m%d')}")
-            lines.append(f"DTEND;VALUE=DATE:{(self.end).strftime('%Y%m%d')}")
-        else:
-            lines.append(f"DTSTART:{self.start.strftime('%Y%m%dT%H%M%S')}")
-            lines.append(f"DTEND:{self.end.strftime('%Y%m%dT%H%M%S')}")
+        lines.append(self.dtstart(tzid))
+        lines.append(self.dtend(tzid))
 
         if self.description:
-            lines.append(f"DESCRIPTION:{self.description}")
+            lines.append(f"DESCRIPTION:{escape_ics_text(self.description)}")
         if self.recurrence:
             lines.append(f"RRULE:{self.recurrence}")
+            if self.exdates:
+                lines.append(self.exdate(tzid))
         lines.append(f"CLASS:{'PRIVATE' if self.private else 'PUBLIC'}")
         lines.append(f"TRANSP:{'TRANSPARENT' if self.transparent else 'OPAQUE'}")
         lines.append("END:VEVENT")
-        
-        print(f"📆 Serializing all-day event: {self.summary}")
-        print(f"  DTSTART: {self.start}")
-        print(f"  DTEND:   {self.end}")
-        
-        return "\n".join(lines) + "\n"
+
+        reporter = get_reporter()
+        if reporter.enabled(DEBUG):
+            reporter.debug(f"📆 Serialized {self.kind} event: {self.summary} ({self.start} → {self.end})")
+
+        return CRLF.join(map(fold_ics_line, lines)) + CRLF
 
 
 @dataclass
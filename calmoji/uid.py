@@ -8,3 +8,8 @@ def generate_uid(dt: datetime.datetime, label: str, namespace: str = "calmoji")
     raw = f"{namespace}:{dt.isoformat()}:{label}"
     uid_hash = sha256(raw.encode("utf-8")).hexdigest()[:16]
     return f"{uid_hash}-{dt.strftime('%Y%m%dT%H%M%S')}@{namespace}.local"
+
+
+def ebi48_instance_uid(start: datetime.datetime, namespace: str = "calmoji") -> str:
+    """UID of one expanded EBI48 instance: its start time alone identifies it, so no hash is needed."""
+    return f"ebi48-{start.strftime('%Y%m%dT%H%M%S')}@{namespace}.local"
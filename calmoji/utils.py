@@ -7,8 +7,9 @@ import unicodedata
 from typing import Union, Dict, List, Tuple
 from collections import defaultdict
 from calmoji.uid import generate_uid
-from calmoji.types import Phase, PhaseWeekSpan
+from calmoji.types import Phase, PhaseWeekSpan, fold_ics_line  # fold_ics_line: re-exported
 from calmoji.focus_blocks_config import ACTIVE_WEEKDAYS
+from calmoji.timezones import resolve_tz_name, to_local, tz_abbreviation
 
 
 def parse_start_date(start_str):
@@ -28,9 +29,13 @@ def format_range_slug(start_date, end_date):
 
 def format_time_for_tz(dt, tz_name):
     """
-    Convert dt to tz and format as string
+    Convert a naive UTC datetime to a time zone and format it as 'HH:MM ABBR'.
+
+    Accepts IANA names ("Europe/Brussels") or MEETING_SLOTS cities ("Brussels").
+    Offsets come from the cached transition tables in calmoji.timezones.
     """
-    raise NotImplementedError("Timezone formatting not yet implemented.")
+    tz_name = resolve_tz_name(tz_name)
+    return f"{to_local(dt, tz_name):%H:%M} {tz_abbreviation(dt, tz_name)}"
 
 def get_first_weekday_of_year(year: int, weekday: Union[str, int]) -> datetime.datetime:
     """
@@ -71,12 +76,12 @@ def get_first_weekday_of_year(year: int, weekday: Union[str, int]) -> datetime.d
     return d.replace(hour=0, minute=5)
 
 
-def get_start_date_from_year(year: int) -> datetime:
+def get_start_date_from_year(year: int, month: int = 9, day: int = 15) -> datetime:
     """
     Given a year (e.g. 2024), returns the academic year start date
-    (September 15th of that year) as a datetime object.
+    (September 15th of that year, unless another month/day is given) as a datetime object.
     """
-    return parse_start_date(f"{year}-09-15")
+    return parse_start_date(f"{year}-{month:02d}-{day:02d}")
 
 def get_first_monday_after(d):
     """
@@ -119,11 +124,3 @@ def group_phase_days_by_week(phase: Phase) -> list[PhaseWeekSpan]:
     ]
 
 
-def fold_ics_line(line: str, limit: int = 75) -> str:
-    """Fold ICS lines per RFC 5545 section 3.1 (fold at 75 octets, indent with space)."""
-    folded = []
-    while len(line) > limit:
-        folded.append(line[:limit])
-        line = " " + line[limit:]
-    folded.append(line)
-    return "\r\n".join(folded)
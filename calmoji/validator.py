@@ -0,0 +1,249 @@
+# calmoji/validator.py
+
+"""
+Streaming RFC 5545 validation of .ics files, before a calendar client sees them.
+
+    reports = validate_paths(["output/"])      # every .ics under output/, files in parallel
+    for report in reports:
+        for issue in report.issues:
+            print(issue)
+
+Each file is memory-mapped and read in one pass, line by line, without
+decoding. The pass checks:
+
+* line endings: every line ends in CRLF, with no stray CR (`crlf`);
+* line length: at most 75 octets before the CRLF, so emoji count as their
+  UTF-8 bytes (`line-length`);
+* syntax: every content line is NAME[;PARAMS]:VALUE (`syntax`), which
+  catches a component written one character per line;
+* BEGIN/END nesting, and nothing outside VCALENDAR (`nesting`);
+* required properties: PRODID and VERSION in VCALENDAR, UID and DTSTART
+  in VEVENT (`required`). DTSTAMP is not required, because calmoji leaves
+  it out to keep its output byte-reproducible;
+* UID uniqueness within a file, except for RECURRENCE-ID overrides (`uid`);
+* a VTIMEZONE in the file for every TZID parameter used (`tzid`);
+* DTSTART before DTEND, when both are written the same way (same
+  parameters, both UTC or both not) (`dtstart-dtend`);
+* RRULE values without a doubled `RRULE:` prefix (`rrule`).
+
+Memory use stays constant per file. Only the current component's few
+properties, the set of UIDs seen and the TZIDs used and defined are kept.
+"""
+
+import mmap
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, NamedTuple, Optional, Union
+
+from calmoji.delta import iter_ics_files
+from calmoji.types import MAX_LINE_OCTETS
+
+PathLike = Union[str, os.PathLike]
+
+MAX_ISSUES_PER_CODE = 20  # Per file; further issues are only counted
+
+REQUIRED_PROPERTIES = {
+    b"VCALENDAR": (b"PRODID", b"VERSION"),
+    b"VEVENT": (b"UID", b"DTSTART"),
+}
+# Properties of a component that the checks need, by name
+_TRACKED = frozenset((b"UID", b"DTSTART", b"DTEND", b"RRULE", b"RECURRENCE-ID", b"PRODID", b"VERSION"))
+_TZID_PARAM = re.compile(rb'(?:^|;)TZID="?([^";]*)"?', re.IGNORECASE)
+
+
+class Issue(NamedTuple):
+    """One problem, at a 1-based physical line."""
+    path: str
+    line: int
+    code: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.line}: {self.code}: {self.message}"
+
+
+@dataclass
+class FileReport:
+    """What validating one file found."""
+    path: str
+    lines: int = 0
+    events: int = 0
+    issues: list[Issue] = field(default_factory=list)  # The first MAX_ISSUES_PER_CODE of each code
+    counts: Counter = field(default_factory=Counter)  # Every issue, by code
+
+    @property
+    def ok(self) -> bool:
+        return not self.counts
+
+    def add(self, line: int, code: str, message: str) -> None:
+        self.counts[code] += 1
+        if self.counts[code] <= MAX_ISSUES_PER_CODE:
+            self.issues.append(Issue(self.path, line, code, message))
+
+
+def _compare_key(value: bytes) -> bytes:
+    # DATE and DATE-TIME values sort chronologically as text once a trailing Z is dropped
+    return value[:-1] if value.endswith(b"Z") else value
+
+
+class _FileState:
+    """What one pass remembers beyond the open components."""
+    __slots__ = ("uids", "tzids_used", "tzids_defined")
+
+    def __init__(self):
+        self.uids: set[bytes] = set()
+        self.tzids_used: dict[bytes, int] = {}  # TZID → first line referring to it
+        self.tzids_defined: set[bytes] = set()
+
+
+class _Component:
+    __slots__ = ("name", "line", "props")
+
+    def __init__(self, name: bytes, line: int):
+        self.name = name
+        self.line = line
+        self.props: dict[bytes, tuple[bytes, bytes]] = {}  # name → (params, value)
+
+
+def _check_content_line(report: FileReport, stack: list[_Component], state: _FileState, line: bytes, lineno: int) -> None:
+    colon = line.find(b":")
+    if colon <= 0:
+        report.add(lineno, "syntax", f"not a NAME:VALUE content line: {line[:40]!r}")
+        return
+    head, value = line[:colon], line[colon + 1:]
+    semi = head.find(b";")
+    name, params = (head[:semi], head[semi + 1:]) if semi != -1 else (head, b"")
+    name = name.upper()
+
+    if name == b"BEGIN":
+        if not stack and value.upper() != b"VCALENDAR":
+            report.add(lineno, "nesting", f"BEGIN:{value.decode(errors='replace')} outside VCALENDAR")
+        stack.append(_Component(value.upper(), lineno))
+        return
+    if name == b"END":
+        if not stack or stack[-1].name != value.upper():
+            open_name = stack[-1].name.decode(errors="replace") if stack else "nothing"
+            report.add(lineno, "nesting", f"END:{value.decode(errors='replace')} closes {open_name}")
+            return
+        _close_component(report, stack.pop(), state.uids)
+        return
+    if not stack:
+        report.add(lineno, "nesting", f"{name.decode(errors='replace')} outside any component")
+        return
+    if b"TZID=" in params.upper():
+        for tzid in _TZID_PARAM.findall(params):
+            state.tzids_used.setdefault(tzid, lineno)
+    elif name == b"TZID" and stack[-1].name == b"VTIMEZONE":
+        state.tzids_defined.add(value)
+    if name in _TRACKED:
+        stack[-1].props.setdefault(name, (params, value))
+        if name == b"RRULE" and value.upper().startswith(b"RRULE:"):
+            report.add(lineno, "rrule", "doubled RRULE: prefix")
+
+
+def _close_component(report: FileReport, component: _Component, uids: set[bytes]) -> None:
+    props = component.props
+    for required in REQUIRED_PROPERTIES.get(component.name, ()):
+        if required not in props:
+            report.add(component.line, "required",
+                       f"{component.name.decode()} without {required.decode()}")
+    if component.name != b"VEVENT":
+        return
+    report.events += 1
+
+    uid = props.get(b"UID", (b"", b""))[1]
+    if uid and b"RECURRENCE-ID" not in props:
+        if uid in uids:
+            report.add(component.line, "uid", f"duplicate UID {uid.decode(errors='replace')}")
+        uids.add(uid)
+
+    if b"DTSTART" in props and b"DTEND" in props:
+        (start_params, start), (end_params, end) = props[b"DTSTART"], props[b"DTEND"]
+        # Values only compare as text when they are written the same way: same zone, both UTC or neither
+        if start_params.upper() != end_params.upper() or start.endswith(b"Z") != end.endswith(b"Z"):
+            return
+        start, end = _compare_key(start), _compare_key(end)
+        if len(start) == len(end) and start >= end:
+            report.add(component.line, "dtstart-dtend",
+                       f"DTSTART {start.decode(errors='replace')} is not before DTEND {end.decode(errors='replace')}")
+
+
+def validate_file(path: PathLike) -> FileReport:
+    """
+    Validate one .ics file in a single streaming pass over its memory map.
+
+    Returns:
+        FileReport: Line and event counts, and the issues found.
+    """
+    report = FileReport(str(path))
+    stack: list[_Component] = []
+    state = _FileState()
+    pending: Optional[bytes] = None  # The content line being unfolded
+    pending_line = 0
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            report.add(0, "required", "empty file")
+            return report
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lineno = 0
+            for raw in iter(mm.readline, b""):
+                lineno += 1
+                if raw.endswith(b"\r\n"):
+                    body = raw[:-2]
+                else:
+                    body = raw[:-1] if raw.endswith(b"\n") else raw
+                    report.add(lineno, "crlf", "line does not end in CRLF")
+                if b"\r" in body:
+                    report.add(lineno, "crlf", "stray CR inside a line")
+                if len(body) > MAX_LINE_OCTETS:
+                    report.add(lineno, "line-length", f"{len(body)} octets (limit {MAX_LINE_OCTETS}); fold the line")
+
+                if body[:1] in (b" ", b"\t"):
+                    if pending is None:
+                        report.add(lineno, "syntax", "continuation line without a content line")
+                    else:
+                        pending += body[1:]
+                    continue
+                if pending is not None:
+                    _check_content_line(report, stack, state, pending, pending_line)
+                if body:
+                    pending, pending_line = body, lineno
+                else:
+                    pending = None
+                    report.add(lineno, "syntax", "empty line")
+            if pending is not None:
+                _check_content_line(report, stack, state, pending, pending_line)
+            report.lines = lineno
+
+    for component in reversed(stack):
+        report.add(component.line, "nesting", f"BEGIN:{component.name.decode(errors='replace')} never ends")
+    for tzid, line in state.tzids_used.items():
+        if tzid not in state.tzids_defined:
+            report.add(line, "tzid", f"TZID {tzid.decode(errors='replace')} has no VTIMEZONE in this file")
+    return report
+
+
+def validate_paths(paths: Iterable[PathLike], workers: Optional[int] = None) -> list[FileReport]:
+    """
+    Validate files and directories, spreading the files over a process pool.
+
+    Args:
+        paths: .ics files and/or directories to search for them.
+        workers: Worker processes (default: CPU count); 1 validates in-process.
+
+    Returns:
+        list[FileReport]: One report per file, in path order.
+    """
+    files = [path for source in paths for path in iter_ics_files(source)]
+    workers = min(workers or os.cpu_count() or 1, len(files))
+    if workers <= 1:
+        return [validate_file(path) for path in files]
+    # Largest files first, so a big combined calendar does not finish last
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        by_size = sorted(files, key=lambda p: p.stat().st_size, reverse=True)
+        reports = dict(zip(by_size, pool.map(validate_file, by_size)))
+    return [reports[path] for path in files]
@@ -0,0 +1,72 @@
+# tests/test_assignment.py
+
+from calmoji.assignment import (
+    Participant,
+    assign_participants,
+    meeting_slot_options,
+    write_participant_calendars,
+)
+from calmoji.calendar_phases import get_semester_phases
+from calmoji.utils import get_start_date_from_year
+
+
+def _slots():
+    return meeting_slot_options(include_oceania=False)
+
+
+def test_slot_options_follow_meeting_slots():
+    slots = _slots()
+    assert all(slot.city != "Auckland" for slot in slots)
+    tokyo = [s for s in slots if s.city == "Tokyo"]
+    assert [s.ebi48_slot for s in tokyo] == [9, 10]  # 04:35 Otter, 05:05 Fox
+
+
+def test_assignment_respects_availability_and_capacity():
+    slots = _slots()
+    faces = [s.ebi48_slot for s in slots]
+    participants = [Participant(f"p{i}", frozenset({faces[i % len(faces)], faces[(i + 3) % len(faces)]})) for i in range(60)]
+
+    result = assign_participants(participants, capacities=5, slots=slots)
+    face_of = {s.key: s.ebi48_slot for s in slots}
+    available = {p.id: p.available_slots for p in participants}
+
+    assert not result.unassigned
+    assert all(face_of[key] in available[pid] for pid, key in result.slot_of.items())
+    assert max(result.loads().values()) <= 5
+
+
+def test_local_search_places_participant_by_bumping():
+    slots = [s for s in _slots() if s.city in ("Tokyo", "Delhi")]  # faces 9, 10, 15, 16
+    participants = [
+        Participant("p0", frozenset({10, 16})),
+        Participant("p1", frozenset({9, 16})),
+        Participant("p2", frozenset({9, 10})),
+        Participant("p3", frozenset({10, 15})),
+    ]
+
+    greedy_only = assign_participants(participants, capacities=1, slots=slots, max_rounds=0)
+    result = assign_participants(participants, capacities=1, slots=slots)
+
+    assert greedy_only.unassigned == ["p2"]
+    assert result.unassigned == []
+    assert sorted(result.loads().values()) == [1, 1, 1, 1]
+
+
+def test_unplaceable_participants_are_reported():
+    participants = [Participant("night-owl", frozenset({0}))]  # 00:05 UTC has no city slot
+    result = assign_participants(participants, capacities=10, slots=_slots())
+    assert result.unassigned == ["night-owl"]
+
+
+def test_write_participant_calendars(tmp_path):
+    slots = _slots()
+    brussels = next(s for s in slots if s.city == "Brussels")
+    result = assign_participants([Participant("Ada L.", frozenset({brussels.ebi48_slot}))], 1, slots=slots)
+    phases = get_semester_phases(get_start_date_from_year(2024))[:1]
+
+    [path] = write_participant_calendars(result, phases, output_dir=str(tmp_path))
+    content = open(path, encoding="utf-8").read()
+
+    assert path.endswith("participant_ada_l.ics")
+    assert content.count("BEGIN:VEVENT") > 0
+    assert "Brussels" in content and "Tokyo" not in content
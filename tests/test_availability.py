@@ -0,0 +1,75 @@
+# tests/test_availability.py
+
+import datetime
+import pytest
+from calmoji.availability import (
+    FULL_DAY_MASK,
+    AvailabilityCalendar,
+    city_meeting_masks,
+    common_free_slots,
+    focus_block_masks,
+    intersect_all,
+    mask_labels,
+    mask_slots,
+    slot_mask,
+    union_all,
+)
+from calmoji.ebi48 import get_emoji_for_time
+from calmoji.meeting_slots import MEETING_SLOTS
+
+START = datetime.date(2025, 1, 6)  # Monday
+
+
+def test_slot_mask_roundtrip_and_labels():
+    mask = slot_mask([0, 10, 47])
+    assert mask_slots(mask) == [0, 10, 47]
+    assert mask_labels(slot_mask([10])) == ["🦊 Fox Face"]
+    with pytest.raises(ValueError):
+        slot_mask([48])
+
+
+def test_meeting_masks_match_ebi48_faces():
+    masks = city_meeting_masks()
+    for city, sh, sm, *_ in MEETING_SLOTS:
+        emoji, face = get_emoji_for_time(datetime.datetime(2025, 1, 1, sh, sm))
+        assert any(label == f"{emoji} {face}" for label in mask_labels(masks[city]))
+    assert all(mask.bit_count() == 2 for mask in masks.values())
+
+
+def test_focus_block_masks_cover_overlapping_slots():
+    masks = focus_block_masks()
+    # Block 1 runs 00:00–01:36 → slots 00:05, 00:35, 01:05, 01:35
+    assert mask_slots(masks[1]) == [0, 1, 2, 3]
+    assert len(masks) == 12
+
+
+def test_weekly_pattern_and_algebra():
+    alice = AvailabilityCalendar.from_weekly(START, 14, {0: slot_mask([1, 2, 3]), 2: slot_mask([5])})
+    bob = AvailabilityCalendar.from_weekly(START, 14, {0: slot_mask([2, 3, 4])})
+
+    both = alice & bob
+    either = alice | bob
+    assert both.free_slots(START) == [2, 3]
+    assert either.free_slots(START) == [1, 2, 3, 4]
+    assert either.free_slots(START + datetime.timedelta(days=9)) == [5]
+    assert both.popcount() == 4
+    assert common_free_slots([alice, bob]) == {
+        START: [2, 3],
+        START + datetime.timedelta(days=7): [2, 3],
+    }
+    assert (~alice).mask_on(START) == FULL_DAY_MASK & ~slot_mask([1, 2, 3])
+
+
+def test_bulk_intersection_matches_per_day_reduction():
+    calendars = [
+        AvailabilityCalendar(START, [(FULL_DAY_MASK >> (i % 5)) & ~(1 << (d % 48)) for d in range(30)])
+        for i in range(50)
+    ]
+    expected = [FULL_DAY_MASK >> 4 & ~(1 << (d % 48)) for d in range(30)]
+    assert list(intersect_all(calendars).days) == expected
+    assert list(union_all(calendars).days) == [FULL_DAY_MASK & ~(1 << (d % 48)) for d in range(30)]
+
+
+def test_misaligned_calendars_raise():
+    with pytest.raises(ValueError):
+        intersect_all([AvailabilityCalendar.empty(START, 7), AvailabilityCalendar.empty(START, 8)])
@@ -0,0 +1,46 @@
+# tests/test_batch.py
+
+import json
+from calmoji.batch import plan_workers, run_batch
+from calmoji.ics_reader import iter_vevents
+from calmoji.spec import builtin_config, compile_spec
+
+
+def write_tenants(directory, configs):
+    directory.mkdir()
+    for name, config in configs.items():
+        (directory / f"{name}.json").write_text(json.dumps(config), encoding="utf-8")
+
+
+def test_tenants_share_fragments(tmp_path):
+    late_start = {**builtin_config(), "year_start": "10-01", "disabled_cities": ["Auckland", "Seattle"]}
+    write_tenants(tmp_path / "tenants", {"alpha": builtin_config(), "beta": builtin_config(), "gamma": late_start})
+    report = run_batch(tmp_path / "tenants", 2025, output_dir=tmp_path / "out", workers=1, cache_dir=None)
+
+    assert report.tenants == 3 and report.distinct_specs == 2
+    # beta reuses all of alpha's 66 fragments (9 phases × (6 cities + focus), markers, 2 EBI48 years);
+    # gamma's dates differ, so it only reuses the EBI48 years
+    assert report.fragments_reused == 66 + 2
+    alpha, beta, gamma = ({r.uid: r for r in iter_vevents(path)} for path in report.paths)
+    assert alpha.keys() == beta.keys()
+    assert not any(r.summary.startswith("Seattle") for r in gamma.values())
+    assert min(r.dtstart for r in gamma.values() if r.summary.startswith("Tokyo")).startswith("20251001")
+
+
+def test_pool_output_matches_in_process(tmp_path):
+    configs = {f"t{i}": {**builtin_config(), "year_start": f"09-{10 + i % 3:02d}"} for i in range(6)}
+    write_tenants(tmp_path / "tenants", configs)
+    serial = run_batch(tmp_path / "tenants", 2025, output_dir=tmp_path / "a", workers=1, ebi48=False, cache_dir=None)
+    pooled = run_batch(tmp_path / "tenants", 2025, output_dir=tmp_path / "b", workers=3, ebi48=False, cache_dir=None)
+
+    assert pooled.workers == 3 and pooled.tenants == serial.tenants == 6
+    for a, b in zip(sorted(serial.paths), sorted(pooled.paths)):
+        assert a.read_bytes() == b.read_bytes()
+
+
+def test_plan_workers_keeps_calendars_together():
+    base, late = compile_spec(builtin_config()), compile_spec({**builtin_config(), "year_start": "10-01"})
+    tenants = [("a", base), ("b", late), ("c", base), ("d", base)]
+    groups = plan_workers(tenants, workers=4)
+    assert sorted(len(g) for g in groups) == [1, 3]
+    assert all(len({spec.start_month for _, spec in group}) == 1 for group in groups)
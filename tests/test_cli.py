@@ -0,0 +1,69 @@
+# tests/test_cli.py
+
+import datetime
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+from calmoji.cli import main
+from calmoji.ebi48 import get_slot_for_time, slot_time_range
+from calmoji.reporter import NORMAL, configure
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative import time allowed for the `calmoji ebi48` fast path (generous: it measures ~10 ms)
+EBI48_IMPORT_BUDGET_US = 40_000
+HEAVY_MODULES = ("calmoji.types", "calmoji.config", "calmoji.slot_generator", "hashlib", "zoneinfo", "_strptime")
+
+
+def test_ebi48_command(capsys):
+    main(["ebi48", "04:40"])
+    assert capsys.readouterr().out == "🦦 Otter Face — slot 9 (04:35–05:00 UTC)\n"
+    assert slot_time_range(47) == ("23:35", "00:00")
+    assert get_slot_for_time(datetime.datetime(2025, 1, 1, 0, 2)) == 47  # Before 00:05 is still yesterday's last slot
+
+
+def test_next_lists_upcoming_slots_for_a_city(capsys):
+    main(["next", "--city", "Delhi", "--count", "2", "--at", "2025-03-03T09:00"])
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 2 and all("Delhi" in line for line in lines)
+    assert lines[0].startswith("Mon 2025-03-17 08:05 UTC")  # Delhi's series skip the weeks of Mar 3 and Mar 10
+
+
+def test_generate_rejects_an_unknown_tzid_before_writing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(SystemExit, match="Unknown time zone: Europe/Brusels"):
+        main(["generate", "--tzid", "Europe/Brusels", "-q"])
+    assert not (tmp_path / "output").exists()
+
+
+def test_ebi48_query_stays_within_import_budget():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "calmoji", "ebi48", "12:05"],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.startswith("🐸 Frog Face — slot 24")
+
+    imported = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                imported[name.strip()] = int(cumulative)
+    assert "calmoji.cli" in imported
+    assert not [name for name in HEAVY_MODULES if name in imported]
+    assert sum(us for name, us in imported.items() if name in ("calmoji", "calmoji.cli", "calmoji.ebi48")) < EBI48_IMPORT_BUDGET_US
+
+
+def test_every_command_takes_the_level_flags_and_bad_times_are_usage_errors(capsys):
+    try:
+        assert main(["validate", "-q", "--workers", "1", str(REPO_ROOT / "docs")]) == 0
+        main(["ebi48", "-v", "04:40"])
+        with pytest.raises(SystemExit, match="0"):
+            main(["serve", "-q", "--help"])
+    finally:
+        configure(NORMAL)
+    assert "slot 9" in capsys.readouterr().out
+    with pytest.raises(SystemExit, match="2"):
+        main(["next", "--at", "yesterday"])
+    assert "argument --at: not 'now', HH:MM or an ISO date-time: 'yesterday'" in capsys.readouterr().err
@@ -0,0 +1,47 @@
+# tests/test_combined.py
+
+import datetime
+from calmoji.calendar_phases import get_phases_for_years
+from calmoji.combined import iter_combined, start_key, write_combined_ics
+from calmoji.focus_blocks_writer import generate_focus_block_events
+from calmoji.ics_reader import iter_vevents, record_to_event
+from calmoji.slot_generator import generate_meeting_slots
+
+
+def test_merge_is_sorted_and_complete():
+    phases = get_phases_for_years(2024)[:3]
+    merged = list(iter_combined(phases, ebi48_years=[2025]))
+
+    keys = [start_key(e) for e in merged]
+    assert keys == sorted(keys)
+
+    expected_meetings = sum(len(generate_meeting_slots(p)) for p in phases)
+    kinds = [e.kind for e in merged]
+    assert kinds.count("phase") == 3
+    assert kinds.count("meeting") == expected_meetings
+    assert kinds.count("focus") == len(generate_focus_block_events(phases))
+    assert kinds.count("ebi48") == 48
+
+
+def test_meeting_slots_cover_each_day_once():
+    phase = get_phases_for_years(2024)[0]
+    events = generate_meeting_slots(phase)
+    days = [phase.start.date() + datetime.timedelta(days=i) for i in range(phase.duration_days)]
+    brussels_days = [e.start.date() for e in events if e.city == "Brussels"]
+
+    assert len({e.uid for e in events}) == len(events)
+    # Brussels' two slots are in series 0 and 1: one slot a weekday in two weeks out of three
+    assert brussels_days == [d for d in days if d.weekday() < 5 and (d.toordinal() - 1) // 7 % 3 != 2]
+
+
+def test_multi_year_write_streams_sorted_output(tmp_path):
+    phases = get_phases_for_years(2024, years=2)
+    path = tmp_path / "combined.ics"
+    count = write_combined_ics(str(path), phases, focus_blocks=False, ebi48=False)
+
+    records = list(iter_vevents(path))
+    assert len(records) == count
+    starts = [record_to_event(r) for r in records]
+    assert [start_key(e) for e in starts] == sorted(start_key(e) for e in starts)
+    assert starts[0].start == datetime.date(2024, 9, 15)
+    assert starts[-1].start.year == 2026
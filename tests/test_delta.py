@@ -0,0 +1,78 @@
+# tests/test_delta.py
+
+import datetime
+from calmoji.delta import build_uid_index, diff_indexes, write_delta
+from calmoji.ics_reader import iter_vevents
+from calmoji.ics_writer import write_events_to_ics
+from calmoji.types import Event
+
+START = datetime.datetime(2025, 1, 6, 11, 35)
+
+
+def _slot(day: int, description: str = "🌱 — Semester A (Seed)") -> Event:
+    start = START + datetime.timedelta(days=day)
+    return Event(start=start, end=start + datetime.timedelta(minutes=25),
+                 summary=f"Brussels Slot {day}", description=description)
+
+
+def test_diff_detects_added_changed_cancelled(tmp_path):
+    old_dir, new_dir = tmp_path / "old", tmp_path / "new"
+    old_dir.mkdir()
+    new_dir.mkdir()
+    write_events_to_ics([_slot(0), _slot(1), _slot(2)], str(old_dir / "meetings.ics"))
+    write_events_to_ics([_slot(0), _slot(1, "🔥 — Semester B (Flame)"), _slot(3)], str(new_dir / "meetings.ics"))
+
+    summary = diff_indexes(build_uid_index(old_dir), build_uid_index(new_dir))
+    assert summary.added == [_slot(3).uid]
+    assert summary.changed == [_slot(1).uid]
+    assert summary.cancelled == [_slot(2).uid]
+    assert summary.unchanged == 1
+
+
+def test_write_delta_emits_only_changes(tmp_path):
+    old, new, delta = tmp_path / "old.ics", tmp_path / "new.ics", tmp_path / "delta.ics"
+    write_events_to_ics([_slot(0), _slot(1)], str(old))
+    write_events_to_ics([_slot(0), _slot(2)], str(new))
+
+    summary = write_delta(old, new, delta)
+    records = {r.uid: r for r in iter_vevents(delta)}
+
+    assert summary.total == 2
+    assert set(records) == {_slot(1).uid, _slot(2).uid}
+    assert records[_slot(1).uid].status == "CANCELLED"
+    assert records[_slot(2).uid].status is None
+    assert "1 cancelled" in delta.read_text(encoding="utf-8")
+
+
+def test_identical_runs_produce_empty_delta(tmp_path):
+    old, new = tmp_path / "a.ics", tmp_path / "b.ics"
+    write_events_to_ics([_slot(0)], str(old))
+    write_events_to_ics([_slot(0)], str(new))
+    assert write_delta(old, new, tmp_path / "delta.ics").total == 0
+
+
+def test_delta_inside_new_output_is_not_indexed(tmp_path):
+    old_dir, new_dir = tmp_path / "old", tmp_path / "new"
+    old_dir.mkdir()
+    new_dir.mkdir()
+    write_events_to_ics([_slot(0), _slot(1)], str(old_dir / "meetings.ics"))
+    write_events_to_ics([_slot(0)], str(new_dir / "meetings.ics"))
+    delta = new_dir / "delta.ics"
+
+    for _ in range(2):  # The second run must not see the first run's delta in new/
+        summary = write_delta(old_dir, new_dir, delta)
+        assert (len(summary.added), len(summary.changed), len(summary.cancelled)) == (0, 0, 1)
+        assert [(r.uid, r.status) for r in iter_vevents(delta)] == [(_slot(1).uid, "CANCELLED")]
+
+
+def test_delta_carries_the_vtimezones_of_zoned_events(tmp_path):
+    old, new, delta = tmp_path / "utc.ics", tmp_path / "brussels.ics", tmp_path / "delta.ics"
+    write_events_to_ics([_slot(0), _slot(1)], str(old))
+    write_events_to_ics([_slot(0), _slot(1, "🔥 — Semester B (Flame)")], str(new), tzid="Europe/Brussels")
+
+    summary = write_delta(old, new, delta)
+    text = delta.read_text(encoding="utf-8")
+    assert len(summary.changed) == 2
+    assert "DTSTART;TZID=Europe/Brussels:20250106T123500" in text
+    assert text.count("BEGIN:VTIMEZONE") == 1 and "TZID:Europe/Brussels" in text
+    assert text.index("END:VTIMEZONE") < text.index("BEGIN:VEVENT")
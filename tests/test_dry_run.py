@@ -0,0 +1,39 @@
+# tests/test_dry_run.py
+
+import io
+import json
+from calmoji.calendar_phases import get_phases_for_years
+from calmoji.dry_run import dry_run, ebi48_face, summarize
+from calmoji.ics_writer import iter_ebi48_events
+from calmoji.slot_generator import generate_meeting_slots
+
+
+def test_summary_counts_match_generators():
+    phase = get_phases_for_years(2024)[0]
+    events = generate_meeting_slots(phase)
+    report = summarize(iter(events), label=phase.name)
+
+    assert report.total == len(events)
+    delhi = report.counts[phase.name][("meeting", "Delhi")]
+    assert sum(delhi) == sum(1 for e in events if e.city == "Delhi")
+    assert delhi[5] == delhi[6] == 0  # No weekend Delhi slots
+    assert report.first["meeting"] is events[0] and report.last["meeting"] is events[-1]
+    assert sum(report.faces.values()) == len(events)
+
+
+def test_ebi48_faces_cover_the_clock():
+    report = summarize(iter_ebi48_events(2024, recurring=False, expanded=True))
+    assert len(report.faces) == 48 and set(report.faces.values()) == {52}
+    assert ebi48_face(next(iter_ebi48_events(2024)).start) == "🐶 Dog Face"
+
+
+def test_pagination_and_json():
+    events = generate_meeting_slots(get_phases_for_years(2024)[0])
+    out = io.StringIO()
+    report = dry_run(iter(events), page=2, page_size=7, fmt="json", file=out)
+
+    assert report.detail == events[7:14]
+    data = json.loads(out.getvalue())
+    assert data["total"] == len(events)
+    assert data["page"]["pages"] == -(-len(events) // 7)
+    assert [e["summary"] for e in data["page"]["events"]] == [e.summary for e in events[7:14]]
@@ -0,0 +1,36 @@
+# tests/test_ebi48_layer.py
+
+import datetime
+from calmoji.ebi48_layer import iter_layer_bytes, iter_layer_events, layer_weeks
+from calmoji.exclusions import Exclusions, IntervalIndex, date_intervals
+from calmoji.ics_reader import iter_vevents
+from calmoji.ics_writer import write_ebi48_range
+from calmoji.timezones import utc_timestamp
+
+
+def test_templates_match_event_rendering():
+    noon = utc_timestamp(datetime.datetime(2025, 4, 12, 12))
+    closed_day = Exclusions(everywhere=IntervalIndex.from_intervals(date_intervals(["2025-03-08"])))
+    closed_noon = Exclusions(everywhere=IntervalIndex.from_intervals([(noon, noon + 3600)]))
+    first, weeks = layer_weeks(datetime.date(2025, 1, 1), datetime.date(2025, 12, 31))
+    for exclusions, expected in ((None, 52 * 48), (closed_day, 51 * 48), (closed_noon, 52 * 48 - 2)):
+        rendered = "".join(e.to_ics() for e in iter_layer_events(first, weeks, recurring=False, exclusions=exclusions))
+        chunks = list(iter_layer_bytes(first, weeks, recurring=False, exclusions=exclusions))
+        assert b"".join(chunk for chunk, _ in chunks) == rendered.encode()
+        assert sum(count for _, count in chunks) == rendered.count("BEGIN:VEVENT") == expected
+
+
+def test_layer_weeks_covers_saturdays_in_range():
+    assert layer_weeks(datetime.date(2025, 1, 1), datetime.date(2025, 1, 4)) == (datetime.date(2025, 1, 4), 1)
+    assert layer_weeks(datetime.date(2025, 1, 5), datetime.date(2025, 1, 10)) == (datetime.date(2025, 1, 11), 0)
+    assert layer_weeks(datetime.date(2025, 1, 1), datetime.date(2034, 12, 31))[1] == 522
+
+
+def test_ten_years_expanded(tmp_path):
+    path = tmp_path / "ebi48.ics"
+    count = write_ebi48_range(str(path), datetime.date(2025, 1, 1), datetime.date(2034, 12, 31), recurring=False)
+    events = list(iter_vevents(path))
+    assert count == len(events) == 522 * 48
+    assert len({e.uid for e in events}) == count
+    assert (events[0].dtstart, events[-1].dtstart, events[-1].dtend) == ("20250104T000500", "20341230T233500", "20341231T000000")
+    assert not any(e.rrule for e in events)
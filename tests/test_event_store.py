@@ -0,0 +1,63 @@
+# tests/test_event_store.py
+
+import datetime
+import pytest
+from calmoji.calendar_phases import get_phases_for_years
+from calmoji.combined import iter_combined
+from calmoji.event_store import EventStore, write_event_store
+from calmoji.types import Event
+
+
+def test_roundtrip_and_date_range(tmp_path):
+    phases = get_phases_for_years(2024)[:3]
+    events = list(iter_combined(phases))
+    path = tmp_path / "events.calstore"
+    assert write_event_store(path, events) == len(events)
+
+    with EventStore(path) as store:
+        assert len(store) == len(events)
+        first = store[0]
+        assert first.kind == "phase" and first.phase == "Semester A (Seed)" and first.slot is None
+        assert first.start == datetime.datetime(2024, 9, 15)
+
+        day = datetime.date(2025, 1, 14)
+        expected = [e for e in events if not e.all_day and e.start.date() == day]
+        found = list(store.between(day, day))
+        assert [(r.start, r.end, r.kind, r.city) for r in found] == [(e.start, e.end, e.kind, e.city) for e in expected]
+        tokyo = next(r for r in found if r.city == "Tokyo")
+        assert tokyo.slot == 9  # 04:35 UTC
+        assert list(store.between(datetime.date(2030, 1, 1), datetime.date(2030, 2, 1))) == []
+
+
+def test_close_with_live_iterators(tmp_path, monkeypatch):
+    monkeypatch.setattr("calmoji.event_store.RAW_CHUNK_RECORDS", 100)
+    path = tmp_path / "events.calstore"
+    write_event_store(path, iter_combined(get_phases_for_years(2024)[:3]))
+
+    with EventStore(path) as store:
+        everything = iter(store)
+        week = store.between(datetime.date(2025, 1, 13), datetime.date(2025, 1, 19))
+        assert next(everything).kind == "phase" and next(week).start.date() == datetime.date(2025, 1, 13)
+        assert len(list(store.iter_raw())) == len(store)  # Crosses several copy chunks
+    # Leaving the block closes the store without BufferError, iterators still alive
+
+
+def test_rejects_unsorted_and_foreign_files(tmp_path):
+    later = Event(start=datetime.datetime(2025, 1, 2, 10), summary="b")
+    earlier = Event(start=datetime.datetime(2025, 1, 1, 10), summary="a")
+    with pytest.raises(ValueError):
+        write_event_store(tmp_path / "bad.calstore", [later, earlier])
+
+    foreign = tmp_path / "foreign.calstore"
+    foreign.write_bytes(b"BEGIN:VCALENDAR\n" * 8)
+    with pytest.raises(ValueError):
+        EventStore(foreign)
+
+
+def test_empty_store(tmp_path):
+    path = tmp_path / "empty.calstore"
+    write_event_store(path, [])
+    with EventStore(path) as store:
+        assert len(store) == 0
+        assert list(store) == []
+        assert list(store.between(datetime.date(2025, 1, 1), datetime.date(2025, 12, 31))) == []
@@ -0,0 +1,122 @@
+# tests/test_exclusions.py
+
+import datetime
+import io
+import json
+from calmoji.calendar_phases import get_semester_phases
+from calmoji.exclusions import IntervalIndex, build_exclusions
+from calmoji.focus_blocks_writer import generate_focus_block_events_for_days
+from calmoji.ics_reader import iter_vevents
+from calmoji.ics_writer import write_ebi48_layer
+from calmoji.reporter import NORMAL, configure, get_reporter
+from calmoji.slot_generator import generate_meeting_slots
+from calmoji.utils import get_start_date_from_year
+
+HOLIDAYS_ICS = (
+    "BEGIN:VCALENDAR\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:armistice@example.org\r\n"
+    "DTSTART;VALUE=DATE:20241111\r\n"
+    "DTEND;VALUE=DATE:20241112\r\n"
+    "SUMMARY:Armistice Day\r\n"
+    "END:VEVENT\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:closure@example.org\r\n"
+    "DTSTART;TZID=Europe/Brussels:20241112T090000\r\n"
+    "DTEND;TZID=Europe/Brussels:20241112T120000\r\n"
+    "SUMMARY:Building closed\r\n"
+    "END:VEVENT\r\n"
+    "END:VCALENDAR\r\n"
+)
+
+
+def test_interval_index_merges_and_bisects():
+    index = IntervalIndex.from_intervals([(50, 60), (10, 20), (15, 30), (30, 40)])
+    assert index.starts == (10, 50) and index.ends == (40, 60)
+    assert index.overlaps(35, 45)
+    assert index.overlaps(0, 11)
+    assert not index.overlaps(40, 50)  # Half-open on both sides
+    assert not index.overlaps(60, 70)
+
+
+def test_ics_and_date_list_sources(tmp_path):
+    ics = tmp_path / "holidays.ics"
+    ics.write_bytes(HOLIDAYS_ICS.encode("utf-8"))
+    dates = tmp_path / "closures.txt"
+    dates.write_text("# campus closures\n2024-12-24..2024-12-26\n2025-01-01  # new year\n", encoding="utf-8")
+
+    exclusions = build_exclusions(ics=[ics], date_lists=[dates])
+    slot = datetime.timedelta(minutes=25)
+    assert exclusions.blocks(datetime.datetime(2024, 11, 11, 23, 35), datetime.datetime(2024, 11, 11, 23, 35) + slot)
+    assert exclusions.blocks(datetime.datetime(2024, 11, 12, 8, 5), datetime.datetime(2024, 11, 12, 8, 5) + slot)
+    assert not exclusions.blocks(datetime.datetime(2024, 11, 12, 11, 5), datetime.datetime(2024, 11, 12, 11, 5) + slot)
+    assert exclusions.blocks(datetime.datetime(2024, 12, 26, 12, 5), datetime.datetime(2024, 12, 26, 12, 30))
+    assert not exclusions.blocks(datetime.datetime(2024, 12, 27, 12, 5), datetime.datetime(2024, 12, 27, 12, 30))
+
+
+def test_meeting_slots_skip_city_holidays(tmp_path):
+    phase = get_semester_phases(get_start_date_from_year(2024))[0]
+    holidays = tmp_path / "city_holidays.json"
+    holidays.write_text(json.dumps({"Tokyo": ["2024-11-18"]}), encoding="utf-8")
+    exclusions = build_exclusions(city_holidays=holidays, dates=["2024-11-11"])
+
+    baseline = generate_meeting_slots(phase)
+    filtered = generate_meeting_slots(phase, exclusions=exclusions)
+    removed = {(e.city, e.start.date()) for e in baseline} - {(e.city, e.start.date()) for e in filtered}
+
+    assert ("Tokyo", datetime.date(2024, 11, 18)) in removed
+    assert ("Brussels", datetime.date(2024, 11, 18)) not in removed
+    assert all(e.start.date() != datetime.date(2024, 11, 11) for e in filtered)
+
+
+def test_focus_blocks_and_ebi48_exdates(tmp_path):
+    exclusions = build_exclusions(dates=["2024-01-13"])
+    day = datetime.datetime(2024, 1, 15)
+    assert generate_focus_block_events_for_days([day], exclusions=build_exclusions(dates=["2024-01-15"])) == []
+    assert generate_focus_block_events_for_days([day], exclusions=exclusions)
+
+    path = tmp_path / "ebi48.ics"
+    write_ebi48_layer(str(path), 2024, exclusions=exclusions)
+    records = list(iter_vevents(path))
+    assert len(records) == 48
+    assert records[0].rrule == "FREQ=WEEKLY;COUNT=52"
+    assert all(len(r.exdates) == 1 and r.exdates[0].startswith("20240113T") for r in records)
+
+
+def test_recurring_closures_expand_over_the_window(tmp_path):
+    ics = tmp_path / "closures.ics"
+    ics.write_bytes((
+        "BEGIN:VCALENDAR\r\n"
+        "BEGIN:VEVENT\r\n"
+        "UID:fire-drill@example.org\r\n"
+        "DTSTART;TZID=Europe/Brussels:20250106T100000\r\n"
+        "DTEND;TZID=Europe/Brussels:20250106T110000\r\n"
+        "RRULE:FREQ=WEEKLY\r\n"
+        "EXDATE;TZID=Europe/Brussels:20250113T100000\r\n"
+        "SUMMARY:Fire drill\r\n"
+        "END:VEVENT\r\n"
+        "BEGIN:VEVENT\r\n"
+        "UID:audit@example.org\r\n"
+        "DTSTART;VALUE=DATE:20250101\r\n"
+        "RRULE:FREQ=YEARLY\r\n"
+        "SUMMARY:Audit day\r\n"
+        "END:VEVENT\r\n"
+        "END:VCALENDAR\r\n"
+    ).encode("utf-8"))
+    out = io.StringIO()
+    try:
+        configure(NORMAL, stream=out, progress=False)
+        exclusions = build_exclusions(ics=[ics], window=(datetime.datetime(2025, 1, 1), datetime.datetime(2025, 7, 1)))
+        get_reporter().flush()
+    finally:
+        configure(NORMAL)
+    slot = datetime.timedelta(minutes=25)
+
+    def blocked(*args):
+        return exclusions.blocks(datetime.datetime(*args), datetime.datetime(*args) + slot)
+
+    assert blocked(2025, 1, 6, 9, 5) and blocked(2025, 1, 20, 9, 5)
+    assert not blocked(2025, 1, 13, 9, 5)  # EXDATE
+    assert blocked(2025, 6, 30, 8, 5)  # Summer time: still 10:00 in Brussels
+    assert blocked(2025, 1, 1, 12, 5) and not blocked(2026, 1, 1, 12, 5)  # YEARLY: first occurrence only
+    assert out.getvalue().count("RRULE not expanded") == 1 and "Audit day" in out.getvalue()
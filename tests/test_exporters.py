@@ -0,0 +1,63 @@
+# tests/test_exporters.py
+
+import csv
+import datetime
+import json
+from calmoji.calendar_phases import get_phases_for_years
+from calmoji.exclusions import build_exclusions
+from calmoji.exporters import iter_records, record_uid, write_csv, write_jcal, write_ndjson
+from calmoji.focus_blocks_writer import generate_focus_block_events
+from calmoji.slot_generator import generate_meeting_slots
+from calmoji.types import event_uid
+
+
+def test_records_match_generators():
+    phases = get_phases_for_years(2024)[:2]
+    exclusions = build_exclusions(dates=["2024-10-01"], city_holidays={"Delhi": ["2024-10-02"]})
+    records = list(iter_records(phases, exclusions=exclusions))
+
+    meetings = [e for p in phases for e in generate_meeting_slots(p, exclusions=exclusions)]
+    focus = generate_focus_block_events(phases, exclusions=exclusions)
+    assert sorted((r[0], r[2].city) for r in records if r[2].kind == "meeting") == sorted(
+        (f"{e.start:%Y-%m-%dT%H:%M:%S}Z", e.city) for e in meetings
+    )
+    assert sorted((r[0], r[2].summary) for r in records if r[2].kind == "focus") == sorted(
+        (f"{e.start:%Y-%m-%dT%H:%M:%S}Z", e.summary) for e in focus
+    )
+    assert [r[2].phase for r in records if r[2].kind == "phase"] == [p.name for p in phases]
+    assert [r[0] for r in records if "T" in r[0]] == sorted(r[0] for r in records if "T" in r[0])
+
+
+def test_ndjson_and_csv_agree(tmp_path):
+    phases = get_phases_for_years(2024)[:1]
+    count = write_ndjson(iter_records(phases), tmp_path / "out.ndjson")
+    assert write_csv(iter_records(phases), tmp_path / "out.csv") == count
+
+    lines = [json.loads(line) for line in (tmp_path / "out.ndjson").read_text(encoding="utf-8").splitlines()]
+    with open(tmp_path / "out.csv", encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(lines) == len(rows) == count
+
+    meeting = next(line for line in lines if line["kind"] == "meeting")
+    assert set(meeting) == {"kind", "city", "slot", "glyph", "face", "phase", "density", "start", "end"}
+    assert isinstance(meeting["slot"], int) and meeting["start"].endswith("Z")
+    assert [(r["start"], r["city"] or None, r["glyph"]) for r in rows] == [
+        (line["start"], line["city"], line["glyph"]) for line in lines
+    ]
+
+
+def test_jcal_uids_match_ics(tmp_path):
+    phases = get_phases_for_years(2024)[:1]
+    count = write_jcal(iter_records(phases, focus_blocks=False), tmp_path / "out.jcal.json")
+    name, properties, components = json.loads((tmp_path / "out.jcal.json").read_text(encoding="utf-8"))
+
+    assert name == "vcalendar" and ["version", {}, "text", "2.0"] in properties
+    assert len(components) == count
+    uids = {props[0][3] for _, props, _ in components}
+    assert {e.uid for e in generate_meeting_slots(phases[0])} <= uids
+
+
+def test_record_uid_matches_event_uid():
+    start = datetime.datetime(2024, 9, 2, 8, 5)
+    assert record_uid("2024-09-02T08:05:00Z", "Delhi 🐘 Slot") == event_uid(start, "Delhi 🐘 Slot")
+    assert record_uid("2024-09-02", "🌱 Phase") == event_uid(datetime.datetime(2024, 9, 2), "🌱 Phase", all_day=True)
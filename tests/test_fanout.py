@@ -0,0 +1,48 @@
+# tests/test_fanout.py
+
+import json
+import pytest
+from calmoji.calendar_phases import get_phases_for_years
+from calmoji.fanout import Subscriber, load_subscribers, render_fanout, shard_path
+from calmoji.ics_reader import iter_vevents
+
+
+def test_personalized_cuts(tmp_path):
+    phases = get_phases_for_years(2024)[:1]
+    subscribers = [
+        Subscriber("ana", frozenset({"Brussels"})),
+        Subscriber("bo", frozenset({"Brussels", "Tokyo"}), focus_blocks=True, ebi48=True),
+        Subscriber("cy", frozenset({"Delhi"}), tzid="Asia/Kolkata"),
+    ]
+    report = render_fanout(subscribers, phases, tmp_path)
+
+    assert report.calendars == 3
+    assert report.fragments == 5  # Brussels, Tokyo, focus, ebi48, Delhi@Asia/Kolkata
+    ana, bo, cy = ({r.uid: r for r in iter_vevents(path)} for path in report.paths)
+    assert set(ana) < set(bo)
+    assert {r.summary.split()[0] for r in ana.values()} == {"Brussels"}
+    assert sum(1 for r in bo.values() if r.rrule) == 48
+    assert all(r.tzid == "Asia/Kolkata" for r in cy.values())
+    assert "BEGIN:VTIMEZONE" in report.paths[2].read_text(encoding="utf-8")
+
+
+def test_shard_path_is_stable_and_nested(tmp_path):
+    path = shard_path(tmp_path, "ana@example.org")
+    assert path == shard_path(tmp_path, "ana@example.org")
+    assert path.parent.parent.parent == tmp_path
+    assert len(path.parent.name) == 2 and len(path.parent.parent.name) == 2
+
+
+def test_load_subscribers_validates_cities_and_zones(tmp_path):
+    path = tmp_path / "subscribers.json"
+    path.write_text(json.dumps([{"id": "ana", "cities": ["Brussels"], "ebi48": True}]), encoding="utf-8")
+    assert load_subscribers(path) == [Subscriber("ana", frozenset({"Brussels"}), ebi48=True)]
+
+    path.write_text(json.dumps([{"id": "bo", "cities": ["Atlantis"]}]), encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_subscribers(path)
+
+    path.write_text(json.dumps([{"id": "cy", "tzid": "Tokyo"}, {"id": "di", "tzid": "Mars/Olympus"}]), encoding="utf-8")
+    with pytest.raises(ValueError, match="Subscriber di: Unknown time zone"):
+        load_subscribers(path)
+    assert Subscriber("cy", tzid="Tokyo").tzid == "Asia/Tokyo"
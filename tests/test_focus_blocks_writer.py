@@ -4,7 +4,9 @@ import datetime
 import os
 from pathlib import Path
 from calmoji.types import Phase
-from calmoji.focus_blocks_writer import generate_focus_block_events, group_phase_days_by_week, write_focus_blocks_weekly
+from calmoji.focus_blocks_writer import (
+    generate_focus_block_events, generate_focus_block_glyph_key_event, group_phase_days_by_week, write_focus_blocks_weekly,
+)
 from calmoji.focus_blocks_config import FOCUS_BLOCKS, ACTIVE_WEEKDAYS
 
 
@@ -91,6 +93,21 @@ def test_torii_emoji_on_final_block():
     final_event = sorted(events, key=lambda e: e.start)[-1]
     assert final_event.emoji == "⛩️"
 
+def test_glyph_key_follows_the_spec():
+    from calmoji.spec import builtin_config, compile_spec
+
+    saturday = datetime.date(2025, 1, 4)
+    builtin = generate_focus_block_glyph_key_event(saturday).description.splitlines()[2:]
+    assert builtin[0] == "🧠  Deep Thinking" and builtin[-1] == "⛩️  Closure" and len(builtin) == len(FOCUS_BLOCKS)
+
+    spec = compile_spec({**builtin_config(), "focus_blocks": [
+        {"start": "09:00", "end": "10:00", "emoji": "🦉"},
+        {"start": "11:00", "end": "12:00", "emoji": "🌙"},
+    ]})
+    key = generate_focus_block_glyph_key_event(saturday, spec=spec).description.splitlines()[2:]
+    assert key == ["🦉  Deep Thinking", "⛩️  Closure"]
+
+
 def test_glyph_key_event_written_even_when_alone(tmp_path):
     saturday_only_phase = Phase(
         name="Glyph Test Phase",
@@ -121,7 +138,7 @@ def test_glyph_key_event_written_even_when_alone(tmp_path):
 
         content = expected_filename.read_text(encoding="utf-8")
         summaries = [line for line in content.splitlines() if line.startswith("SUMMARY:")]
-        glyph_lines = [line for line in content.splitlines() if "Glyph Key" in line]
+        glyph_lines = [line for line in summaries if "Glyph Key" in line]
 
         assert len(glyph_lines) == 1, "Expected exactly one glyph key event in the ICS file"
     finally:
@@ -0,0 +1,50 @@
+# tests/test_freebusy.py
+
+import datetime
+from calmoji.calendar_phases import get_semester_phases
+from calmoji.focus_blocks_writer import generate_focus_block_events
+from calmoji.freebusy import busy_intervals, coalesce, freebusy_windows, split_by_windows, write_freebusy
+from calmoji.ics_reader import unfold
+from calmoji.slot_generator import generate_meeting_slots
+from calmoji.types import Event
+from calmoji.utils import get_start_date_from_year
+
+T = datetime.datetime(2025, 1, 6)
+
+
+def _at(minutes: int) -> datetime.datetime:
+    return T + datetime.timedelta(minutes=minutes)
+
+
+def test_coalesce_merges_overlapping_and_adjacent():
+    intervals = [(_at(0), _at(25)), (_at(25), _at(50)), (_at(40), _at(45)), (_at(60), _at(90)), (_at(95), _at(100))]
+    assert coalesce(intervals) == [(_at(0), _at(50)), (_at(60), _at(90)), (_at(95), _at(100))]
+    assert coalesce(intervals, gap=datetime.timedelta(minutes=10)) == [(_at(0), _at(100))]
+
+
+def test_split_clips_ranges_that_straddle_windows():
+    busy = [(_at(-60), _at(60)), (_at(1500), _at(1600))]
+    windows = [("a", _at(0), _at(1440)), ("b", _at(1440), _at(2880))]
+    assert list(split_by_windows(busy, windows)) == [
+        ("a", _at(0), _at(1440), [(_at(0), _at(60))]),
+        ("b", _at(1440), _at(2880), [(_at(1500), _at(1600))]),
+    ]
+
+
+def test_phase_marker_covers_whole_days():
+    marker = Event(start=datetime.date(2025, 1, 6), end=datetime.date(2025, 1, 8), summary="Break", all_day=True)
+    slot = Event(start=_at(600), end=_at(625), summary="Slot")
+    assert coalesce(busy_intervals([slot, marker])) == [(_at(0), _at(2880))]
+
+
+def test_write_freebusy_per_week_is_compact(tmp_path):
+    phases = get_semester_phases(get_start_date_from_year(2024))[:1]
+    events = generate_meeting_slots(phases[0]) + generate_focus_block_events(phases)
+    path = tmp_path / "freebusy.ics"
+    periods = write_freebusy(events, phases, str(path), dtstamp=datetime.datetime(2025, 1, 1))
+
+    text = unfold(path.read_bytes()).decode("utf-8")
+    assert text.count("BEGIN:VFREEBUSY") == len(freebusy_windows(phases, "week"))
+    assert 0 < periods < len(events) * 0.9  # Meetings next to focus blocks merge into one busy period
+    assert "DTSTAMP:20250101T000000Z" in text
+    assert all(len(line.encode("utf-8")) <= 75 for line in path.read_text(encoding="utf-8").splitlines())
@@ -23,7 +23,7 @@ def test_ics_file_line_count(tmp_path):
     # Write ICS file with one event
     with open(testfile, "w", encoding="utf-8") as f:
         f.write(create_ics_header())
-        f.write("\n".join(event.to_ics()))
+        f.write(event.to_ics())
         f.write(create_ics_footer())
 
     # Read and verify output
@@ -35,3 +35,19 @@ def test_ics_file_line_count(tmp_path):
     assert any("BEGIN:VEVENT" in line for line in lines)
     assert any("END:VEVENT" in line for line in lines)
     assert len(lines) > 10  # Enough content to be a valid .ics
+
+
+def test_write_events_with_tzid_emits_vtimezone(tmp_path):
+    from calmoji.ics_writer import write_events_to_ics
+
+    start = datetime.datetime(2025, 7, 1, 11, 35)
+    event = Event(start=start, end=start + datetime.timedelta(minutes=25), summary="Brussels Slot")
+    target = tmp_path / "local.ics"
+    write_events_to_ics([event], str(target), tzid="Europe/Brussels")
+
+    content = target.read_text(encoding="utf-8")
+    assert "X-WR-TIMEZONE:Europe/Brussels" in content
+    assert content.count("BEGIN:VTIMEZONE") == 1
+    assert "DTSTART;TZID=Europe/Brussels:20250701T133500" in content
+    assert "DTEND;TZID=Europe/Brussels:20250701T140000" in content
+    assert content.index("END:VTIMEZONE") < content.index("BEGIN:VEVENT")
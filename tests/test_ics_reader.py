@@ -0,0 +1,96 @@
+# tests/test_ics_reader.py
+
+import datetime
+from calmoji.ics_reader import iter_batches, iter_vevents, record_to_event, unescape_ics_text
+from calmoji.ics_writer import write_events_to_ics
+from calmoji.types import Event
+
+EXTERNAL = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:holiday-1@example.org\r\n"
+    "DTSTART;VALUE=DATE:20251225\r\n"
+    "DTEND;VALUE=DATE:20251226\r\n"
+    "SUMMARY:Christmas Day\\, observed\r\n"
+    "DESCRIPTION:A very long description that has been folded by the producer \r\n"
+    " across two lines\r\n"
+    "BEGIN:VALARM\r\n"
+    "DESCRIPTION:Reminder\r\n"
+    "END:VALARM\r\n"
+    "END:VEVENT\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:standup@example.org\r\n"
+    'DTSTART;X-NOTE="a:b";TZID=Europe/Brussels:20250701T133500\r\n'
+    "DTEND;TZID=Europe/Brussels:20250701T140000\r\n"
+    "RRULE:FREQ=WEEKLY;COUNT=4\r\n"
+    "EXDATE;TZID=Europe/Brussels:20250708T133500\r\n"
+    "EXDATE:20250715T113500Z,20250722T133500\r\n"
+    "EXDATE;TZID=Asia/Tokyo:20250729T203500\r\n"
+    "SUMMARY:Standup\r\n"
+    "END:VEVENT\r\n"
+    "END:VCALENDAR\r\n"
+)
+
+
+def test_reads_back_calmoji_output(tmp_path):
+    start = datetime.datetime(2025, 1, 6, 11, 35)
+    events = [
+        Event(start=start + datetime.timedelta(days=i), end=start + datetime.timedelta(days=i, minutes=25),
+              summary=f"Brussels Slot {i}", description="Line one\nLine two; with, punctuation")
+        for i in range(3)
+    ]
+    path = tmp_path / "meetings.ics"
+    write_events_to_ics(events, str(path))
+
+    records = list(iter_vevents(path))
+    assert [r.uid for r in records] == [e.uid for e in events]
+    assert records[0].dtstart == "20250106T113500"
+    assert records[2].description == "Line one\nLine two; with, punctuation"
+    assert records[0].raw.startswith(b"BEGIN:VEVENT") and records[0].raw.endswith(b"END:VEVENT")
+
+
+def test_headerless_file_keeps_its_first_event(tmp_path):
+    start = datetime.datetime(2025, 1, 6, 11, 35)
+    events = [Event(start=start, end=start + datetime.timedelta(minutes=25), summary=name) for name in "XY"]
+    path = tmp_path / "body.ics"
+    write_events_to_ics(events, str(path), header=False, footer=False)
+
+    assert path.read_bytes().startswith(b"BEGIN:VEVENT")
+    assert [r.summary for r in iter_vevents(path)] == ["X", "Y"]
+
+
+def test_external_calendar_crlf_folding_and_params(tmp_path):
+    path = tmp_path / "external.ics"
+    path.write_bytes(EXTERNAL.encode("utf-8"))
+
+    holiday, standup = iter_vevents(path)
+    assert holiday.all_day and holiday.dtstart == "20251225"
+    assert holiday.summary == "Christmas Day, observed"
+    assert holiday.description.endswith("producer across two lines")  # VALARM text ignored
+    assert standup.tzid == "Europe/Brussels"
+    assert standup.rrule == "FREQ=WEEKLY;COUNT=4"
+    assert standup.exdates == ("20250708T133500", "20250715T113500Z", "20250722T133500", "20250729T203500")
+    assert standup.exdate_params == ("TZID=Europe/Brussels", "", "", "TZID=Asia/Tokyo")
+
+    event = record_to_event(standup)
+    assert event.start == datetime.datetime(2025, 7, 1, 11, 35)  # converted back to UTC
+    assert event.recurrence == "FREQ=WEEKLY;COUNT=4"
+    # Each EXDATE by its own TZID, Z as UTC, otherwise DTSTART's TZID: every week but the first is excluded
+    assert event.exdates == [datetime.datetime(2025, 7, d, 11, 35) for d in (8, 15, 22, 29)]
+
+
+def test_batches_and_empty_file(tmp_path):
+    path = tmp_path / "external.ics"
+    path.write_bytes(EXTERNAL.encode("utf-8"))
+    batches = list(iter_batches(path, batch_size=1))
+    assert [len(b) for b in batches] == [1, 1]
+    assert batches[1].uid == ["standup@example.org"]
+
+    empty = tmp_path / "empty.ics"
+    empty.write_bytes(b"")
+    assert list(iter_vevents(empty)) == []
+
+
+def test_unescape_ics_text():
+    assert unescape_ics_text(r"a\, b\; c\\d\ne") == "a, b; c\\d\ne"
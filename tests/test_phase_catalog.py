@@ -0,0 +1,40 @@
+# tests/test_phase_catalog.py
+
+import datetime
+from calmoji.calendar_phases import get_phases_for_years, get_semester_phases
+from calmoji.phase_catalog import format_status, next_meeting, phase_at, status, year_catalog
+
+
+def test_phase_at_matches_generated_phases_across_years():
+    phases = get_phases_for_years(2024, 2)[:-1]  # The last one is only trimmed once a following year is generated
+    for phase in phases:
+        for day in (phase.start, phase.end + datetime.timedelta(hours=23, minutes=59)):
+            assert phase_at(day).name == phase.name
+    # The 2024–25 closing phase nominally runs through 2025-09-15; the new year wins
+    assert phase_at(datetime.datetime(2025, 9, 15, 12)).start == datetime.datetime(2025, 9, 15)
+    assert phase_at(datetime.datetime(2025, 9, 14, 23, 59)).name == "Liminal Drift"
+
+
+def test_status_at_a_known_time():
+    current = status(datetime.datetime(2025, 1, 3, 4, 40))  # A Friday in Winter Break
+    assert current.phase.name == "Winter Break"
+    assert (current.slot, current.glyph, current.face) == (9, "🦦", "Otter Face")
+    assert current.focus.glyph == "📚"
+    # No meetings in the break: the next slot is Mecca's on Sunday, when Semester A resumes
+    assert current.next_meeting.city == "Mecca"
+    assert current.next_meeting_start == datetime.datetime(2025, 1, 5, 10, 35)
+    assert format_status(current).startswith("❄️ Winter Break · 🦦 Otter Face · 📚 focus · next: Mecca")
+
+    start, template = next_meeting(datetime.datetime(2025, 3, 3, 9))
+    assert (start, template.city) == (datetime.datetime(2025, 3, 3, 10, 35), "Mecca")
+
+
+def test_catalog_is_built_once_and_callers_get_copies():
+    before = year_catalog.cache_info().misses
+    for hour in range(48):
+        phase_at(datetime.datetime(2031, 3, 1) + datetime.timedelta(hours=hour))
+    assert year_catalog.cache_info().misses == before + 1
+
+    phases = get_semester_phases(datetime.datetime(2031, 9, 15))
+    phases[0].end = phases[0].start
+    assert get_semester_phases(datetime.datetime(2031, 9, 15))[0].end != phases[0].start
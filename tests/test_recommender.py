@@ -0,0 +1,51 @@
+# tests/test_recommender.py
+
+import datetime
+from zoneinfo import ZoneInfo
+from calmoji.calendar_phases import get_semester_phases
+from calmoji.recommender import (
+    HUMANE_HOUR_SCORES,
+    local_slot_label,
+    recommend_phase_slots,
+    score_slots,
+    slot_start_minute,
+)
+from calmoji.utils import get_start_date_from_year
+
+
+def test_scores_match_per_day_zoneinfo_loop():
+    start, end = datetime.datetime(2025, 3, 1), datetime.datetime(2025, 4, 30)
+    scores = score_slots(["Brussels"], start, end)["Brussels"]
+    zone = ZoneInfo("Europe/Brussels")
+
+    days = (end - start).days + 1
+    for slot in (0, 17, 23, 40):
+        total = 0.0
+        for i in range(days):
+            utc = start + datetime.timedelta(days=i, minutes=slot_start_minute(slot))
+            local = utc.replace(tzinfo=datetime.timezone.utc).astimezone(zone)
+            total += HUMANE_HOUR_SCORES[local.hour]
+        assert abs(scores[slot] - total / days) < 1e-9
+
+
+def test_local_labels_follow_dst():
+    # Brussels A slot (11:35 UTC) is 12:35 in winter and 13:35 in summer
+    assert local_slot_label("Brussels", 23, datetime.date(2025, 1, 15)) == "12:35–13:00 CET"
+    assert local_slot_label("Brussels", 23, datetime.date(2025, 7, 15)) == "13:35–14:00 CEST"
+    assert local_slot_label("Tokyo", 9, datetime.date(2025, 7, 15)) == "13:35–14:00 JST"
+
+
+def test_recommendations_per_phase():
+    phases = get_semester_phases(get_start_date_from_year(2024))
+    recs = recommend_phase_slots(phases, ["Tokyo", "Brussels", "Seattle"])
+
+    assert [r.phase for r in recs] == [p.name for p in phases]
+    for rec in recs:
+        assert len(rec.slots) == 6
+        for city, sh, sm, eh, em, label in rec.slots:
+            assert sm in (5, 35)
+            local_hour = int(label[:2])
+            assert HUMANE_HOUR_SCORES[local_hour] > 0.5, f"{city} {label} is not humane"
+
+    winter = next(r for r in recs if r.phase == "Winter Break")
+    assert all(label.endswith("PST") for city, *_, label in winter.slots if city == "Seattle")
@@ -0,0 +1,46 @@
+# tests/test_reporter.py
+
+import io
+from datetime import datetime, timedelta
+from calmoji.reporter import DEBUG, NORMAL, QUIET, VERBOSE, Reporter, configure, level_from_flags
+from calmoji.types import Event
+
+
+def test_levels_filter_and_buffer():
+    out = io.StringIO()
+    reporter = Reporter(level=NORMAL, stream=out, progress=False)
+    reporter.info("one")
+    reporter.verbose("hidden")
+    reporter.wrote("output/x.ics", "3 events")
+    assert out.getvalue() == ""  # Buffered until flush
+    reporter.flush()
+    assert out.getvalue() == "one\n✅ Wrote: output/x.ics (3 events)\n"
+
+    reporter.error("boom")  # Errors flush immediately
+    assert out.getvalue().endswith("boom\n")
+    assert level_from_flags(quiet=True) == QUIET and level_from_flags(verbose=1) == VERBOSE
+    assert level_from_flags(verbose=5) == DEBUG
+
+
+def test_progress_line_is_redrawn_and_cleared():
+    out = io.StringIO()
+    reporter = Reporter(level=NORMAL, stream=out, progress=True)
+    reporter.count(events=1000, nbytes=250_000)
+    assert "1,000 events" in out.getvalue() and "B/s" in out.getvalue()
+    reporter.info("done")
+    reporter.close()
+    assert out.getvalue().endswith("\r\x1b[Kdone\n")
+
+
+def test_to_ics_is_silent_by_default(capsys):
+    out = io.StringIO()
+    try:
+        configure(NORMAL, stream=out, progress=False)
+        start = datetime(2024, 9, 16, 4, 35)
+        Event(start=start, end=start + timedelta(minutes=25), summary="Tokyo").to_ics()
+        configure(DEBUG, stream=out, progress=False).flush()
+        Event(start=start, end=start + timedelta(minutes=25), summary="Tokyo").to_ics()
+    finally:
+        configure(NORMAL)
+    assert capsys.readouterr().out == ""
+    assert out.getvalue().count("Tokyo") == 1
@@ -0,0 +1,100 @@
+# tests/test_rrule.py
+
+import datetime
+import heapq
+import random
+import pytest
+from calmoji.exclusions import Exclusions, IntervalIndex, date_intervals
+from calmoji.ebi48_layer import iter_layer_events, layer_weeks
+from calmoji.ics_reader import iter_vevents, record_to_event
+from calmoji.rrule import WEEKDAYS, Recurrence, RecurrenceRule, expand_event
+from calmoji.timezones import EPOCH
+
+
+def brute_force(dtstart, rule, exdates, horizon_days):
+    """Walk every day from DTSTART and apply the rule's definition directly."""
+    start_monday = dtstart.date() - datetime.timedelta(days=dtstart.weekday())
+    matches = []
+    for k in range(horizon_days):
+        day = dtstart + datetime.timedelta(days=k)
+        if rule.freq == "DAILY":
+            held = k % rule.interval == 0 and (not rule.byday or day.weekday() in rule.byday)
+        else:
+            week = (day.date() - datetime.timedelta(days=day.weekday()) - start_monday).days // 7
+            held = week % rule.interval == 0 and day.weekday() in (rule.byday or (dtstart.weekday(),))
+        if held and (rule.until is None or day <= rule.until):
+            matches.append(day)
+    if rule.count is not None:
+        matches = matches[:rule.count]
+    return [day for day in matches if day not in exdates]
+
+
+def test_matches_brute_force_for_random_rules():
+    rng = random.Random(5545)
+    for _ in range(300):
+        dtstart = datetime.datetime(2024, 1, 1, 9, 30) + datetime.timedelta(days=rng.randrange(30))
+        parts = [f"FREQ={rng.choice(['DAILY', 'WEEKLY'])}", f"INTERVAL={rng.randint(1, 4)}"]
+        if rng.random() < 0.6:
+            parts.append("BYDAY=" + ",".join(rng.sample(WEEKDAYS, rng.randint(1, 3))))
+        if rng.random() < 0.5:
+            parts.append(f"COUNT={rng.randint(0, 40)}")
+        else:
+            parts.append(f"UNTIL={dtstart + datetime.timedelta(days=rng.randrange(200)):%Y%m%dT%H%M%S}")
+        rule = RecurrenceRule.parse(";".join(parts))
+        everything = brute_force(dtstart, rule, set(), 1200)
+        exdates = set(rng.sample(everything, min(3, len(everything))))
+        expected = brute_force(dtstart, rule, exdates, 1200)
+        recurrence = Recurrence(dtstart, rule, exdates)
+
+        assert list(recurrence) == expected, rule
+        window_start = dtstart + datetime.timedelta(days=rng.randrange(60))
+        window_end = window_start + datetime.timedelta(days=rng.randrange(90))
+        windowed = [day for day in expected if window_start <= day < window_end]
+        assert list(recurrence.between(window_start, window_end)) == windowed, rule
+        assert [EPOCH + datetime.timedelta(seconds=ts) for ts in recurrence.timestamps(window_start, window_end)] == windowed
+
+
+def test_fifty_year_rule_expands_only_the_window():
+    recurrence = Recurrence(datetime.datetime(2000, 1, 3, 8), RecurrenceRule.parse("FREQ=WEEKLY;BYDAY=MO,WE,FR"))
+    window = list(recurrence.between(datetime.datetime(2049, 6, 1), datetime.datetime(2049, 6, 8)))
+    assert [day.strftime("%a %d") for day in window] == ["Wed 02", "Fri 04", "Mon 07"]
+    assert recurrence.occurrence(3 * 2600) == datetime.datetime(2000, 1, 3, 8) + datetime.timedelta(weeks=2600)
+    with pytest.raises(ValueError):
+        list(recurrence.between(datetime.datetime(2049, 6, 1)))  # Unbounded and no end
+
+
+def test_recurring_ebi48_layer_expands_to_the_expanded_layer():
+    closed = Exclusions(everywhere=IntervalIndex.from_intervals(date_intervals(["2025-03-08", "2025-12-27"])))
+    first, weeks = layer_weeks(datetime.date(2025, 1, 1), datetime.date(2025, 12, 31))
+    masters = list(iter_layer_events(first, weeks, recurring=True, exclusions=closed))
+    expanded = heapq.merge(*(expand_event(master) for master in masters), key=lambda event: event.start)
+    assert [e.to_ics() for e in expanded] == [
+        e.to_ics() for e in iter_layer_events(first, weeks, recurring=False, exclusions=closed)
+    ]
+
+
+def test_zoned_rule_keeps_wall_time_across_dst(tmp_path):
+    path = tmp_path / "standup.ics"
+    path.write_bytes(
+        b"BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nUID:standup@example.org\r\nSUMMARY:Standup\r\n"
+        b"DTSTART;TZID=Europe/Brussels:20250325T133500\r\nDTEND;TZID=Europe/Brussels:20250325T140000\r\n"
+        b"RRULE:FREQ=WEEKLY;COUNT=4\r\nEXDATE;TZID=Europe/Brussels:20250408T133500\r\n"
+        b"END:VEVENT\r\nEND:VCALENDAR\r\n"
+    )
+    event = record_to_event(next(iter_vevents(path)))
+    utc = [datetime.datetime(2025, 3, 25, 12, 35)] + [datetime.datetime(2025, 4, d, 11, 35) for d in (1, 15)]
+
+    assert [e.start for e in expand_event(event)] == utc  # 13:35 in Brussels before and after the change
+    recurrence = Recurrence.from_event(event)
+    assert recurrence.occurrence(2) == datetime.datetime(2025, 4, 8, 11, 35)  # The EXDATE'd one
+    window = (datetime.datetime(2025, 4, 1, 11, 35), datetime.datetime(2025, 4, 15, 11, 35))
+    assert list(recurrence.between(*window)) == utc[1:2]
+    assert list(recurrence.timestamps(*window)) == [int((utc[1] - EPOCH).total_seconds())]
+
+
+def test_rejects_unsupported_rules():
+    for value in ("FREQ=MONTHLY", "FREQ=WEEKLY;BYDAY=1MO", "FREQ=DAILY;BYHOUR=9", "FREQ=DAILY;COUNT=2;UNTIL=20250101",
+                  "FREQ=DAILY;INTERVAL=0", "FREQ=WEEKLY;WKST=SU"):
+        with pytest.raises(ValueError):
+            RecurrenceRule.parse(value)
+    assert str(RecurrenceRule.parse("RRULE:FREQ=WEEKLY;BYDAY=TH,MO;INTERVAL=2;COUNT=4")) == "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,TH;COUNT=4"
@@ -0,0 +1,77 @@
+# tests/test_schedule_index.py
+
+import datetime
+import pytest
+from calmoji.calendar_phases import get_semester_phases
+from calmoji.schedule_index import ScheduleIndex, build_schedule_index
+from calmoji.slot_generator import generate_meeting_slots
+from calmoji.types import Event
+from calmoji.utils import get_start_date_from_year
+
+
+def _phases():
+    return get_semester_phases(get_start_date_from_year(2024))
+
+
+def test_query_matches_linear_scan():
+    phases = _phases()
+    index = build_schedule_index(phases, focus_blocks=False)
+    flame = next(p for p in phases if p.name == "Semester B (Flame)")
+
+    expected = [
+        e for e in generate_meeting_slots(flame)
+        if e.city == "Brussels" and "Swan Face" in e.summary
+    ]
+    hits = index.query(city="Brussels", face="Swan Face", phase="Semester B (Flame)")
+
+    assert len(hits) == len(expected) > 0
+    assert [e.uid for e in hits] == [e.uid for e in expected]
+
+
+def test_or_values_and_counts():
+    index = build_schedule_index(_phases())
+    tokyo = index.count(city="Tokyo")
+    delhi = index.count(city="Delhi")
+
+    assert index.count(city=["Tokyo", "Delhi"]) == tokyo + delhi
+    assert index.count(kind="focus", weekday=5) == 0  # Saturday carries no focus blocks
+    assert index.count(density="normal", kind="meeting") > 0
+    assert index.count(city="Atlantis") == 0
+    assert index.count(city=[]) == 0
+
+    either = index.match(city=["Tokyo", "Delhi"], kind="meeting")
+    assert list(either) == sorted(either) and len(either) == tokyo + delhi
+    hits = index.match(city="Tokyo")
+    hits.append(0)  # Results are copies, not the index's own postings
+    assert index.count(city="Tokyo") == tokyo
+
+
+def test_unknown_attribute_raises():
+    index = ScheduleIndex()
+    with pytest.raises(KeyError):
+        index.match(colour="blue")
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    index = ScheduleIndex()
+    index.add(Event(
+        start=datetime.datetime(2025, 1, 6, 11, 35),
+        end=datetime.datetime(2025, 1, 6, 12, 0),
+        summary="Brussels slot",
+        kind="meeting",
+        city="Brussels",
+        phase="Winter Break",
+    ))
+    index.add(Event(start=datetime.date(2025, 1, 6), summary="Phase marker", all_day=True, kind="phase"))
+
+    path = tmp_path / "schedule.idx"
+    index.save(str(path))
+    loaded = ScheduleIndex.load(str(path))
+
+    assert len(loaded) == 2
+    assert loaded.count(face="Swan Face") == 1
+    assert loaded.count(weekday=0) == 2
+    restored = loaded.query(city="Brussels")[0]
+    assert restored.start == datetime.datetime(2025, 1, 6, 11, 35)
+    assert restored.uid == index.event(0).uid
+    assert loaded.query(kind="phase")[0].start == datetime.date(2025, 1, 6)
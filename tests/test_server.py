@@ -0,0 +1,130 @@
+# tests/test_server.py
+
+import asyncio
+import datetime
+import gzip
+import re
+from calmoji.server import CalendarServer, cache_key, phases_between
+
+
+def test_meetings_range_city_and_tzid():
+    server = CalendarServer()
+    status, headers, body = server.respond(
+        "GET", "/meetings?city=Tokyo&from=2025-01-13&to=2025-01-17&tzid=Asia/Tokyo", {}
+    )
+    text = body.decode("utf-8")
+    assert status == 200 and headers["Content-Type"].startswith("text/calendar")
+    assert text.count("BEGIN:VEVENT") == 5  # The week's Tokyo series slot × five weekdays
+    assert "DTSTART;TZID=Asia/Tokyo:20250113T133500" in text
+    assert "BEGIN:VTIMEZONE" in text
+
+
+def test_etag_304_gzip_and_lru():
+    server = CalendarServer(cache_size=1)
+    _, headers, body = server.respond("GET", "/ebi48/2025", {})
+    assert server.respond("GET", "/ebi48/2025", {"if-none-match": headers["ETag"]})[0] == 304
+
+    _, gz_headers, gz_body = server.respond("GET", "/ebi48/2025", {"accept-encoding": "gzip, br"})
+    assert gz_headers["Content-Encoding"] == "gzip" and gzip.decompress(gz_body) == body
+    assert server.cache.hits == 2 and server.cache.misses == 1
+
+    server.respond("GET", "/focus/2025-W03", {})
+    assert list(server.cache.entries) == ["/focus/2025-W03?"]
+
+
+def test_default_range_is_keyed_by_resolved_dates():
+    today = datetime.date.today()
+    key = cache_key("/meetings/", {"city": ["Tokyo"]})
+    assert key == f"/meetings?city=Tokyo&from={today}&to={today + datetime.timedelta(days=27)}"
+    explicit = {"from": [str(today)], "to": [str(today + datetime.timedelta(days=27))], "city": ["Tokyo"]}
+    assert cache_key("/meetings", explicit) == key
+
+
+def test_errors():
+    server = CalendarServer()
+    assert server.respond("GET", "/meetings?city=Atlantis", {})[0] == 400
+    assert server.respond("GET", "/focus/2025-W99", {})[0] == 400
+    assert server.respond("GET", "/nope", {})[0] == 404
+    assert server.respond("POST", "/ebi48/2025", {})[0] == 405
+    assert server.respond("GET", "/meetings?tzid=Asia/Tokyo&tzid=UTC", {})[0] == 400
+    assert server.respond("GET", "/focus/2025-W03?tzid=UTC&tzid=UTC", {})[0] == 400
+    for target in ("/meetings?from=9999-12-20", "/focus/9999-W52", "/meetings?from=0001-01-02&to=0001-01-05"):
+        assert server.respond("GET", target, {})[0] == 400, target
+
+
+def test_unexpected_errors_are_500(monkeypatch):
+    server = CalendarServer()
+    monkeypatch.setattr("calmoji.server.render_ebi48_year", lambda *args: 1 / 0)
+    status, _, body = server.respond("GET", "/ebi48/2025", {})
+    assert (status, body) == (500, b"Internal server error\n")
+
+
+def test_phases_between_does_not_repeat_boundary_day():
+    phases = phases_between(datetime.date(2025, 9, 10), datetime.date(2025, 9, 20))
+    days = [p.start + datetime.timedelta(days=i) for p in phases for i in range(p.duration_days)]
+    assert len(days) == len(set(days)) == 11
+
+
+def test_http_keep_alive_roundtrip():
+    async def roundtrip():
+        server = await asyncio.start_server(CalendarServer().handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        responses = []
+        for path in ("/healthz", "/focus/2025-W03"):
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+            head = (await reader.readuntil(b"\r\n\r\n")).decode()
+            length = int(head.split("Content-Length: ")[1].split("\r\n")[0])
+            responses.append((head.split(" ")[1], await reader.readexactly(length)))
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return responses
+
+    (status_a, body_a), (status_b, body_b) = asyncio.run(roundtrip())
+    assert (status_a, body_a) == ("200", b"ok\n")
+    assert status_b == "200" and body_b.count(b"BEGIN:VEVENT") == 6 * 12
+
+
+def test_request_bodies_are_not_read_as_requests():
+    async def roundtrip():
+        server = await asyncio.start_server(CalendarServer().handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        body = b"GET /nope HTTP/1.1\r\n\r\n"
+        writer.write(b"POST /healthz HTTP/1.1\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body))
+        writer.write(b"GET /healthz HTTP/1.1\r\nConnection: close\r\n\r\n")
+        responses = await reader.read()
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return responses
+
+    assert re.findall(rb"HTTP/1.1 (\d{3})", asyncio.run(roundtrip())) == [b"405", b"200"]
+
+
+def test_slow_render_does_not_block_other_connections(monkeypatch):
+    import time
+    from calmoji import server as server_module
+
+    render_ebi48_year = server_module.render_ebi48_year
+    monkeypatch.setattr(server_module, "render_ebi48_year", lambda *args: time.sleep(0.5) or render_ebi48_year(*args))
+
+    async def fetch(port, path):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"GET {path} HTTP/1.1\r\nConnection: close\r\n\r\n".encode())
+        await reader.read()
+        writer.close()
+        return path
+
+    async def race():
+        server = await asyncio.start_server(CalendarServer().handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        slow = asyncio.create_task(fetch(port, "/ebi48/2025"))
+        await asyncio.sleep(0.05)
+        finished = [await task for task in asyncio.as_completed([slow, fetch(port, "/healthz")])]
+        server.close()
+        await server.wait_closed()
+        return finished
+
+    assert asyncio.run(race()) == ["/healthz", "/ebi48/2025"]
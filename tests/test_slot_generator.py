@@ -33,3 +33,34 @@ def test_all_events_within_phase_range():
     for evt in events:
         assert phase.start <= evt.start <= phase.end
         assert evt.start.date() == evt.end.date()
+
+
+def expected_meeting_count(phase: Phase) -> int:
+    """Brute-force count from the raw config: slot j is in series j % NUM_SERIES, meeting in weeks ≡ j (mod 3)."""
+    from datetime import timedelta
+    from calmoji.config import DENSITY_SERIES, NUM_SERIES, SERIES_INTERVAL_WEEKS
+    from calmoji.meeting_slots import CITY_WEEKDAYS, MEETING_SLOTS
+
+    slots = sorted((s for s in MEETING_SLOTS if s[0] != "Auckland"), key=lambda s: (s[1], s[2]))
+    active = DENSITY_SERIES[phase.meeting_density] if phase.allow_meetings else 0
+    count = 0
+    for offset in range((phase.end - phase.start).days + 1):
+        day = phase.start + timedelta(days=offset)
+        week = (day.toordinal() - 1) // 7
+        for j, (city, *_) in enumerate(slots):
+            series = j % NUM_SERIES
+            if series < active and week % SERIES_INTERVAL_WEEKS == series \
+                    and day.weekday() in CITY_WEEKDAYS.get(city, {0, 1, 2, 3, 4}):
+                count += 1
+    return count
+
+
+def test_meeting_counts_follow_density_and_series_cadence():
+    phases = get_semester_phases(get_start_date_from_year(2024))
+    counts = {phase.name: len(generate_meeting_slots(phase)) for phase in phases}
+
+    assert counts == {phase.name: expected_meeting_count(phase) for phase in phases}
+    assert counts["Winter Break"] == counts["Summer Rest"] == counts["Liminal Drift"] == 0
+
+    every_slot_every_weekday = 3134  # The year's meeting count before series scheduling
+    assert 3 <= every_slot_every_weekday / sum(counts.values()) <= 10
@@ -0,0 +1,81 @@
+# tests/test_spec.py
+
+import dataclasses
+import json
+import pytest
+from pathlib import Path
+from calmoji.calendar_phases import get_phases_for_years
+from calmoji.focus_blocks_writer import generate_focus_block_events
+from calmoji.slot_generator import generate_meeting_slots
+from calmoji.spec import builtin_config, compile_spec, default_spec, load_spec, spec_digest
+
+EXAMPLE = Path(__file__).resolve().parent.parent / "docs" / "schedule.example.toml"
+
+
+def test_example_config_matches_builtin_schedule():
+    spec = load_spec(EXAMPLE, cache_dir=None)
+    assert dataclasses.replace(spec, digest="builtin") == default_spec()
+    assert load_spec(EXAMPLE, cache_dir=None) is spec  # Memoized by content
+
+
+def test_compiled_spec_is_cached_by_content(tmp_path):
+    config = tmp_path / "variant.json"
+    config.write_text(json.dumps({**builtin_config(), "year_start": "11-11"}))  # Content no other test loads
+    spec = load_spec(config, cache_dir=tmp_path / "cache")
+    cached = list((tmp_path / "cache").glob("*.spec"))
+    assert len(cached) == 1 and cached[0].stem == spec.digest
+
+    config.write_text(json.dumps({**builtin_config(), "year_start": "11-12"}))
+    assert load_spec(config, cache_dir=tmp_path / "cache").start_day == 12
+    assert len(list((tmp_path / "cache").glob("*.spec"))) == 2
+
+
+def test_digest_changes_with_the_builtin_defaults(monkeypatch):
+    raw = b'{"phases": [{"name": "Seed", "start": 0, "end": 10}]}'
+    digest = spec_digest(raw)
+    monkeypatch.setattr("calmoji.spec.NUM_SERIES", 1)
+    assert spec_digest(raw) != digest
+    monkeypatch.undo()
+    monkeypatch.setattr("calmoji.spec.DEFAULT_MEETING_WEEKDAYS", (0, 2, 4))
+    assert spec_digest(raw) != digest
+    monkeypatch.undo()
+    assert spec_digest(raw) == digest
+
+
+@pytest.mark.parametrize("change, message", [
+    ({"phases": []}, "at least one phase"),
+    ({"year_start": "02-30"}, "year_start"),
+    ({"meeting_slots": [{"city": "Tokyo", "start": "04:30", "end": "05:00"}]}, "EBI48 grid"),
+    ({"focus_blocks": [{"start": "25:00", "end": "26:00", "emoji": "🧠"}]}, "out of range"),
+    ({"focus_weekdays": ["Funday"]}, "not a weekday"),
+    ({"series": {"interval_weeks": 2, "count": 3}}, "count <= interval_weeks"),
+    ([builtin_config()], "config: expected a table"),
+    ({"phases": [{"name": "Seed", "start": None, "end": 10}]}, r"phases\[0\]\.start"),
+    ({"phases": ["Seed"]}, r"phases\[0\]: expected a table"),
+    ({"city_weekdays": ["Tokyo"]}, "city_weekdays: expected a table"),
+    ({"phases": [{"name": "Seed", "start": 0, "end": 10, "allow_meetings": "false"}]}, "allow_meetings: expected true"),
+])
+def test_invalid_configs_are_rejected(change, message):
+    config = {**builtin_config(), **change} if isinstance(change, dict) else change
+    with pytest.raises(ValueError, match=message):
+        compile_spec(config)
+
+
+def test_generators_follow_a_variant_spec():
+    spec = compile_spec({
+        **builtin_config(),
+        "year_start": "10-01",
+        "meeting_slots": [{"city": "Delhi", "start": "07:35", "end": "08:00", "label": "12:35–13:00 IST"}],
+        "city_weekdays": {"Delhi": ["Mon"]},
+        "focus_blocks": [{"start": "09:00", "end": "10:00", "emoji": "🧠"}],
+        "focus_weekdays": ["Sat"],
+    })
+    phase = get_phases_for_years(2025, spec=spec)[0]
+    assert phase.start.month == 10 and phase.start.day == 1
+
+    meetings = generate_meeting_slots(phase, spec=spec)
+    assert meetings and all(e.start.weekday() == 0 and e.city == "Delhi" for e in meetings)
+    assert meetings[0].summary.startswith("Delhi 🦌 Deer Face Slot")
+
+    focus = generate_focus_block_events([phase], spec=spec)
+    assert focus and all(e.start.weekday() == 5 and e.emoji == "⛩️" for e in focus)
@@ -0,0 +1,41 @@
+# tests/test_sqlite_export.py
+
+import sqlite3
+from calmoji.calendar_phases import get_phases_for_years
+from calmoji.exclusions import build_exclusions
+from calmoji.focus_blocks_writer import generate_focus_block_events
+from calmoji.slot_generator import generate_meeting_slots
+from calmoji.sqlite_export import export_sqlite, iter_focus_rows, iter_meeting_rows
+
+
+def test_rows_match_generators():
+    phases = get_phases_for_years(2024)[:2]
+    exclusions = build_exclusions(dates=["2024-10-01"], city_holidays={"Delhi": ["2024-10-02"]})
+    events = [e for p in phases for e in generate_meeting_slots(p, exclusions=exclusions)]
+    rows = list(iter_meeting_rows(phases, exclusions))
+    assert [(r[1], r[3]) for r in rows] == [(f"{e.start:%Y-%m-%d %H:%M:%S}", e.city) for e in events]
+
+    focus = generate_focus_block_events(phases, exclusions=exclusions)
+    assert [(r[1], r[6]) for r in iter_focus_rows(phases, exclusions)] == [
+        (f"{e.start:%Y-%m-%d %H:%M:%S}", e.emoji) for e in focus
+    ]
+
+
+def test_export_and_query(tmp_path):
+    phases = get_phases_for_years(2024)
+    path = tmp_path / "calmoji.sqlite"
+    counts = export_sqlite(path, phases, batch_size=1000)
+
+    assert counts["phases"] == len(phases) and counts["ebi48_slots"] == 48
+    assert counts["meetings"] == sum(len(generate_meeting_slots(p)) for p in phases)
+    assert counts["focus_blocks"] == len(generate_focus_block_events(phases))
+
+    conn = sqlite3.connect(path)
+    delhi_flame = conn.execute(
+        "SELECT COUNT(*) FROM events WHERE kind = 'meeting' AND city = 'Delhi' AND phase = 'Semester B (Flame)'"
+    ).fetchone()[0]
+    assert delhi_flame == sum(1 for e in generate_meeting_slots(phases[4]) if e.city == "Delhi")
+    assert conn.execute("SELECT glyph, face FROM ebi48_slots WHERE utc_start = '04:35'").fetchone() == ("🦦", "Otter Face")
+    indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"events_start", "events_city", "events_phase", "events_glyph"} <= indexes
+    conn.close()
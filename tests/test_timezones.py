@@ -0,0 +1,64 @@
+# tests/test_timezones.py
+
+import datetime
+import pytest
+from zoneinfo import ZoneInfo
+from calmoji.timezones import (
+    EPOCH,
+    get_transition_table,
+    offset_runs,
+    to_local,
+    tz_abbreviation,
+    utc_timestamp,
+    vtimezone_block,
+)
+
+
+def test_brussels_transitions_2025():
+    table = get_transition_table("Europe/Brussels", 2025)
+    assert table.names == ("CET", "CEST", "CET")
+    assert table.offsets == (3600, 7200, 3600)
+    # EU DST: last Sunday of March / October at 01:00 UTC
+    assert table.starts[1] == utc_timestamp(datetime.datetime(2025, 3, 30, 1, 0))
+    assert table.starts[2] == utc_timestamp(datetime.datetime(2025, 10, 26, 1, 0))
+
+
+def test_offsets_agree_with_zoneinfo():
+    zone = ZoneInfo("America/Havana")
+    table = get_transition_table("America/Havana", 2025)
+    for hours in range(0, 365 * 24, 7):
+        ts = utc_timestamp(datetime.date(2025, 1, 1)) + hours * 3600
+        expected = datetime.datetime.fromtimestamp(ts, zone).utcoffset().total_seconds()
+        assert table.offset_at(ts) == expected
+
+
+def test_offset_runs_cross_year_boundary():
+    start = utc_timestamp(datetime.date(2024, 9, 15))
+    end = utc_timestamp(datetime.date(2025, 9, 15))
+    runs = offset_runs("Pacific/Auckland", start, end)
+
+    assert [name for *_, name in runs] == ["NZST", "NZDT", "NZST"]
+    assert runs[0][0] == start and runs[-1][1] == end
+    assert all(a[1] == b[0] for a, b in zip(runs, runs[1:]))
+    assert EPOCH + datetime.timedelta(seconds=runs[1][0]) == datetime.datetime(2024, 9, 28, 14, 0)
+
+
+def test_unknown_zone_raises_value_error():
+    with pytest.raises(ValueError):
+        get_transition_table("Mars/Olympus_Mons", 2025)
+
+
+def test_to_local_and_abbreviation():
+    summer = datetime.datetime(2025, 7, 1, 11, 35)
+    winter = datetime.datetime(2025, 1, 6, 11, 35)
+    assert to_local(summer, "Europe/Brussels") == datetime.datetime(2025, 7, 1, 13, 35)
+    assert to_local(winter, "Europe/Brussels") == datetime.datetime(2025, 1, 6, 12, 35)
+    assert tz_abbreviation(summer, "America/Los_Angeles") == "PDT"
+
+
+def test_vtimezone_block_lists_each_onset_once():
+    block = vtimezone_block("Europe/Brussels", [2025, 2026, 2025])
+    assert block.startswith("BEGIN:VTIMEZONE\r\nTZID:Europe/Brussels\r\n")
+    assert block.count("BEGIN:DAYLIGHT") == 2
+    assert block.count("BEGIN:STANDARD") == 3  # Oct 2024 onset + Oct 2025 + Oct 2026
+    assert "DTSTART:20250330T020000\r\nTZOFFSETFROM:+0100\r\nTZOFFSETTO:+0200\r\nTZNAME:CEST" in block
@@ -60,3 +60,11 @@ def test_group_phase_days_by_week_basic():
     assert isinstance(week_spans[0], PhaseWeekSpan)
     assert week_spans[0].days[0].date() == datetime.date(2025, 1, 1)
     assert week_spans[0].days[-1].date() == datetime.date(2025, 1, 3)
+
+
+def test_format_time_for_tz_handles_dst_and_city_names():
+    from calmoji.utils import format_time_for_tz
+
+    assert format_time_for_tz(datetime.datetime(2025, 7, 1, 11, 35), "Europe/Brussels") == "13:35 CEST"
+    assert format_time_for_tz(datetime.datetime(2025, 1, 6, 11, 35), "Brussels") == "12:35 CET"
+    assert format_time_for_tz(datetime.datetime(2025, 1, 6, 4, 35), "Tokyo") == "13:35 JST"
@@ -0,0 +1,69 @@
+# tests/test_validator.py
+
+import datetime
+from calmoji.calendar_phases import get_phases_for_years
+from calmoji.cli import main
+from calmoji.combined import write_combined_ics
+from calmoji.freebusy import write_freebusy
+from calmoji.ics_writer import create_ics_header, write_ebi48_range
+from calmoji.slot_generator import generate_meeting_slots
+from calmoji.types import Event, fold_ics_line
+from calmoji.validator import validate_file, validate_paths
+
+
+def test_generated_output_is_valid(tmp_path):
+    phases = get_phases_for_years(2025)
+    write_combined_ics(str(tmp_path / "combined.ics"), phases, tzid="Europe/Brussels")
+    write_ebi48_range(str(tmp_path / "ebi48.ics"), datetime.date(2025, 1, 1), datetime.date(2025, 6, 30), recurring=False)
+    write_freebusy(generate_meeting_slots(phases[1]), phases, str(tmp_path / "freebusy.ics"), mode="week")
+
+    reports = validate_paths([tmp_path], workers=2)
+    assert [r.issues for r in reports] == [[], [], []]
+    assert reports[0].events > 1000 and reports[1].events == 26 * 48
+
+
+def test_flags_each_kind_of_problem(tmp_path):
+    start = datetime.datetime(2025, 1, 6, 9, 5)
+    good = Event(start=start, end=start + datetime.timedelta(minutes=25), summary="Slot", uid="a@x").to_ics()
+    backwards = good.replace("DTEND:20250106T093000", "DTEND:20250106T090000")
+    no_uid = good.replace("UID:a@x\r\n", "")
+    doubled = good.replace("END:VEVENT", "RRULE:RRULE:FREQ=WEEKLY\r\nEND:VEVENT")
+    char_per_line = "\r\n".join("BEGIN:VEVENT") + "\r\n"
+    long_lf = "DESCRIPTION:" + "🦦" * 20 + "\n"
+    text = create_ics_header() + good + backwards + no_uid + doubled + long_lf + char_per_line + "BEGIN:VEVENT\r\n"
+    path = tmp_path / "broken.ics"
+    path.write_bytes(text.encode("utf-8"))
+
+    report = validate_file(path)
+    assert set(report.counts) == {"dtstart-dtend", "uid", "required", "rrule", "crlf", "line-length", "syntax", "nesting"}
+    assert report.counts["uid"] == 2  # `backwards` and `doubled` reuse a@x
+    long_line = text[:text.index(long_lf)].count("\n") + 1
+    assert {(i.line, i.code) for i in report.issues} >= {(long_line, "crlf"), (long_line, "line-length")}
+    assert report.counts["syntax"] == len("BEGIN:VEVENT")
+    assert main(["validate", str(path), "--workers", "1"]) == 1
+
+
+def test_folding_counts_octets_and_keeps_characters_whole():
+    line = "SUMMARY:" + "🐶 Dog Face — EBI48 " * 8
+    folded = fold_ics_line(line).split("\r\n")
+    assert all(len(part.encode("utf-8")) <= 75 for part in folded)
+    assert folded[0] + "".join(part[1:] for part in folded[1:]) == line
+
+
+def test_checks_tzids_and_compares_only_like_times(tmp_path):
+    event = ("BEGIN:VEVENT\r\nUID:{uid}\r\nDTSTAMP:20250101T000000Z\r\n"
+             "DTSTART;TZID=Europe/Brussels:20250106T100000\r\nDTEND{end}\r\nEND:VEVENT\r\n")
+    text = (create_ics_header()
+            + event.format(uid="utc@x", end=":20250106T093000Z")  # 10:00 Brussels is 09:00Z, so this is fine
+            + event.format(uid="zoned@x", end=";TZID=Europe/Brussels:20250106T090000")
+            + "END:VCALENDAR\r\n")
+    path = tmp_path / "zoned.ics"
+    path.write_bytes(text.encode("utf-8"))
+
+    report = validate_file(path)
+    assert report.counts == {"tzid": 1, "dtstart-dtend": 1}
+    assert [i.line for i in report.issues if i.code == "tzid"] == [text[:text.index(";TZID=")].count("\n") + 1]
+
+    zone = "BEGIN:VTIMEZONE\r\nTZID:Europe/Brussels\r\nEND:VTIMEZONE\r\n"
+    path.write_bytes(text.replace("BEGIN:VEVENT", zone + "BEGIN:VEVENT", 1).encode("utf-8"))
+    assert validate_file(path).counts == {"dtstart-dtend": 1}